@@ -0,0 +1,99 @@
+"""Throughput benchmark for the CSV/JSONL file source.
+
+Usage: python benchmarks/bench_file_source.py [N] [--target ROWS_PER_SEC]
+
+Writes N rows as CSV and JSON lines (plain and gzipped) to a temp
+directory, streams each through ``FileSource.iter_batches`` with and
+without mmap, and exits non-zero if any read falls below the target rate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from leadflow.sources.file_source import FileSource
+
+# Rows/second every format must sustain: a 5M-row export in under 100 seconds
+DEFAULT_TARGET = 50_000
+BATCH_SIZE = 10_000
+
+
+def make_rows(n: int) -> list[dict]:
+    return [
+        {
+            "Full Name": f"Lead {i}",
+            "Email": f"lead{i}@example.com",
+            "Phone": f"555{i:07d}",
+            "Company": f"Company {i % 500}",
+            "Notes": "Met at booth 12, wants a website redesign",
+            "Booth": str(i % 40),
+        }
+        for i in range(n)
+    ]
+
+
+def write_files(rows: list[dict], directory: Path) -> list[Path]:
+    paths = []
+    for suffix, opener in ((".csv", open), (".csv.gz", gzip.open)):
+        path = directory / f"leads{suffix}"
+        with opener(path, "wt", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        paths.append(path)
+    for suffix, opener in ((".jsonl", open), (".jsonl.gz", gzip.open)):
+        path = directory / f"leads{suffix}"
+        with opener(path, "wt") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        paths.append(path)
+    return paths
+
+
+def bench(path: Path, use_mmap: bool, n: int, target: float) -> bool:
+    config = {
+        "sources": {
+            "file": {
+                "path": str(path),
+                "mmap": use_mmap,
+                "columns": {"name": "Full Name", "email": "Email", "phone": "Phone", "company": "Company", "notes": "Notes"},
+            }
+        }
+    }
+    start = time.perf_counter()
+    count = sum(len(batch) for batch in FileSource(config).iter_batches(BATCH_SIZE))
+    elapsed = time.perf_counter() - start
+    assert count == n, (path, count)
+
+    rate = n / elapsed
+    ok = rate >= target
+    verdict = "ok" if ok else "BELOW TARGET"
+    label = f"{path.name}{' (mmap)' if use_mmap else ''}"
+    print(f"  {label:<22s} {rate:>10,.0f} rows/s   {path.stat().st_size / n:>5.0f} B/row   {verdict}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("n", nargs="?", type=int, default=500_000)
+    parser.add_argument("--target", type=float, default=DEFAULT_TARGET, help="minimum rows/s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_files(make_rows(args.n), Path(tmp))
+        print(f"Reading {args.n:,} rows (target {args.target:,.0f} rows/s)\n")
+        results = [bench(path, use_mmap, args.n, args.target) for path in paths for use_mmap in (False, True)]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Throughput benchmark for lead serialization codecs.
+
+Usage: python benchmarks/bench_serialization.py [N]
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from leadflow.models import Lead
+from leadflow.serialization import _codecs, get_codec
+
+
+def make_leads(n: int) -> list[Lead]:
+    return [
+        Lead(
+            name=f"Lead {i}",
+            email=f"lead{i}@example.com",
+            phone=f"555{i:07d}",
+            company=f"Company {i % 500}",
+            source="bench",
+            notes="Needs new website, SEO audit and landing pages",
+            summary="Company: Needs SEO services. Looking for web design.",
+            tags=["seo", "web-design"],
+            status="enriched",
+            ingested_at="2026-01-01T00:00:00+00:00",
+            raw_data={"name": f"Lead {i}", "col_a": "a" * 20, "col_b": i},
+        )
+        for i in range(n)
+    ]
+
+
+def bench(label: str, leads: list[Lead], encode, decode) -> None:
+    start = time.perf_counter()
+    payload = encode(leads)
+    enc = time.perf_counter() - start
+    start = time.perf_counter()
+    count = decode(payload)
+    dec = time.perf_counter() - start
+    assert count == len(leads)
+    print(
+        f"  {label:<22s} encode {len(leads) / enc:>10,.0f} leads/s   "
+        f"decode {len(leads) / dec:>10,.0f} leads/s   {len(payload) / len(leads):>6.0f} B/lead"
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    leads = make_leads(n)
+    print(f"Serializing {n:,} leads\n")
+
+    bench(
+        "json (indent=2)",
+        leads,
+        lambda ls: json.dumps([l.to_dict() for l in ls], indent=2, default=str).encode(),
+        lambda b: len([Lead.from_dict(d) for d in json.loads(b)]),
+    )
+
+    for key in sorted(_codecs):
+        try:
+            codec = get_codec(key)
+        except ImportError as e:
+            print(f"  {key:<22s} skipped ({e})")
+            continue
+
+        def encode(ls, codec=codec):
+            buf = io.BytesIO()
+            codec.dump(ls, buf)
+            return buf.getvalue()
+
+        def decode(b, codec=codec):
+            return sum(1 for _ in codec.load(io.BytesIO(b)))
+
+        bench(key, leads, encode, decode)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from leadflow.serialization import dump_leads
 from leadflow.sources.mock_source import MockSource
 
 
@@ -41,12 +41,11 @@ def main():
     print("  7. Add these columns: name, email, phone, company, notes")
     print("  8. Run: python main.py")
 
-    # Also dump leads as JSON for manual import
+    # Also dump leads as JSON lines for manual import
     output_dir = Path(__file__).parent.parent / "output"
     output_dir.mkdir(exist_ok=True)
-    seed_path = output_dir / "seed_leads.json"
-    with open(seed_path, "w") as f:
-        json.dump([lead.to_dict() for lead in leads], f, indent=2, default=str)
+    seed_path = output_dir / "seed_leads.jsonl"
+    dump_leads(leads, seed_path)
     print(f"\nSeed data exported to: {seed_path}")
 
 
@@ -0,0 +1,140 @@
+"""Run checkpoints — persisted stage outputs so an interrupted run can resume.
+
+Layout of ``<checkpoint dir>/<run_id>/``::
+
+    manifest.json          stage completion info and per-chunk status
+    normalized.jsonl       fetched + normalized leads
+    unique.jsonl           dedup survivors
+    enriched-00000.jsonl   enriched chunks, one file per chunk
+    written.keys           dedup keys (hex) of the leads of written chunks
+
+Every file is written to a temp name and renamed into place, so a crash
+never leaves a half-written stage behind. ``written.keys`` is appended to
+and synced before a chunk is marked written. The directory is removed once
+the run completes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import secrets
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+from leadflow.models import Lead
+from leadflow.serialization import dump_leads, get_codec, load_leads
+
+logger = logging.getLogger(__name__)
+
+
+def new_run_id() -> str:
+    """Sortable, collision-resistant run ID, e.g. ``20260118-093000-3f2a``."""
+    return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-") + secrets.token_hex(2)
+
+
+class RunCheckpoint:
+    """Stage outputs and chunk progress of a single pipeline run."""
+
+    def __init__(self, root: str | Path, run_id: str | None = None, codec: str = "jsonl") -> None:
+        self.run_id = run_id or new_run_id()
+        self.path = Path(root) / self.run_id
+        self._codec = codec
+        self._ext = get_codec(codec).extension
+        self.path.mkdir(parents=True, exist_ok=True)
+        manifest = self.path / "manifest.json"
+        if manifest.exists():
+            self._manifest = json.loads(manifest.read_text())
+        else:
+            self._manifest = {"run_id": self.run_id, "stages": {}, "chunks": {}}
+            self._save_manifest()
+
+    @classmethod
+    def resume(cls, root: str | Path, run_id: str, codec: str = "jsonl") -> RunCheckpoint:
+        """Open an existing run. Raises ``FileNotFoundError`` if it was never started."""
+        if not (Path(root) / run_id / "manifest.json").exists():
+            raise FileNotFoundError(f"No checkpoint for run {run_id!r} under {root}")
+        return cls(root, run_id, codec)
+
+    # -- stages -------------------------------------------------------------
+
+    def stage_info(self, stage: str) -> dict | None:
+        """Info recorded when *stage* completed, or None if it has not."""
+        return self._manifest["stages"].get(stage)
+
+    def complete_stage(self, stage: str, leads: Iterable[Lead] | None = None, **info) -> None:
+        """Persist *leads* (if given) as the output of *stage* and mark it complete."""
+        if leads is not None:
+            self._write_leads(stage, leads)
+        self._manifest["stages"][stage] = info
+        self._save_manifest()
+
+    def load_stage(self, stage: str) -> list[Lead]:
+        return list(load_leads(self._leads_path(stage), self._codec))
+
+    # -- chunks -------------------------------------------------------------
+
+    def chunk_status(self, index: int) -> dict:
+        """``{}`` for a new chunk, else ``{"enriched": n}`` and ``{"written": n}``
+        once written, or ``{"writing": True}`` if the run stopped mid-write."""
+        return self._manifest["chunks"].get(str(index), {})
+
+    def save_enriched_chunk(self, index: int, leads: list[Lead], enriched: int) -> None:
+        self._write_leads(self._chunk_name(index), leads)
+        self._manifest["chunks"][str(index)] = {"enriched": enriched}
+        self._save_manifest()
+
+    def load_enriched_chunk(self, index: int) -> list[Lead]:
+        return self.load_stage(self._chunk_name(index))
+
+    def begin_chunk_write(self, index: int) -> None:
+        self._manifest["chunks"][str(index)]["writing"] = True
+        self._save_manifest()
+
+    def mark_chunk_written(self, index: int, written: int, leads: Iterable[Lead] = ()) -> None:
+        """Record the chunk as written, after syncing the dedup keys of *leads*."""
+        keys = [key.hex() for lead in leads if (key := lead.dedup_key()) is not None]
+        if keys:
+            with open(self.path / "written.keys", "a") as f:
+                f.write("".join(f"{key}\n" for key in keys))
+                f.flush()
+                os.fsync(f.fileno())
+        chunk = self._manifest["chunks"][str(index)]
+        chunk.pop("writing", None)
+        chunk["written"] = written
+        self._save_manifest()
+
+    def written_keys(self) -> set[bytes]:
+        """Dedup keys of every lead in a chunk written so far."""
+        path = self.path / "written.keys"
+        if not path.exists():
+            return set()
+        return {bytes.fromhex(line) for line in path.read_text().split()}
+
+    def remove(self) -> None:
+        """Delete the run's directory (once the run completed)."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    # -- internals ----------------------------------------------------------
+
+    @staticmethod
+    def _chunk_name(index: int) -> str:
+        return f"enriched-{index:05d}"
+
+    def _leads_path(self, name: str) -> Path:
+        return self.path / f"{name}.{self._ext}"
+
+    def _write_leads(self, name: str, leads: Iterable[Lead]) -> None:
+        final = self._leads_path(name)
+        tmp = final.with_name(final.name + ".tmp")
+        dump_leads(leads, tmp, self._codec)
+        os.replace(tmp, final)
+
+    def _save_manifest(self) -> None:
+        final = self.path / "manifest.json"
+        tmp = final.with_name("manifest.json.tmp")
+        tmp.write_text(json.dumps(self._manifest, indent=2))
+        os.replace(tmp, final)
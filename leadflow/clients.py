@@ -0,0 +1,176 @@
+"""Shared API clients — one pooled, keep-alive client per service and credential.
+
+Backends ask this registry for their clients instead of building their own,
+so a source and a destination on the same service (and every daemon cycle)
+reuse one authenticated session, its open connections and its rate limit.
+Pool sizes, timeouts and rate limits come from the ``clients`` config
+section: ``clients.default`` applies to every service and
+``clients.<service>`` overrides it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from typing import Callable, TypeVar
+
+from leadflow.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+# Published API rate limits (0 = not rate limited client-side)
+_SERVICE_DEFAULTS = {
+    "notion": {"requests_per_second": 3.0, "burst": 3},
+}
+
+_clients: dict[tuple[str, str], object] = {}
+# Guards both dicts; builds run under their key's lock only, so a slow
+# build (or a spreadsheet handle building its gspread client) never blocks
+# other keys
+_lock = threading.Lock()
+_build_locks: dict[tuple[str, str], threading.Lock] = {}
+
+
+def settings(config: dict, service: str) -> dict:
+    """``pool_size``, ``timeout_seconds``, ``requests_per_second`` and ``burst`` for *service*."""
+    clients_cfg = config.get("clients", {})
+    return {
+        "pool_size": DEFAULT_POOL_SIZE,
+        "timeout_seconds": DEFAULT_TIMEOUT_SECONDS,
+        "requests_per_second": 0,
+        "burst": 1,
+        **_SERVICE_DEFAULTS.get(service, {}),
+        **clients_cfg.get("default", {}),
+        **clients_cfg.get(service, {}),
+    }
+
+
+def get_client(service: str, credential: str, build: Callable[[], T]) -> T:
+    """Return the shared client for (*service*, *credential*), building it on first use.
+
+    The credential is only kept as a digest. Concurrent first uses of one
+    key build it once; other keys are served while it builds.
+    """
+    key = (service, hashlib.blake2b(credential.encode(), digest_size=8).hexdigest())
+    with _lock:
+        client = _clients.get(key)
+        if client is not None:
+            return client
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+    with build_lock:
+        with _lock:
+            client = _clients.get(key)
+        if client is None:
+            client = build()
+            with _lock:
+                _clients[key] = client
+            logger.debug("Created shared %s client", service)
+        return client
+
+
+def http_client(config: dict, service: str):
+    """A new keep-alive ``httpx.Client`` sized by the service's settings."""
+    import httpx
+
+    cfg = settings(config, service)
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=cfg["pool_size"], max_keepalive_connections=cfg["pool_size"]
+        ),
+        timeout=cfg["timeout_seconds"],
+    )
+
+
+def notion(config: dict, token: str, client_cls: Callable | None = None):
+    """Shared ``notion_client.Client`` for *token*, on a pooled httpx client.
+
+    *client_cls* defaults to ``notion_client.Client``; backends pass the
+    name they imported so it can be patched per module.
+    """
+    if client_cls is None:
+        from notion_client import Client as client_cls
+
+    cfg = settings(config, "notion")
+    return get_client(
+        "notion",
+        token,
+        lambda: client_cls(
+            auth=token,
+            client=http_client(config, "notion"),
+            timeout_ms=int(cfg["timeout_seconds"] * 1000),
+        ),
+    )
+
+
+def gspread_client(config: dict, credentials_file: str = ""):
+    """Shared gspread client for a service-account key file (gspread's default if empty)."""
+    import gspread
+
+    def build():
+        gc = gspread.service_account(credentials_file) if credentials_file else gspread.service_account()
+        cfg = settings(config, "google_sheets")
+        gc.set_timeout(cfg["timeout_seconds"])
+        _mount_pool(gc.http_client.session, cfg["pool_size"])
+        return gc
+
+    return get_client("google_sheets", credentials_file, build)
+
+
+def spreadsheet(config: dict, name: str, credentials_file: str = ""):
+    """Shared opened spreadsheet, so readers and writers of one sheet open it once."""
+    return get_client(
+        "google_sheets.spreadsheet",
+        f"{credentials_file}\x1f{name}",
+        lambda: gspread_client(config, credentials_file).open(name),
+    )
+
+
+def requests_session(config: dict, service: str):
+    """Shared ``requests.Session`` for plain HTTP calls (e.g. webhooks) to *service*."""
+    import requests
+
+    def build():
+        session = requests.Session()
+        _mount_pool(session, settings(config, service)["pool_size"])
+        return session
+
+    return get_client(service, "", build)
+
+
+def rate_limiter(config: dict, service: str, credential: str) -> TokenBucket:
+    """Shared token bucket for *credential*, so all its callers draw on one budget."""
+    cfg = settings(config, service)
+    return get_client(
+        f"{service}.rate_limit",
+        credential,
+        lambda: TokenBucket(cfg["requests_per_second"], cfg["burst"]),
+    )
+
+
+def reset() -> None:
+    """Close and forget every shared client (tests, or after a config change)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _build_locks.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug("Closing client failed: %s", e)
+
+
+def _mount_pool(session, pool_size: int) -> None:
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
@@ -0,0 +1,103 @@
+"""Long-running daemon mode — one warm pipeline, run on a schedule or trigger file."""
+
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline, PipelineStats
+from leadflow.raw_store import RawStore
+
+logger = logging.getLogger(__name__)
+
+
+class Daemon:
+    """Runs the same Pipeline repeatedly until stopped.
+
+    Because the pipeline (and its sources, writers, Claude client, dedup
+    index and enrichment cache) is built once, every cycle after the first
+    skips imports, authentication and cold caches.
+
+    A cycle starts every *interval* seconds, or as soon as *trigger_file*
+    appears (the file is removed when the cycle starts). With an interval of
+    0 the daemon only runs on the trigger file.
+
+    *existing_leads* is called at the start of every cycle for the stored
+    leads to dedup against, and *raw_store* is rotated then so the side
+    file holds at most two cycles of rows.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        interval: float,
+        trigger_file: str | None = None,
+        on_cycle: Callable[[PipelineStats], None] | None = None,
+        poll_seconds: float = 1.0,
+        existing_leads: Callable[[], Iterable[Lead] | None] | None = None,
+        raw_store: RawStore | None = None,
+    ) -> None:
+        self._pipeline = pipeline
+        self._interval = interval
+        self._trigger = Path(trigger_file) if trigger_file else None
+        self._on_cycle = on_cycle
+        self._poll_seconds = poll_seconds
+        self._existing_leads = existing_leads
+        self._raw_store = raw_store
+        self._stop = threading.Event()
+        self.cycles = 0
+
+    def stop(self, *_args) -> None:
+        """Request shutdown after the current cycle. Usable as a signal handler."""
+        if not self._stop.is_set():
+            logger.info("Shutdown requested, finishing current cycle")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGTERM and SIGINT."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def run(self) -> None:
+        """Run cycles until ``stop()`` is called."""
+        logger.info(
+            "Daemon started (interval=%ss, trigger=%s)",
+            self._interval or "off",
+            self._trigger or "off",
+        )
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            if self._due(next_run):
+                next_run = time.monotonic() + self._interval
+                self._cycle()
+            else:
+                self._stop.wait(self._poll_seconds)
+        logger.info("Daemon stopped after %d cycles", self.cycles)
+
+    def _due(self, next_run: float) -> bool:
+        if self._trigger is not None and self._trigger.exists():
+            self._trigger.unlink(missing_ok=True)
+            logger.info("Trigger file %s found", self._trigger)
+            return True
+        return bool(self._interval) and time.monotonic() >= next_run
+
+    def _cycle(self) -> None:
+        self.cycles += 1
+        logger.info("Daemon cycle %d starting", self.cycles)
+        try:
+            if self._raw_store is not None:
+                self._raw_store.rotate()
+            existing = self._existing_leads() if self._existing_leads is not None else None
+            stats = self._pipeline.run(existing_leads=existing)
+            # Due dead letters are retried on the backoff schedule kept by the store
+            self._pipeline.retry_dead_letters()
+        except Exception:
+            logger.exception("Daemon cycle %d failed", self.cycles)
+            return
+        if self._on_cycle is not None:
+            self._on_cycle(stats)
@@ -0,0 +1,249 @@
+"""Persistent dead-letter store for leads that failed a stage after retries.
+
+Each entry records the failed stage (``enrich`` or ``write``), the target
+destination for write failures, the last error and the lead payload. A lead
+that fails the same stage again updates its entry instead of adding one, and
+every failure pushes ``next_retry_at`` out exponentially, so
+``Pipeline.retry_dead_letters`` only reprocesses entries that are due.
+
+Destinations record write failures with ``dead_letter_writes``. Inside
+``deferred_writes()`` (a retry loop such as the fan-out's) those records are
+held back, and the caller keeps only the final attempt's with
+``record_writes``. A failure that a later attempt fixes therefore never
+reaches the store.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+from leadflow import metrics
+from leadflow.models import Lead
+
+logger = logging.getLogger(__name__)
+
+# Status of a lead whose enrichment was dead-lettered; the pipeline holds it
+# back from writing until a retry enriches it
+DEAD_LETTERED = "dead_lettered"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY,
+    stage TEXT NOT NULL,
+    target TEXT NOT NULL DEFAULT '',
+    lead_key TEXT NOT NULL,
+    error TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    first_failed_at TEXT NOT NULL,
+    last_failed_at TEXT NOT NULL,
+    next_retry_at REAL NOT NULL,
+    UNIQUE (stage, target, lead_key)
+)
+"""
+
+_UPSERT = """
+INSERT INTO dead_letters
+    (stage, target, lead_key, error, payload, first_failed_at, last_failed_at, next_retry_at)
+VALUES (:stage, :target, :lead_key, :error, :payload, :failed_at, :failed_at, :now + :backoff)
+ON CONFLICT (stage, target, lead_key) DO UPDATE SET
+    error = excluded.error,
+    payload = excluded.payload,
+    attempts = attempts + 1,
+    last_failed_at = excluded.last_failed_at,
+    next_retry_at = :now + min(:max_backoff, :backoff * (1 << attempts))
+"""
+
+
+@dataclass
+class DeadLetter:
+    id: int
+    stage: str
+    target: str
+    error: str
+    attempts: int
+    lead: Lead
+    first_failed_at: str
+    last_failed_at: str
+    next_retry_at: float
+
+
+class DeadLetterStore:
+    """SQLite-backed dead-letter queue, safe to share between threads."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        backoff_seconds: float = 60.0,
+        max_backoff_seconds: float = 3600.0,
+        max_attempts: int = 5,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._backoff = backoff_seconds
+        self._max_backoff = max_backoff_seconds
+        self._max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def add(self, stage: str, lead: Lead, error: str | BaseException, target: str = "") -> None:
+        """Record (or re-record) that *lead* failed *stage*."""
+        params = {
+            "stage": stage,
+            "target": target,
+            "lead_key": _lead_key(lead),
+            "error": str(error),
+            "payload": json.dumps(lead.to_dict()),
+            "failed_at": datetime.now(timezone.utc).isoformat(),
+            "now": time.time(),
+            "backoff": self._backoff,
+            "max_backoff": self._max_backoff,
+        }
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, params)
+        logger.debug("Dead-lettered %s at %s%s: %s", lead.name, stage, f" ({target})" if target else "", error)
+
+    def due(self, now: float | None = None, limit: int | None = None) -> list[DeadLetter]:
+        """Entries whose backoff has elapsed and that have attempts left, oldest first."""
+        return self._select(
+            "next_retry_at <= ? AND attempts < ?",
+            [time.time() if now is None else now, self._max_attempts],
+            limit,
+        )
+
+    def exhausted(self, limit: int | None = None) -> list[DeadLetter]:
+        """Entries that used up their attempts and are no longer retried, oldest first."""
+        return self._select("attempts >= ?", [self._max_attempts], limit)
+
+    def purge_exhausted(self) -> int:
+        """Delete the entries that used up their attempts. Returns the count removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM dead_letters WHERE attempts >= ?", (self._max_attempts,))
+        return cursor.rowcount
+
+    def resolve(self, entries: list[DeadLetter]) -> int:
+        """Remove *entries* unless they failed again since they were read. Returns the count removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM dead_letters WHERE id = ? AND attempts = ?",
+                [(entry.id, entry.attempts) for entry in entries],
+            )
+        return cursor.rowcount
+
+    def count(self, stage: str | None = None) -> int:
+        query, params = "SELECT count(*) FROM dead_letters", ()
+        if stage is not None:
+            query, params = query + " WHERE stage = ?", (stage,)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _select(self, where: str, params: list, limit: int | None) -> list[DeadLetter]:
+        query = (
+            "SELECT id, stage, target, error, attempts, payload, first_failed_at,"
+            f" last_failed_at, next_retry_at FROM dead_letters WHERE {where} ORDER BY id"
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params = [*params, limit]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            DeadLetter(
+                id=row[0],
+                stage=row[1],
+                target=row[2],
+                error=row[3],
+                attempts=row[4],
+                lead=Lead.from_dict(json.loads(row[5])),
+                first_failed_at=row[6],
+                last_failed_at=row[7],
+                next_retry_at=row[8],
+            )
+            for row in rows
+        ]
+
+
+def _lead_key(lead: Lead) -> str:
+    """Identity of a lead across runs — contact fields, not just the dedup key."""
+    raw = "\x1f".join((lead.name, lead.email, lead.phone, lead.company, lead.source))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# Write failures held back by deferred_writes(): (store, leads, error, target)
+_deferred: contextvars.ContextVar[list | None] = contextvars.ContextVar("leadflow_deferred_dead_letters", default=None)
+
+
+def dead_letter_writes(
+    store: DeadLetterStore | None, leads: list[Lead], error: str | BaseException, target: str
+) -> None:
+    """Record that writing *leads* to *target* failed (held back inside ``deferred_writes``)."""
+    if store is None or not leads:
+        return
+    pending = _deferred.get()
+    if pending is not None:
+        pending.append((store, list(leads), error, target))
+        return
+    for lead in leads:
+        store.add("write", lead, error, target=target)
+    metrics.current().incr("dead_letter.write", len(leads))
+
+
+@contextmanager
+def deferred_writes() -> Iterator[list]:
+    """Collect write dead letters made in this context instead of recording them.
+
+    Yields the list they are collected in. Pass it to ``record_writes`` once
+    the attempt turns out to be the last one.
+    """
+    pending: list = []
+    token = _deferred.set(pending)
+    try:
+        yield pending
+    finally:
+        _deferred.reset(token)
+
+
+def record_writes(pending: list) -> None:
+    """Record write dead letters collected by ``deferred_writes``."""
+    for store, leads, error, target in pending:
+        dead_letter_writes(store, leads, error, target)
+
+
+_stores: dict[str, DeadLetterStore] = {}
+_stores_lock = threading.Lock()
+
+
+def dead_letter_store_from_config(config: dict) -> DeadLetterStore | None:
+    """Return the shared DeadLetterStore configured under ``dead_letter``, or None if disabled."""
+    dlq_cfg = config.get("dead_letter", {})
+    if not dlq_cfg.get("enabled", False):
+        return None
+
+    path = str(dlq_cfg.get("path", "output/dead_letters.db"))
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = DeadLetterStore(
+                path,
+                backoff_seconds=dlq_cfg.get("backoff_seconds", 60.0),
+                max_backoff_seconds=dlq_cfg.get("max_backoff_seconds", 3600.0),
+                max_attempts=dlq_cfg.get("max_attempts", 5),
+            )
+            logger.debug("Dead-letter store opened at %s", path)
+        return _stores[path]
@@ -15,6 +15,9 @@ class LeadDestination(ABC):
         """Write leads to the destination. Returns the number of leads written."""
         ...
 
+    def finish(self) -> None:
+        """Complete anything kept open across writes; called when a run ends."""
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -0,0 +1,217 @@
+"""Columnar file destination — partitioned Parquet (or Arrow IPC) for analytics.
+
+Leads are written as typed columns (``tags`` as ``list<string>``,
+``ingested_at`` as a UTC timestamp, ``raw_data`` as JSON text) under a
+Hive-style directory layout, e.g. ``ingested_date=2026-10-18/source=mock/``,
+so pandas, DuckDB and pyarrow can read them directly and prune partitions::
+
+    SELECT * FROM read_parquet('output/leads/**/*.parquet', hive_partitioning = true)
+
+A run writes one file per partition it touches. Files stay open across
+writes, and each write appends its leads as row groups of at most
+``row_group_rows``. ``finish()``, called by the pipeline at the end of the
+run, closes the files and renames them into place, so readers never see
+a partial file. Requires the optional ``pyarrow`` package.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import quote
+
+from leadflow import metrics
+from leadflow.dead_letter import dead_letter_store_from_config, dead_letter_writes
+from leadflow.destinations.base import LeadDestination
+from leadflow.models import Lead
+from leadflow.registry import register_destination
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+# Columns a lead can be partitioned by; ingested_date is derived from ingested_at
+PARTITION_COLUMNS = ("ingested_date", "source", "status")
+# Hive's name for an empty partition value, understood by pyarrow and Spark
+_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+@dataclass
+class _OpenFile:
+    """A partition's file being written: renamed from *tmp* to *path* when finished."""
+
+    tmp: Path
+    path: Path
+    writer: object
+    rows: int = 0
+
+
+@register_destination("parquet")
+class ColumnarWriter(LeadDestination):
+    """Writes leads to partitioned Parquet or Arrow IPC files under ``destinations.parquet.dir``."""
+
+    def __init__(self, config: dict) -> None:
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                "The parquet destination requires the 'pyarrow' package (pip install leadflow-ai[parquet])"
+            ) from e
+        self._pa = pyarrow
+
+        dest_cfg = config.get("destinations", {}).get("parquet", {})
+        self.dir = Path(dest_cfg.get("dir", "output/leads"))
+        self._format = dest_cfg.get("format", "parquet")
+        if self._format not in _EXTENSIONS:
+            raise ValueError(f"Unknown columnar format {self._format!r} (parquet or arrow)")
+        self._partition_by = list(dest_cfg.get("partition_by", ["ingested_date"]))
+        unknown = set(self._partition_by) - set(PARTITION_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot partition by {sorted(unknown)}; choose from {', '.join(PARTITION_COLUMNS)}")
+        self._row_group_rows = max(1, dest_cfg.get("row_group_rows", 50_000))
+        self._compression = dest_cfg.get("compression", "zstd")
+        self._schema = self._build_schema()
+        self._dead_letters = dead_letter_store_from_config(config)
+        # Files written by this run, per partition dir, until finish()
+        self._files: dict[Path, _OpenFile] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "parquet"
+
+    def write(self, leads: list[Lead]) -> int:
+        """Append leads to their partitions' open files. Returns number of leads written.
+
+        If a partition fails, the leads written to other partitions still
+        count and the rest are dead-lettered.
+        """
+        if not leads:
+            logger.info("No leads to write")
+            return 0
+
+        run_metrics = metrics.current()
+        by_partition: dict[Path, list[Lead]] = {}
+        for lead in leads:
+            lead.stamp_ingested()
+            by_partition.setdefault(self._partition_dir(lead), []).append(lead)
+
+        written = 0
+        partitions = list(by_partition.items())
+        with self._lock, run_metrics.time("destination.parquet.write"):
+            for done, (partition, batch) in enumerate(partitions):
+                try:
+                    for offset in range(0, len(batch), self._row_group_rows):
+                        self._append(partition, batch[offset : offset + self._row_group_rows])
+                except (OSError, self._pa.ArrowException) as e:
+                    logger.error("Failed to write leads to %s: %s", partition, e)
+                    self._discard(partition)
+                    failed = [lead for _, rest in partitions[done:] for lead in rest]
+                    dead_letter_writes(self._dead_letters, failed, e, self.name)
+                    return written
+                written += len(batch)
+
+        logger.info("Wrote %d leads to %d partition(s) under %s", written, len(partitions), self.dir)
+        return written
+
+    def finish(self) -> None:
+        """Close this run's files and rename them into place."""
+        with self._lock:
+            files, self._files = self._files, {}
+            for file in files.values():
+                try:
+                    file.writer.close()
+                    os.replace(file.tmp, file.path)
+                except (OSError, self._pa.ArrowException) as e:
+                    logger.error("Failed to complete %s, %d leads in it are lost: %s", file.path, file.rows, e)
+                    metrics.current().incr("destination.parquet.lost_leads", file.rows)
+                    file.tmp.unlink(missing_ok=True)
+            if files:
+                metrics.current().incr("destination.parquet.files", len(files))
+                logger.info("Completed %d file(s) under %s", len(files), self.dir)
+
+    def _append(self, partition: Path, leads: list[Lead]) -> None:
+        """Write *leads* as one row group of *partition*'s file, opening it on first use."""
+        file = self._files.get(partition)
+        if file is None:
+            partition.mkdir(parents=True, exist_ok=True)
+            name = f"part-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+            tmp = partition / f".{name}.tmp"
+            file = self._files[partition] = _OpenFile(
+                tmp, partition / f"{name}.{_EXTENSIONS[self._format]}", self._open(tmp)
+            )
+        file.writer.write_batch(self._to_batch(leads))
+        file.rows += len(leads)
+
+    def _discard(self, partition: Path) -> None:
+        """Drop *partition*'s file after a failed row group, which leaves it unreadable."""
+        file = self._files.pop(partition, None)
+        if file is None:
+            return
+        try:
+            file.writer.close()
+        except Exception:
+            pass
+        file.tmp.unlink(missing_ok=True)
+        if file.rows:
+            logger.error("Discarded %s, %d leads written to it earlier in the run are lost", file.path, file.rows)
+            metrics.current().incr("destination.parquet.lost_leads", file.rows)
+
+    def _open(self, path: Path):
+        if self._format == "arrow":
+            import pyarrow.ipc
+
+            return pyarrow.ipc.new_file(str(path), self._schema)
+        import pyarrow.parquet
+
+        return pyarrow.parquet.ParquetWriter(str(path), self._schema, compression=self._compression)
+
+    def _build_schema(self):
+        pa = self._pa
+        fields = [
+            pa.field("name", pa.string()),
+            pa.field("email", pa.string()),
+            pa.field("phone", pa.string()),
+            pa.field("company", pa.string()),
+            pa.field("source", pa.string()),
+            pa.field("notes", pa.string()),
+            pa.field("summary", pa.string()),
+            pa.field("tags", pa.list_(pa.string())),
+            pa.field("status", pa.string()),
+            pa.field("ingested_at", pa.timestamp("us", tz="UTC")),
+            pa.field("raw_data", pa.string()),
+        ]
+        # Partition values live in the directory names, not in the files
+        return pa.schema([f for f in fields if f.name not in self._partition_by])
+
+    def _to_batch(self, leads: list[Lead]):
+        columns = {
+            "name": [lead.name for lead in leads],
+            "email": [lead.email for lead in leads],
+            "phone": [lead.phone for lead in leads],
+            "company": [lead.company for lead in leads],
+            "source": [lead.source for lead in leads],
+            "notes": [lead.notes for lead in leads],
+            "summary": [lead.summary for lead in leads],
+            "tags": [lead.tags for lead in leads],
+            "status": [lead.status for lead in leads],
+            "ingested_at": [
+                datetime.fromisoformat(lead.ingested_at) if lead.ingested_at else None for lead in leads
+            ],
+            "raw_data": [json.dumps(lead.get_raw_data(), default=str) for lead in leads],
+        }
+        return self._pa.RecordBatch.from_pydict(
+            {name: columns[name] for name in self._schema.names}, schema=self._schema
+        )
+
+    def _partition_dir(self, lead: Lead) -> Path:
+        path = self.dir
+        for column in self._partition_by:
+            value = lead.ingested_at[:10] if column == "ingested_date" else getattr(lead, column)
+            path = path / f"{column}={quote(value, safe='') if value else _DEFAULT_PARTITION}"
+        return path
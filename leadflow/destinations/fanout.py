@@ -0,0 +1,181 @@
+"""Concurrent fan-out of lead writes to several destinations."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from leadflow import metrics
+from leadflow.dead_letter import deferred_writes, record_writes
+from leadflow.destinations.base import LeadDestination
+from leadflow.executor import in_current_context
+from leadflow.models import Lead
+
+logger = logging.getLogger(__name__)
+
+_CLOSE = object()
+
+
+class _Chunk:
+    """A submitted chunk, tracking which destinations still have to write it."""
+
+    def __init__(self, leads: list[Lead], destinations: int, on_written: Callable | None) -> None:
+        self.leads = leads
+        self._remaining = destinations
+        self._complete = True
+        self._on_written = on_written
+        self._lock = threading.Lock()
+
+    def done(self, written: int) -> None:
+        """One destination finished; call *on_written* once all wrote every lead."""
+        with self._lock:
+            self._remaining -= 1
+            self._complete = self._complete and written == len(self.leads)
+            finished = self._remaining == 0 and self._complete
+        if finished and self._on_written is not None:
+            self._on_written(self.leads)
+
+
+def write_with_retry(
+    destination: LeadDestination, leads: list[Lead], retries: int, backoff: float
+) -> int:
+    """Write *leads*, retrying with exponential backoff until all were written.
+
+    Destinations log and swallow their own errors, so an exception or a
+    zero count for a non-empty chunk is treated as a failed attempt. After
+    a partial write only the leads the destination dead-lettered are
+    retried. Only the dead letters of the final attempt are recorded, so a
+    lead that a retry writes is not retried again from the dead-letter store.
+    """
+    run_metrics = metrics.current()
+    total = 0
+    failed: list = []
+    for attempt in range(retries + 1):
+        if attempt:
+            run_metrics.incr(f"destination.{destination.name}.retries")
+            time.sleep(backoff * 2 ** (attempt - 1))
+        with deferred_writes() as failed:
+            try:
+                written = destination.write(leads)
+            except Exception as e:
+                logger.warning("Write to %s attempt %d failed: %s", destination.name, attempt + 1, e)
+                continue
+        total += written
+        if written == len(leads):
+            record_writes(failed)
+            return total
+        if written:
+            # Partial write: retry what the destination dead-lettered, if it said
+            leads = [lead for _, group, _, _ in failed for lead in group]
+            if not leads:
+                return total
+            logger.warning(
+                "Write to %s attempt %d left %d leads unwritten", destination.name, attempt + 1, len(leads)
+            )
+        else:
+            logger.warning("Write to %s attempt %d wrote nothing", destination.name, attempt + 1)
+    record_writes(failed)
+    logger.error("Giving up on %d leads for %s", len(leads), destination.name)
+    return total
+
+
+class FanOut:
+    """Writes every chunk to several destinations, each with its own worker.
+
+    ``write_now`` writes one chunk to all destinations concurrently and waits.
+    ``submit`` hands a chunk to each destination's queue and returns; a slow
+    destination only pushes back on the caller once it falls
+    *max_pending* chunks behind, so fast destinations keep draining.
+    ``close`` waits for all queues and returns per-destination totals.
+    """
+
+    def __init__(
+        self,
+        destinations: list[LeadDestination],
+        max_pending: int = 4,
+        retries: int = 2,
+        backoff: float = 1.0,
+    ) -> None:
+        self._destinations = destinations
+        self._labels = _unique_labels(destinations)
+        self._retries = retries
+        self._backoff = backoff
+        self._max_pending = max_pending
+        self._totals = dict.fromkeys(self._labels, 0)
+        self._queues: list[queue.Queue] = []
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def labels(self) -> list[str]:
+        return list(self._labels)
+
+    def write_now(self, leads: list[Lead]) -> dict[str, int]:
+        """Write *leads* to all destinations concurrently; returns counts per destination."""
+        with ThreadPoolExecutor(
+            max_workers=len(self._destinations), thread_name_prefix="leadflow-dest"
+        ) as pool:
+            write = in_current_context(self._write)
+            counts = list(pool.map(write, self._destinations, [leads] * len(self._destinations)))
+        return dict(zip(self._labels, counts))
+
+    def submit(self, leads: list[Lead], on_written: Callable[[list[Lead]], None] | None = None) -> None:
+        """Queue *leads* for every destination (blocks only on a full queue).
+
+        *on_written* is called with *leads*, on a destination's worker, once
+        every destination has written all of them.
+        """
+        if not self._threads:
+            self._start()
+        chunk = _Chunk(leads, len(self._queues), on_written)
+        for q in self._queues:
+            q.put(chunk)
+
+    def close(self) -> dict[str, int]:
+        """Wait for all queued chunks to be written; returns totals per destination."""
+        for q in self._queues:
+            q.put(_CLOSE)
+        for thread in self._threads:
+            thread.join()
+        self._queues, self._threads = [], []
+        totals, self._totals = self._totals, dict.fromkeys(self._labels, 0)
+        return totals
+
+    def _start(self) -> None:
+        for label, destination in zip(self._labels, self._destinations):
+            q: queue.Queue = queue.Queue(maxsize=max(1, self._max_pending))
+            thread = threading.Thread(
+                target=in_current_context(self._drain),
+                args=(label, destination, q),
+                name=f"leadflow-dest-{label}",
+                daemon=True,
+            )
+            self._queues.append(q)
+            self._threads.append(thread)
+            thread.start()
+
+    def _drain(self, label: str, destination: LeadDestination, q: queue.Queue) -> None:
+        while True:
+            chunk = q.get()
+            if chunk is _CLOSE:
+                return
+            written = self._write(destination, chunk.leads)
+            self._totals[label] += written
+            metrics.record_ingest_latency(chunk.leads, f"ingest_to_write.{label}")
+            chunk.done(written)
+
+    def _write(self, destination: LeadDestination, leads: list[Lead]) -> int:
+        return write_with_retry(destination, leads, self._retries, self._backoff)
+
+
+def _unique_labels(destinations: list[LeadDestination]) -> list[str]:
+    labels: list[str] = []
+    for destination in destinations:
+        label, n = destination.name, 2
+        while label in labels:
+            label, n = f"{destination.name}#{n}", n + 1
+        labels.append(label)
+    return labels
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Iterator
 
+from leadflow import clients, metrics
+from leadflow.dead_letter import dead_letter_store_from_config, dead_letter_writes
 from leadflow.destinations.base import LeadDestination
 from leadflow.models import Lead
 from leadflow.registry import register_destination
@@ -11,15 +15,41 @@ from leadflow.registry import register_destination
 logger = logging.getLogger(__name__)
 
 
+HEADERS = ["name", "email", "phone", "company", "source", "notes",
+           "summary", "tags", "status", "ingested_at"]
+
+# HTTP status codes worth retrying: quota exhausted and transient backend errors
+RETRYABLE_STATUS = (429, 500, 503)
+# Appends are not idempotent (a 5xx may arrive after the rows were added), so
+# only a rejected request is retried
+APPEND_RETRYABLE_STATUS = (429,)
+
+
 @register_destination("google_sheets")
 class GoogleSheetsWriter(LeadDestination):
-    """Writes enriched leads to a Google Sheets spreadsheet."""
+    """Writes enriched leads to a Google Sheets spreadsheet.
+
+    Rows go out as ``append_rows`` batches of at most ``batch_rows`` rows
+    and ``max_batch_bytes`` of cell text, so 10k leads take a few dozen
+    requests rather than 10k. A batch that hits the quota is retried with
+    exponential backoff (honouring ``Retry-After``); leads still unwritten
+    after ``retries``, or whose batch failed with any other error, are
+    dead-lettered. Reads are also retried on transient 5xx errors.
+    """
 
     def __init__(self, config: dict) -> None:
         self._config = config
         dest_cfg = config.get("destinations", {}).get("google_sheets", {})
         self._spreadsheet_name = dest_cfg.get("spreadsheet_name", "LeadFlow Master")
         self._worksheet_index = dest_cfg.get("worksheet_index", 0)
+        self._credentials_file = dest_cfg.get("credentials_file", "")
+        self._batch_rows = max(1, dest_cfg.get("batch_rows", 500))
+        self._max_batch_bytes = dest_cfg.get("max_batch_bytes", 2_000_000)
+        self._retries = dest_cfg.get("retries", 5)
+        self._retry_backoff = dest_cfg.get("retry_backoff", 1.0)
+        self._dead_letters = dead_letter_store_from_config(config)
+        self._worksheet = None
+        self._header_checked = False
 
     @property
     def name(self) -> str:
@@ -34,31 +64,86 @@ class GoogleSheetsWriter(LeadDestination):
         for lead in leads:
             lead.stamp_ingested()
 
+        written = 0
         try:
-            import gspread
-
-            gc = gspread.service_account()
-            spreadsheet = gc.open(self._spreadsheet_name)
-            worksheet = spreadsheet.get_worksheet(self._worksheet_index)
+            worksheet = self._get_worksheet()
+            self._ensure_header(worksheet)
 
-            headers = ["name", "email", "phone", "company", "source", "notes",
-                       "summary", "tags", "status", "ingested_at"]
+            for batch in self._batches(leads):
+                self._append(worksheet, [self._lead_to_row(lead) for lead in batch])
+                written += len(batch)
 
-            existing = worksheet.get_all_values()
-            if not existing:
-                worksheet.append_row(headers)
-
-            for lead in leads:
-                row = [
-                    lead.name, lead.email, lead.phone, lead.company,
-                    lead.source, lead.notes, lead.summary,
-                    ", ".join(lead.tags), lead.status, lead.ingested_at,
-                ]
-                worksheet.append_row(row)
-
-            logger.info("Wrote %d leads to Google Sheets", len(leads))
-            return len(leads)
+            logger.info("Wrote %d leads to Google Sheets", written)
+            return written
 
         except Exception as e:
-            logger.error("Failed to write to Google Sheets: %s", e)
-            return 0
+            metrics.current().incr("destination.google_sheets.errors")
+            logger.error("Failed to write to Google Sheets after %d leads: %s", written, e)
+            dead_letter_writes(self._dead_letters, leads[written:], e, self.name)
+            return written
+
+    def _get_worksheet(self):
+        """Open the worksheet once, on the shared spreadsheet handle; reused by later writes."""
+        if self._worksheet is None:
+            spreadsheet = clients.spreadsheet(self._config, self._spreadsheet_name, self._credentials_file)
+            self._worksheet = spreadsheet.get_worksheet(self._worksheet_index)
+        return self._worksheet
+
+    def _ensure_header(self, worksheet) -> None:
+        """Write the header row if row 1 is empty (checked once per writer)."""
+        if self._header_checked:
+            return
+        if not self._with_retry(RETRYABLE_STATUS, worksheet.row_values, 1):
+            self._with_retry(APPEND_RETRYABLE_STATUS, worksheet.append_row, HEADERS)
+        self._header_checked = True
+
+    def _batches(self, leads: list[Lead]) -> Iterator[list[Lead]]:
+        """Split *leads* by row count and approximate payload size."""
+        batch: list[Lead] = []
+        size = 0
+        for lead in leads:
+            row_size = sum(len(cell) for cell in self._lead_to_row(lead)) + 8 * len(HEADERS)
+            if batch and (len(batch) >= self._batch_rows or size + row_size > self._max_batch_bytes):
+                yield batch
+                batch, size = [], 0
+            batch.append(lead)
+            size += row_size
+        if batch:
+            yield batch
+
+    def _append(self, worksheet, rows: list[list[str]]) -> None:
+        run_metrics = metrics.current()
+        with run_metrics.time("destination.google_sheets.request"):
+            self._with_retry(APPEND_RETRYABLE_STATUS, worksheet.append_rows, rows, table_range="A1")
+        run_metrics.incr("destination.google_sheets.rows", len(rows))
+
+    def _with_retry(self, retryable: tuple[int, ...], call, *args, **kwargs):
+        """Run *call*, retrying API errors whose status is in *retryable* with backoff."""
+        for attempt in range(self._retries + 1):
+            try:
+                return call(*args, **kwargs)
+            except Exception as e:
+                status = getattr(e, "code", None)
+                if status not in retryable or attempt == self._retries:
+                    raise
+                delay = _retry_after(e) or self._retry_backoff * 2**attempt
+                metrics.current().incr("destination.google_sheets.retries")
+                logger.warning("Google Sheets returned %s, retrying in %.1fs", status, delay)
+                time.sleep(delay)
+
+    @staticmethod
+    def _lead_to_row(lead: Lead) -> list[str]:
+        return [
+            lead.name, lead.email, lead.phone, lead.company,
+            lead.source, lead.notes, lead.summary,
+            ", ".join(lead.tags), lead.status, lead.ingested_at,
+        ]
+
+
+def _retry_after(error: Exception) -> float:
+    """Seconds from the error response's ``Retry-After`` header, or 0."""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
@@ -1,31 +1,57 @@
-"""Mock destination writer — writes to console and output/leads.json."""
+"""Mock destination writer — writes to console and output/leads.json.
+
+With ``destinations.mock.format: jsonl`` it is an append-only archive
+instead: each write appends that run's leads as JSON lines (one gzip member
+per write when the path ends in ``.gz``), so its cost is proportional to the
+run rather than to everything archived so far. The active file is rotated
+by size, and ``compact_archive`` (``main.py --compact-output``) merges the
+segments into one file keeping the latest record per lead.
+"""
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import os
+import re
+import threading
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
 
+from leadflow import metrics
 from leadflow.destinations.base import LeadDestination
 from leadflow.models import Lead
 from leadflow.registry import register_destination
+from leadflow.serialization import JsonLinesCodec, open_binary
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_JSONL_PATH = "output/leads.jsonl"
+
 
 @register_destination("mock")
 class MockWriter(LeadDestination):
-    """Writes leads to a local JSON file for demo/testing."""
+    """Writes leads to a local JSON file (or JSON-lines archive) for demo/testing."""
 
     def __init__(self, config: dict | None = None) -> None:
         self._config = config or {}
+        dest_cfg = self._config.get("destinations", {}).get("mock", {})
+        self._format = dest_cfg.get("format", "json")
+        if self._format not in ("json", "jsonl"):
+            raise ValueError(f"Unknown mock destination format {self._format!r} (json or jsonl)")
+        self._path = Path(dest_cfg.get("path") or DEFAULT_JSONL_PATH)
+        self._rotate_bytes = dest_cfg.get("rotate_bytes", 0)
+        self._lock = threading.Lock()
+        self._tail_checked = False
 
     @property
     def name(self) -> str:
         return "mock"
 
     def write(self, leads: list[Lead]) -> int:
-        """Write leads to output/leads.json."""
+        """Write leads to output/leads.json (or append them to the JSON-lines archive)."""
         if not leads:
             logger.info("No leads to write")
             return 0
@@ -33,6 +59,9 @@ class MockWriter(LeadDestination):
         for lead in leads:
             lead.stamp_ingested()
 
+        if self._format == "jsonl":
+            return self._append(leads)
+
         output_dir = Path("output")
         output_dir.mkdir(exist_ok=True)
         output_path = output_dir / "leads.json"
@@ -48,8 +77,157 @@ class MockWriter(LeadDestination):
         new_records = [lead.to_dict() for lead in leads]
         all_records = existing + new_records
 
-        with open(output_path, "w") as f:
+        with metrics.current().time("destination.mock.write"), open(output_path, "w") as f:
             json.dump(all_records, f, indent=2, default=str)
 
         logger.info("Wrote %d leads to %s (total: %d)", len(leads), output_path, len(all_records))
         return len(leads)
+
+    def _append(self, leads: list[Lead]) -> int:
+        """Append *leads* to the archive in a single write, rotating it first if it is full."""
+        codec = JsonLinesCodec()
+        payload = b"".join(codec.encode(lead) for lead in leads)
+        if _is_gzip(self._path):
+            payload = gzip.compress(payload)
+
+        run_metrics = metrics.current()
+        with self._lock, run_metrics.time("destination.mock.write"):
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._rotate_if_full(len(payload))
+            if not self._tail_checked and not _is_gzip(self._path) and _torn_tail(self._path):
+                # A crash left a partial line; start ours on a fresh one
+                payload = b"\n" + payload
+            self._tail_checked = True
+            _append_atomic(self._path, payload)
+        run_metrics.incr("destination.mock.bytes", len(payload))
+
+        logger.info("Appended %d leads to %s", len(leads), self._path)
+        return len(leads)
+
+    def _rotate_if_full(self, incoming: int) -> None:
+        if not self._rotate_bytes:
+            return
+        try:
+            size = self._path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size and size + incoming > self._rotate_bytes:
+            rotated = self._path
+            while rotated.exists():  # never overwrite a segment rotated in the same microsecond
+                stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+                rotated = self._path.with_name(f"{_stem(self._path)}.{stamp}{_suffix(self._path)}")
+            os.replace(self._path, rotated)
+            logger.info("Rotated %s to %s", self._path, rotated.name)
+
+
+def compact_archive(path: str | Path = DEFAULT_JSONL_PATH) -> tuple[int, int]:
+    """Merge the archive's rotated segments and active file into the active file.
+
+    Keeps the most recent record per dedup key (leads without one are all
+    kept) and drops a torn final record left by a crash. The result is
+    written to a temporary file and moved into place, so an interrupted
+    compaction loses nothing; run it while nothing else writes to the
+    archive. Returns ``(records read, records kept)``.
+    """
+    path = Path(path)
+    segments = archive_segments(path)
+    if not segments:
+        return 0, 0
+    latest: dict[bytes, dict] = {}
+    records: list[dict | bytes] = []  # dicts, or the dedup key of a record in ``latest``
+    read = 0
+    for segment in segments:
+        for record in _read_segment(segment):
+            read += 1
+            lead = Lead.from_dict(record)
+            key = lead.dedup_key()
+            if key is None:
+                records.append(record)
+            else:
+                if key not in latest:
+                    records.append(key)
+                latest[key] = record
+
+    tmp = path.with_name(f"{_stem(path)}.compacting{_suffix(path)}")
+    with open_binary(tmp, "w") as fp:
+        for record in records:
+            if isinstance(record, bytes):
+                record = latest[record]
+            fp.write(json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n")
+        fp.flush()
+        os.fsync(fp.fileno())
+    os.replace(tmp, path)
+    for segment in segments:
+        if segment != path:
+            segment.unlink()
+
+    logger.info("Compacted %d segment(s) of %s: %d records -> %d", len(segments), path, read, len(records))
+    return read, len(records)
+
+
+def archive_segments(path: str | Path) -> list[Path]:
+    """The archive's rotated segments, oldest first, followed by the active file."""
+    path = Path(path)
+    pattern = re.compile(rf"{re.escape(_stem(path))}\.\d{{8}}T\d{{12}}{re.escape(_suffix(path))}")
+    rotated = sorted(p for p in path.parent.glob(f"{_stem(path)}.*") if pattern.fullmatch(p.name))
+    return rotated + ([path] if path.exists() else [])
+
+
+def _read_segment(path: Path):
+    """Yield the records of one segment, stopping at a torn tail."""
+    try:
+        with open_binary(path, "r") as fp:
+            for line in fp:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping a corrupt record in %s", path)
+    except (EOFError, gzip.BadGzipFile, zlib.error):
+        logger.warning("%s ends in a truncated write; keeping the records before it", path)
+
+
+def _torn_tail(path: Path) -> bool:
+    """True if *path* is non-empty and does not end in a newline."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except (FileNotFoundError, OSError):
+        return False
+
+
+def _append_atomic(path: Path, payload: bytes) -> None:
+    """Append *payload* with one O_APPEND write, durable before returning."""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _is_gzip(path: Path) -> bool:
+    return path.name.endswith(".gz")
+
+
+_SUFFIXES = (".jsonl.gz", ".jsonl")
+
+
+def _suffix(path: Path) -> str:
+    """``.jsonl`` / ``.jsonl.gz``, else the last extension (plus ``.gz``), so dots
+    in the stem (``leads.v2.jsonl``) stay part of it."""
+    name = path.name
+    for suffix in _SUFFIXES:
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return suffix
+    if _is_gzip(path):
+        return "".join(path.suffixes[-2:])
+    return path.suffix
+
+
+def _stem(path: Path) -> str:
+    return path.name[: len(path.name) - len(_suffix(path))]
@@ -0,0 +1,190 @@
+"""Local index of Notion pages by lead dedup key, for upserts.
+
+Maps ``(database_id, dedup key)`` to the page ID and a hash of the page's
+lead content. ``NotionWriter`` in upsert mode consults it to update an
+existing page instead of creating a duplicate, and to skip the API call
+entirely when nothing changed. ``sync`` pulls pages edited since the last
+sync from the database, so edits and deletions made in Notion are picked up
+incrementally.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from leadflow.models import Lead
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    database_id TEXT NOT NULL,
+    dedup_key BLOB NOT NULL,
+    page_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (database_id, dedup_key)
+);
+CREATE TABLE IF NOT EXISTS sync_cursors (
+    database_id TEXT PRIMARY KEY,
+    last_edited_time TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class IndexedPage:
+    page_id: str
+    content_hash: str
+
+
+def content_hash(lead: Lead) -> str:
+    """Hash of the fields written to Notion (``ingested_at`` excluded, it changes every write)."""
+    fields = (
+        lead.name, lead.email, lead.phone, lead.company, lead.notes,
+        lead.summary, ",".join(lead.tags), lead.status, lead.source,
+    )
+    return hashlib.blake2b("\x1f".join(fields).encode(), digest_size=16).hexdigest()
+
+
+def page_to_lead(page: dict) -> Lead:
+    """The lead fields of a Notion page, as ``NotionWriter`` lays them out."""
+    props = page.get("properties", {})
+
+    def text(key: str, kind: str) -> str:
+        items = props.get(key, {}).get(kind) or []
+        return "".join(item.get("text", {}).get("content", "") for item in items)
+
+    def select(key: str) -> str:
+        return (props.get(key, {}).get("select") or {}).get("name", "")
+
+    return Lead(
+        name=text("Name", "title"),
+        email=props.get("Email", {}).get("email") or "",
+        phone=props.get("Phone", {}).get("phone_number") or "",
+        company=text("Company", "rich_text"),
+        notes=text("Notes", "rich_text"),
+        summary=text("Summary", "rich_text"),
+        tags=[tag["name"] for tag in props.get("Tags", {}).get("multi_select") or []],
+        status=select("Status"),
+        source=select("Source"),
+    )
+
+
+class NotionPageIndex:
+    """SQLite-backed page index, safe to share between threads."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, database_id: str, key: bytes) -> IndexedPage | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_id, content_hash FROM pages WHERE database_id = ? AND dedup_key = ?",
+                (database_id, key),
+            ).fetchone()
+        return IndexedPage(*row) if row else None
+
+    def put(self, database_id: str, key: bytes, page_id: str, digest: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (database_id, dedup_key, page_id, content_hash)"
+                " VALUES (?, ?, ?, ?)",
+                (database_id, key, page_id, digest),
+            )
+
+    def remove_page(self, database_id: str, page_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM pages WHERE database_id = ? AND page_id = ?", (database_id, page_id)
+            )
+
+    def count(self, database_id: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT count(*) FROM pages WHERE database_id = ?", (database_id,)
+            ).fetchone()[0]
+
+    def sync(self, notion, database_id: str, before_request: Callable[[], object] | None = None) -> int:
+        """Index pages edited in *database_id* since the last sync. Returns how many were seen.
+
+        The cursor is inclusive (Notion timestamps are minute-granular), so
+        boundary pages are simply re-indexed. Archived pages are dropped.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_edited_time FROM sync_cursors WHERE database_id = ?", (database_id,)
+            ).fetchone()
+        since = row[0] if row else ""
+        latest = since
+        seen = 0
+        start_cursor = None
+        while True:
+            kwargs: dict = {
+                "database_id": database_id,
+                "page_size": 100,
+                "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+            }
+            if since:
+                kwargs["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+            if before_request is not None:
+                before_request()
+            response = notion.databases.query(**kwargs)
+
+            for page in response.get("results", []):
+                seen += 1
+                latest = max(latest, page.get("last_edited_time", ""))
+                if page.get("archived") or page.get("in_trash"):
+                    self.remove_page(database_id, page["id"])
+                    continue
+                lead = page_to_lead(page)
+                key = lead.dedup_key()
+                if key is not None:
+                    self.put(database_id, key, page["id"], content_hash(lead))
+
+            if not response.get("has_more"):
+                break
+            start_cursor = response.get("next_cursor")
+
+        if latest and latest != since:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_cursors (database_id, last_edited_time) VALUES (?, ?)",
+                    (database_id, latest),
+                )
+        logger.debug("Synced %d Notion pages into the index (since %s)", seen, since or "the start")
+        return seen
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_indexes: dict[str, NotionPageIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def notion_index_from_config(config: dict) -> NotionPageIndex | None:
+    """Return the shared page index for ``destinations.notion``, or None unless upsert is on."""
+    dest_cfg = config.get("destinations", {}).get("notion", {})
+    if not dest_cfg.get("upsert", False):
+        return None
+
+    path = str(dest_cfg.get("index_path", "output/notion_index.db"))
+    with _indexes_lock:
+        if path not in _indexes:
+            _indexes[path] = NotionPageIndex(path)
+            logger.debug("Notion page index opened at %s", path)
+        return _indexes[path]
@@ -4,20 +4,53 @@ from __future__ import annotations
 
 import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from notion_client import Client
 
+from leadflow import clients, metrics
+from leadflow.dead_letter import dead_letter_store_from_config, dead_letter_writes
 from leadflow.destinations.base import LeadDestination
+from leadflow.destinations.notion_index import content_hash, notion_index_from_config
+from leadflow.executor import in_current_context
 from leadflow.models import Lead
+from leadflow.rate_limit import TokenBucket
 from leadflow.registry import register_destination
 
 logger = logging.getLogger(__name__)
 
+# Rate limited, and transient server errors
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# Sent on update so fields emptied since the last write are cleared in Notion
+_CLEARED_PROPERTIES = {
+    "Email": {"email": None},
+    "Phone": {"phone_number": None},
+    "Company": {"rich_text": []},
+    "Notes": {"rich_text": []},
+    "Summary": {"rich_text": []},
+    "Tags": {"multi_select": []},
+    "Status": {"select": None},
+    "Source": {"select": None},
+}
+
 
 @register_destination("notion")
 class NotionWriter(LeadDestination):
-    """Writes enriched leads to a Notion database."""
+    """Writes enriched leads to a Notion database.
+
+    ``concurrency`` workers issue ``pages.create`` calls, all drawing on the
+    shared token bucket for the integration token (``clients.notion``
+    rate settings, 3 requests/second by default), so throughput sits at the
+    rate limit rather than below it. A 429 or transient 5xx response pauses
+    every worker for its ``Retry-After`` (or exponential backoff) and
+    lowers the rate until requests succeed again.
+
+    With ``upsert`` on, a local index of dedup key -> page ID
+    (``notion_index.py``), synced incrementally from the database before
+    each write, turns reruns into ``pages.update`` calls — and into no call
+    at all when the lead's content hash is unchanged.
+    """
 
     def __init__(self, config: dict) -> None:
         self._config = config
@@ -26,7 +59,12 @@ class NotionWriter(LeadDestination):
         db_var = dest_cfg.get("database_id_env_var", "NOTION_DEST_DATABASE_ID")
         self._token = os.getenv(token_var, "")
         self._database_id = os.getenv(db_var, "")
-        self._rate_limit_delay = dest_cfg.get("rate_limit_delay", 0.35)
+        self._client: Client | None = None
+        self._concurrency = max(1, dest_cfg.get("concurrency", 3))
+        self._max_retries = dest_cfg.get("max_retries", 5)
+        self._retry_backoff = dest_cfg.get("retry_backoff", 1.0)
+        self._dead_letters = dead_letter_store_from_config(config)
+        self._index = notion_index_from_config(config)
 
     @property
     def name(self) -> str:
@@ -43,31 +81,130 @@ class NotionWriter(LeadDestination):
             return 0
 
         try:
-            notion = Client(auth=self._token)
-            written = 0
+            notion = self._get_client()
+        except Exception as e:
+            logger.error("Failed to connect to Notion: %s", e)
+            dead_letter_writes(self._dead_letters, leads, e, self.name)
+            return 0
+
+        limiter = clients.rate_limiter(self._config, "notion", self._token)
+        for lead in leads:
+            lead.stamp_ingested()
+
+        if self._index is None:
+            groups = [[lead] for lead in leads]
+            write_one = self._create
+        else:
+            self._sync_index(notion, limiter)
+            groups = _group_by_key(leads)
+            write_one = self._upsert
+
+        # Leads sharing a dedup key stay on one worker, in order, so a
+        # second copy updates the page the first one created
+        workers = min(self._concurrency, len(groups))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="leadflow-notion") as pool:
+            written = sum(
+                pool.map(
+                    in_current_context(lambda group: sum(write_one(notion, limiter, lead) for lead in group)),
+                    groups,
+                )
+            )
+
+        logger.info("Wrote %d/%d leads to Notion", written, len(leads))
+        return written
+
+    def _create(self, notion: Client, limiter: TokenBucket, lead: Lead) -> bool:
+        """Create one page. True if written."""
+        try:
+            self._request(limiter, lambda: self._create_page(notion, lead))
+            return True
+        except Exception as e:
+            self._failed(lead, e)
+            return False
 
-            for lead in leads:
-                lead.stamp_ingested()
-                properties = self._lead_to_properties(lead)
+    def _upsert(self, notion: Client, limiter: TokenBucket, lead: Lead) -> bool:
+        """Update the lead's indexed page if its content changed, else create one. True if written."""
+        run_metrics = metrics.current()
+        key = lead.dedup_key()
+        digest = content_hash(lead)
+        indexed = self._index.get(self._database_id, key) if key is not None else None
+        if indexed is not None and indexed.content_hash == digest:
+            run_metrics.incr("destination.notion.unchanged")
+            return True
 
+        try:
+            if indexed is not None:
                 try:
-                    notion.pages.create(
-                        parent={"database_id": self._database_id},
-                        properties=properties,
+                    self._request(
+                        limiter,
+                        lambda: notion.pages.update(
+                            page_id=indexed.page_id,
+                            properties={**_CLEARED_PROPERTIES, **self._lead_to_properties(lead)},
+                        ),
                     )
-                    written += 1
+                    self._index.put(self._database_id, key, indexed.page_id, digest)
+                    run_metrics.incr("destination.notion.updated")
+                    return True
                 except Exception as e:
-                    logger.warning("Failed to write lead %s: %s", lead.name, e)
+                    if not _page_gone(e):
+                        raise
+                    logger.info("Indexed page for %s was deleted in Notion, recreating it", lead.name)
+                    self._index.remove_page(self._database_id, indexed.page_id)
+
+            page = self._request(limiter, lambda: self._create_page(notion, lead))
+            if key is not None:
+                self._index.put(self._database_id, key, page["id"], digest)
+            run_metrics.incr("destination.notion.created")
+            return True
+        except Exception as e:
+            self._failed(lead, e)
+            return False
 
-                # Respect Notion API rate limit (~3 requests/sec)
-                time.sleep(self._rate_limit_delay)
+    def _request(self, limiter: TokenBucket, request):
+        """Run one API call under the rate limiter, retrying 429/5xx. Raises the final error."""
+        run_metrics = metrics.current()
+        for attempt in range(self._max_retries + 1):
+            waited = limiter.acquire()
+            if waited:
+                run_metrics.incr("destination.notion.rate_limit_sleep_seconds", waited)
+            try:
+                with run_metrics.time("destination.notion.request"):
+                    response = request()
+                limiter.recover()
+                return response
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status not in RETRYABLE_STATUS or attempt >= self._max_retries:
+                    raise
+                delay = _retry_after(e) or self._retry_backoff * 2**attempt
+                run_metrics.incr("destination.notion.retries")
+                logger.warning("Notion returned %s, backing off %.1fs", status, delay)
+                limiter.backoff(delay)
 
-            logger.info("Wrote %d/%d leads to Notion", written, len(leads))
-            return written
+    def _create_page(self, notion: Client, lead: Lead) -> dict:
+        return notion.pages.create(
+            parent={"database_id": self._database_id},
+            properties=self._lead_to_properties(lead),
+        )
 
+    def _sync_index(self, notion: Client, limiter: TokenBucket) -> None:
+        """Pull pages edited since the last sync into the index; a failure leaves it as it was."""
+        try:
+            with metrics.current().time("destination.notion.index_sync"):
+                self._index.sync(notion, self._database_id, limiter.acquire)
         except Exception as e:
-            logger.error("Failed to connect to Notion: %s", e)
-            return 0
+            logger.warning("Notion page index sync failed, using the existing index: %s", e)
+
+    def _failed(self, lead: Lead, error: Exception) -> None:
+        metrics.current().incr("destination.notion.errors")
+        logger.warning("Failed to write lead %s: %s", lead.name, error)
+        dead_letter_writes(self._dead_letters, [lead], error, self.name)
+
+    def _get_client(self) -> Client:
+        """The shared, pooled Notion client for this token."""
+        if self._client is None:
+            self._client = clients.notion(self._config, self._token, Client)
+        return self._client
 
     @staticmethod
     def _lead_to_properties(lead: Lead) -> dict:
@@ -120,3 +257,31 @@ class NotionWriter(LeadDestination):
             }
 
         return properties
+
+
+def _group_by_key(leads: list[Lead]) -> list[list[Lead]]:
+    """Leads grouped by dedup key, in input order; keyless leads each on their own."""
+    groups: dict[bytes, list[Lead]] = {}
+    keyless: list[list[Lead]] = []
+    for lead in leads:
+        key = lead.dedup_key()
+        if key is None:
+            keyless.append([lead])
+        else:
+            groups.setdefault(key, []).append(lead)
+    return [*groups.values(), *keyless]
+
+
+def _page_gone(error: Exception) -> bool:
+    """True if an update failed because the page was deleted or archived."""
+    status = getattr(error, "status", None)
+    return status == 404 or (status == 400 and "archived" in str(error))
+
+
+def _retry_after(error: Exception) -> float:
+    """Seconds from the error's ``Retry-After`` header, or 0."""
+    headers = getattr(error, "headers", None)
+    try:
+        return float(headers.get("retry-after") or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 
+from leadflow import clients
 from leadflow.models import Lead
 
 logger = logging.getLogger(__name__)
@@ -18,32 +19,40 @@ class SlackNotifier:
         self._webhook_env_var = slack_cfg.get("webhook_env_var", "SLACK_WEBHOOK_URL")
         self._channel = slack_cfg.get("channel", "#leads")
 
-    def notify(self, leads: list[Lead], stats: dict | None = None) -> bool:
-        """Send notification about new leads. Returns True on success."""
+    def notify(
+        self, leads: list[Lead], stats: dict | None = None, total: int | None = None
+    ) -> bool:
+        """Send notification about new leads. Returns True on success.
+
+        *total* is the number of new leads when *leads* is only a preview of
+        them (streaming runs); it defaults to ``len(leads)``.
+        """
         if not leads:
             logger.info("No leads to notify about")
             return True
 
+        if total is None:
+            total = len(leads)
         if self._mock_mode:
-            return self._mock_notify(leads, stats)
-        return self._slack_notify(leads, stats)
+            return self._mock_notify(leads, stats, total)
+        return self._slack_notify(leads, stats, total)
 
-    def _mock_notify(self, leads: list[Lead], stats: dict | None = None) -> bool:
+    def _mock_notify(self, leads: list[Lead], stats: dict | None, total: int) -> bool:
         """Print notification to console."""
         logger.info("--- Slack Notification (mock) ---")
         logger.info("Channel: %s", self._channel)
-        logger.info("New leads: %d", len(leads))
+        logger.info("New leads: %d", total)
         for lead in leads[:5]:  # show first 5
             tags_str = ", ".join(lead.tags) if lead.tags else "no tags"
             logger.info("  • %s (%s) [%s]", lead.name, lead.company, tags_str)
-        if len(leads) > 5:
-            logger.info("  ... and %d more", len(leads) - 5)
+        if total > 5:
+            logger.info("  ... and %d more", total - 5)
         if stats:
             logger.info("Pipeline stats: %s", stats)
         logger.info("--- End Notification ---")
         return True
 
-    def _slack_notify(self, leads: list[Lead], stats: dict | None = None) -> bool:
+    def _slack_notify(self, leads: list[Lead], stats: dict | None, total: int) -> bool:
         """Send Block Kit message via Slack webhook."""
         webhook_url = os.getenv(self._webhook_env_var)
         if not webhook_url:
@@ -51,14 +60,12 @@ class SlackNotifier:
             return False
 
         try:
-            import requests
-
             blocks = [
                 {
                     "type": "header",
                     "text": {
                         "type": "plain_text",
-                        "text": f"🎯 {len(leads)} New Leads Processed",
+                        "text": f"🎯 {total} New Leads Processed",
                     },
                 },
             ]
@@ -86,7 +93,9 @@ class SlackNotifier:
                 })
 
             payload = {"blocks": blocks}
-            resp = requests.post(webhook_url, json=payload, timeout=10)
+            session = clients.requests_session(self._config, "slack")
+            timeout = clients.settings(self._config, "slack")["timeout_seconds"]
+            resp = session.post(webhook_url, json=payload, timeout=timeout)
             resp.raise_for_status()
             logger.info("Slack notification sent successfully")
             return True
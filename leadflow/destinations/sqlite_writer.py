@@ -0,0 +1,177 @@
+"""SQLite destination — a local, queryable lead store.
+
+Leads are upserted by dedup key (leads without one are always inserted) in
+one transaction per write, with ``executemany`` over ``batch_rows`` rows at
+a time. The database runs in WAL mode, so readers — ad-hoc queries, or
+``existing_leads`` seeding the next run's dedup — never block the writer.
+Indexes on dedup key, email and company keep lookups fast.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Iterator
+
+from leadflow import metrics
+from leadflow.dead_letter import dead_letter_store_from_config, dead_letter_writes
+from leadflow.destinations.base import LeadDestination
+from leadflow.models import Lead
+from leadflow.registry import register_destination
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "output/leads.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    id INTEGER PRIMARY KEY,
+    dedup_key BLOB,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    company TEXT NOT NULL,
+    source TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    status TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    raw_data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS leads_by_dedup_key ON leads (dedup_key);
+CREATE INDEX IF NOT EXISTS leads_by_email ON leads (email);
+CREATE INDEX IF NOT EXISTS leads_by_company ON leads (company);
+"""
+
+_UPSERT = """
+INSERT INTO leads
+    (dedup_key, name, email, phone, company, source, notes, summary, tags, status, ingested_at, raw_data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (dedup_key) DO UPDATE SET
+    name = excluded.name,
+    email = excluded.email,
+    phone = excluded.phone,
+    company = excluded.company,
+    source = excluded.source,
+    notes = excluded.notes,
+    summary = excluded.summary,
+    tags = excluded.tags,
+    status = excluded.status,
+    ingested_at = excluded.ingested_at,
+    raw_data = excluded.raw_data
+"""
+
+
+def _row(lead: Lead) -> tuple:
+    return (
+        lead.dedup_key(), lead.name, lead.email, lead.phone, lead.company, lead.source,
+        lead.notes, lead.summary, json.dumps(lead.tags), lead.status, lead.ingested_at,
+        json.dumps(lead.get_raw_data(), default=str),
+    )
+
+
+def connect(path: str | Path) -> sqlite3.Connection:
+    """Open the lead store at *path* (created if missing) in WAL mode, autocommit."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Durable at checkpoints, not per commit; a crash can only lose the last writes
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+@register_destination("sqlite")
+class SqliteWriter(LeadDestination):
+    """Writes leads to a local SQLite database (``destinations.sqlite.path``)."""
+
+    def __init__(self, config: dict) -> None:
+        dest_cfg = config.get("destinations", {}).get("sqlite", {})
+        self.path = Path(dest_cfg.get("path", DEFAULT_PATH))
+        self._batch_rows = max(1, dest_cfg.get("batch_rows", 1000))
+        self._dead_letters = dead_letter_store_from_config(config)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "sqlite"
+
+    def write(self, leads: list[Lead]) -> int:
+        """Upsert leads in a single transaction. Returns number of leads written."""
+        if not leads:
+            logger.info("No leads to write")
+            return 0
+
+        for lead in leads:
+            lead.stamp_ingested()
+
+        rows = map(_row, leads)
+        try:
+            with self._lock, metrics.current().time("destination.sqlite.write"):
+                conn = self._get_conn()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    while batch := list(islice(rows, self._batch_rows)):
+                        conn.executemany(_UPSERT, batch)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.error("Failed to write leads to %s: %s", self.path, e)
+            dead_letter_writes(self._dead_letters, leads, e, self.name)
+            return 0
+
+        logger.info("Wrote %d leads to %s", len(leads), self.path)
+        return len(leads)
+
+    def existing_leads(self) -> Iterator[Lead]:
+        """Stream the stored leads' dedup features, for ``Pipeline.run(existing_leads=...)``."""
+        return existing_leads(self.path)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = connect(self.path)
+        return self._conn
+
+
+def existing_leads(path: str | Path, fetch_rows: int = 5000) -> Iterator[Lead]:
+    """Yield slim leads (name, email, phone, company) stored at *path*.
+
+    Only the columns dedup compares are read, *fetch_rows* at a time on a
+    separate read-only connection, so seeding a dedup index neither loads
+    whole rows nor blocks a concurrent writer. The dedup index consumes
+    the leads as they are read. A store that cannot be read (older schema,
+    still being created) is logged and yields what was read so far.
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(f"file:{Path(path)}?mode=ro", uri=True, timeout=30)
+        cursor = conn.execute("SELECT name, email, phone, company FROM leads")
+        while rows := cursor.fetchmany(fetch_rows):
+            for name, email, phone, company in rows:
+                yield Lead(name=name, email=email, phone=phone, company=company)
+    except sqlite3.Error as e:
+        logger.error("Failed to read stored leads from %s: %s", path, e)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def existing_leads_from_config(config: dict) -> Iterator[Lead] | None:
+    """Stored leads to dedup against, if ``destinations.sqlite.dedup_existing`` is on.
+
+    None when it is off or the database does not exist yet.
+    """
+    dest_cfg = config.get("destinations", {}).get("sqlite", {})
+    path = Path(dest_cfg.get("path", DEFAULT_PATH))
+    if not dest_cfg.get("dedup_existing", False) or not path.exists():
+        return None
+    return existing_leads(path)
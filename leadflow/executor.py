@@ -0,0 +1,106 @@
+"""Threaded stage execution — runs a chunk iterator ahead on a worker thread."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def in_current_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """Wrap *fn* to run in a copy of the caller's context.
+
+    Threads start with an empty context, so thread targets and pool tasks
+    are wrapped with this to keep recording into the run's active metrics.
+    Each call gets its own copy, so the wrapper can run on many threads at once.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+def run_ahead(items: Iterable[T], max_in_flight: int, name: str) -> Iterator[T]:
+    """Drive *items* on a worker thread and yield them through a bounded queue.
+
+    The worker stays at most *max_in_flight* items ahead of the consumer, so
+    a slow downstream stage applies back-pressure instead of letting chunks
+    pile up in memory. Exceptions raised by the upstream iterator are
+    re-raised in the consumer. Closing the returned generator stops the
+    worker at its next hand-off.
+    """
+    return merge_ahead([items], max_in_flight, name)
+
+
+def merge_ahead(sources: list[Iterable[T]], max_in_flight: int, name: str) -> Iterator[T]:
+    """Like ``run_ahead`` but drives each iterable on its own thread.
+
+    Items are yielded in arrival order, so a slow source never holds back a
+    fast one; at most *max_in_flight* items are buffered across all sources.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, max_in_flight))
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker(items: Iterable[T]) -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:  # re-raised on the consumer side
+            put(_Failure(e))
+            return
+        put(_DONE)
+
+    threads = [
+        threading.Thread(
+            target=in_current_context(worker), args=(items,), name=f"leadflow-{name}-{i}", daemon=True
+        )
+        for i, items in enumerate(sources)
+    ]
+
+    def consume() -> Iterator[T]:
+        # Threads start on first next(), so an unconsumed result leaks nothing
+        for thread in threads:
+            thread.start()
+        remaining = len(threads)
+        try:
+            while remaining:
+                item = buffer.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(item, _Failure):
+                    raise item.exc
+                yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=5)
+                if thread.is_alive():
+                    logger.warning("Stage thread %s did not stop within 5s", thread.name)
+
+    return consume()
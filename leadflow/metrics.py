@@ -0,0 +1,257 @@
+"""Lightweight run instrumentation — stage timings, counters and latency histograms.
+
+Components record into the active ``Metrics`` via ``current()``::
+
+    with metrics.current().time("claude.enrich"):
+        response = client.messages.create(...)
+    metrics.current().incr("claude.enrich.retries")
+
+``Pipeline.run`` activates a fresh instance per run and exposes it as
+``PipelineStats.metrics``; it can be exported as JSON or in the Prometheus
+text-file format. The active instance is held in a context variable, so
+concurrent runs in one process (threads, tests) each record into their
+own; worker threads inherit it through ``executor.in_current_context``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# Upper bounds in seconds, Prometheus-style (a final +Inf bucket is implied)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Samples kept per histogram for percentile estimates
+_RESERVOIR_SIZE = 2048
+
+
+@dataclass
+class StageTiming:
+    """Wall time of a stage, and CPU time of the thread that ran it.
+
+    ``cpu_seconds`` excludes work the stage hands to other threads (writer
+    pools, source readers, pipelined stages), so a stage that mostly waits
+    on its workers shows little CPU.
+    """
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    calls: int = 0
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with a reservoir sample for percentiles."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._samples: list[float] = []
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if len(self._samples) < _RESERVOIR_SIZE:
+            self._samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < _RESERVOIR_SIZE:
+                self._samples[slot] = value
+
+    def percentile(self, q: float) -> float:
+        """Estimate the *q*-th percentile (0-100) from the reservoir sample."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": round(self.percentile(50), 6),
+            "p95": round(self.percentile(95), 6),
+            "p99": round(self.percentile(99), 6),
+            "buckets": {
+                **{str(b): c for b, c in zip(self.buckets, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+
+class Metrics:
+    """Thread-safe collection of stage timings, counters and histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stages: dict[str, StageTiming] = {}
+        self.counters: dict[str, float] = {}
+        self.histograms: dict[str, Histogram] = {}
+        # Optional per-stage profiler (see leadflow.profiling), set by Pipeline.run
+        self.profiler = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Accumulate wall time and the calling thread's CPU time of the block under stage *name*."""
+        profiler = self.profiler
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            with profiler.stage(name) if profiler is not None else nullcontext():
+                yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            with self._lock:
+                timing = self.stages.setdefault(name, StageTiming())
+                timing.wall_seconds += wall
+                timing.cpu_seconds += cpu
+                timing.calls += 1
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Record the duration of the block in histogram *name*."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            hist.observe(value)
+
+    def incr(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "stages": {
+                    name: {
+                        "wall_seconds": round(t.wall_seconds, 6),
+                        "cpu_seconds": round(t.cpu_seconds, 6),
+                        "calls": t.calls,
+                    }
+                    for name, t in self.stages.items()
+                },
+                "counters": dict(self.counters),
+                "histograms": {name: h.to_dict() for name, h in self.histograms.items()},
+            }
+
+    def merge(self, data: dict) -> None:
+        """Add stage timings and counters from another run's ``to_dict()`` output.
+
+        Histograms are not merged: their percentile samples are not exported.
+        """
+        with self._lock:
+            for name, t in data.get("stages", {}).items():
+                timing = self.stages.setdefault(name, StageTiming())
+                timing.wall_seconds += t["wall_seconds"]
+                timing.cpu_seconds += t["cpu_seconds"]
+                timing.calls += t["calls"]
+            for name, value in data.get("counters", {}).items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_prometheus(self, prefix: str = "leadflow") -> str:
+        """Render in the Prometheus text exposition format (for node_exporter's textfile collector)."""
+        lines: list[str] = []
+        with self._lock:
+            if self.stages:
+                lines.append(f"# HELP {prefix}_stage_wall_seconds Wall time spent in the stage")
+                lines.append(f"# TYPE {prefix}_stage_wall_seconds gauge")
+                for name, t in self.stages.items():
+                    lines.append(f'{prefix}_stage_wall_seconds{{stage="{name}"}} {t.wall_seconds:.6f}')
+                lines.append(
+                    f"# HELP {prefix}_stage_cpu_seconds CPU time of the thread running the stage"
+                    " (excludes its worker threads)"
+                )
+                lines.append(f"# TYPE {prefix}_stage_cpu_seconds gauge")
+                for name, t in self.stages.items():
+                    lines.append(f'{prefix}_stage_cpu_seconds{{stage="{name}"}} {t.cpu_seconds:.6f}')
+
+            for name, value in sorted(self.counters.items()):
+                metric = f"{prefix}_{_metric_name(name)}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value:g}")
+
+            if self.histograms:
+                metric = f"{prefix}_call_latency_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                for name, h in sorted(self.histograms.items()):
+                    cumulative = 0
+                    for bound, count in zip(h.buckets, h.counts):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{call="{name}",le="{bound:g}"}} {cumulative}')
+                    lines.append(f'{metric}_bucket{{call="{name}",le="+Inf"}} {h.count}')
+                    lines.append(f'{metric}_sum{{call="{name}"}} {h.sum:.6f}')
+                    lines.append(f'{metric}_count{{call="{name}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory: str | Path) -> None:
+        """Write ``metrics.json`` and ``metrics.prom`` into *directory* atomically."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write(directory / "metrics.json", json.dumps(self.to_dict(), indent=2))
+        _atomic_write(directory / "metrics.prom", self.to_prometheus())
+
+
+def _metric_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def record_usage(prefix: str, response: object) -> None:
+    """Add a Claude response's token usage to ``<prefix>.input_tokens`` / ``.output_tokens``."""
+    usage = getattr(response, "usage", None)
+    for attr in ("input_tokens", "output_tokens"):
+        value = getattr(usage, attr, None)
+        if isinstance(value, int):
+            current().incr(f"{prefix}.{attr}", value)
+
+
+def record_ingest_latency(leads: Iterable, name: str = "ingest_to_write") -> None:
+    """Observe receive-to-written time for leads stamped with ``received_at``."""
+    now = time.time()
+    run_metrics = current()
+    for lead in leads:
+        if lead.received_at:
+            run_metrics.observe(name, now - lead.received_at)
+
+
+# Records made outside any run (e.g. a backend used on its own) land here
+_default = Metrics()
+_current: contextvars.ContextVar[Metrics] = contextvars.ContextVar("leadflow_metrics", default=_default)
+
+
+def current() -> Metrics:
+    """The Metrics instance of the active run in this context."""
+    return _current.get()
+
+
+def activate(metrics: Metrics) -> Metrics:
+    """Make *metrics* the active instance in this context. Returns the previously active one."""
+    previous = _current.get()
+    _current.set(metrics)
+    return previous
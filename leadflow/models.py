@@ -5,6 +5,18 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from leadflow.raw_store import RawRef, RawStore
+
+# Size in bytes of the binary dedup digest (blake2b, 128-bit).
+DEDUP_DIGEST_SIZE = 16
+
+
+def is_legacy_dedup_key(key: str | bytes) -> bool:
+    """True if *key* is a pre-blake2b MD5 hex key (as found in older stored data)."""
+    return isinstance(key, str) and len(key) == 32
 
 
 @dataclass
@@ -20,6 +32,11 @@ class Lead:
     status: str = "new"  # new | duplicate | enriched
     ingested_at: str = ""
     raw_data: dict = field(default_factory=dict)
+    raw_ref: RawRef | None = field(default=None, repr=False, compare=False)
+    # Epoch seconds the lead reached a push source (webhook); 0 for pulled leads
+    received_at: float = field(default=0.0, repr=False, compare=False)
+    # (email, phone, key) the cached dedup key was computed from
+    _dedup_cache: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         return {
@@ -33,11 +50,55 @@ class Lead:
             "tags": self.tags,
             "status": self.status,
             "ingested_at": self.ingested_at,
-            "raw_data": self.raw_data,
+            "raw_data": self.get_raw_data(),
         }
 
-    def dedup_key(self) -> str | None:
-        """MD5 hash of email + phone for exact dedup. Returns None if both are empty."""
+    @classmethod
+    def from_dict(cls, data: dict) -> Lead:
+        """Inverse of ``to_dict``. Missing keys fall back to field defaults."""
+        return cls(
+            name=data.get("name", ""),
+            email=data.get("email", ""),
+            phone=data.get("phone", ""),
+            company=data.get("company", ""),
+            source=data.get("source", ""),
+            notes=data.get("notes", ""),
+            summary=data.get("summary", ""),
+            tags=list(data.get("tags") or []),
+            status=data.get("status", "new"),
+            ingested_at=data.get("ingested_at", ""),
+            raw_data=dict(data.get("raw_data") or {}),
+        )
+
+    def get_raw_data(self) -> dict:
+        """Raw source row, loaded from the side store if it was spilled."""
+        if self.raw_ref is not None:
+            return self.raw_ref.load()
+        return self.raw_data
+
+    def spill_raw(self, store: RawStore) -> None:
+        """Move ``raw_data`` into *store*, keeping only a lazy handle on the lead."""
+        if self.raw_data:
+            self.raw_ref = store.put(self.raw_data)
+            self.raw_data = {}
+
+    def dedup_key(self) -> bytes | None:
+        """16-byte blake2b digest of email + phone for exact dedup.
+
+        Returns None if both are empty. The key is computed once and reused
+        until ``email`` or ``phone`` is reassigned.
+        """
+        email, phone = self.email, self.phone
+        cache = self._dedup_cache
+        if cache is not None and cache[0] is email and cache[1] is phone:
+            return cache[2]
+
+        key = _dedup_digest(email, phone)
+        self._dedup_cache = (email, phone, key)
+        return key
+
+    def legacy_dedup_key(self) -> str | None:
+        """MD5 hex key used before the binary digest; for matching older stored keys."""
         email = self.email.strip().lower()
         phone = self.phone.strip()
         if not email and not phone:
@@ -45,5 +106,20 @@ class Lead:
         raw = f"{email}|{phone}"
         return hashlib.md5(raw.encode()).hexdigest()
 
+    def matches_dedup_key(self, key: str | bytes) -> bool:
+        """Compare against a stored key in either the current or legacy format."""
+        if is_legacy_dedup_key(key):
+            return self.legacy_dedup_key() == key
+        return self.dedup_key() == key
+
     def stamp_ingested(self) -> None:
         self.ingested_at = datetime.now(timezone.utc).isoformat()
+
+
+def _dedup_digest(email: str, phone: str) -> bytes | None:
+    email = email.strip().lower()
+    phone = phone.strip()
+    if not email and not phone:
+        return None
+    raw = f"{email}|{phone}"
+    return hashlib.blake2b(raw.encode(), digest_size=DEDUP_DIGEST_SIZE).digest()
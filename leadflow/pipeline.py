@@ -3,19 +3,42 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
 
+from leadflow import metrics
+from leadflow.checkpoint import RunCheckpoint, new_run_id
+from leadflow.dead_letter import (
+    DEAD_LETTERED,
+    DeadLetter,
+    dead_letter_store_from_config,
+    deferred_writes,
+    record_writes,
+)
 from leadflow.destinations.base import LeadDestination
+from leadflow.destinations.fanout import FanOut, write_with_retry
 from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.executor import run_ahead
+from leadflow.metrics import Metrics
 from leadflow.models import Lead
-from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.deduplicator import DedupIndex, Deduplicator
 from leadflow.processing.enricher import Enricher
 from leadflow.processing.normalizer import normalize_lead
+from leadflow.profiling import Profiler
 from leadflow.sources.base import LeadSource
+from leadflow.work_queue import WorkQueue
 
 logger = logging.getLogger(__name__)
 
+# Leads kept for the notification preview in streaming runs
+NOTIFY_PREVIEW_SIZE = 10
+
+# Chunk size used when pipelined execution is enabled without one
+DEFAULT_CHUNK_SIZE = 500
+
 
 @dataclass
 class PipelineStats:
@@ -25,8 +48,14 @@ class PipelineStats:
     duplicates: int = 0
     enriched: int = 0
     written: int = 0
+    written_by_destination: dict[str, int] = field(default_factory=dict)
+    dead_lettered: int = 0
     notified: bool = False
     duration_seconds: float = 0.0
+    run_id: str = ""
+    metrics: Metrics = field(default_factory=Metrics, repr=False, compare=False)
+    profile: Profiler | None = field(default=None, repr=False, compare=False)
+    profile_dir: str = ""
 
     def to_dict(self) -> dict:
         return {
@@ -40,6 +69,37 @@ class PipelineStats:
             "duration_seconds": round(self.duration_seconds, 2),
         }
 
+    def to_report(self) -> dict:
+        """Everything a distributed worker reports for one chunk (JSON-safe)."""
+        snapshot = self.metrics.to_dict()
+        return {
+            **self.to_dict(),
+            "written_by_destination": self.written_by_destination,
+            "dead_lettered": self.dead_lettered,
+            "stages": snapshot["stages"],
+            "counters": snapshot["counters"],
+        }
+
+    @classmethod
+    def from_reports(cls, run_id: str, coordinator: dict, reports: list[dict]) -> PipelineStats:
+        """Aggregate the coordinator's counts and every worker's chunk reports."""
+        stats = cls(
+            run_id=run_id,
+            fetched=coordinator.get("fetched", 0),
+            normalized=coordinator.get("normalized", 0),
+            unique=coordinator.get("unique", 0),
+            duplicates=coordinator.get("duplicates", 0),
+        )
+        stats.metrics.merge(coordinator)
+        for report in reports:
+            stats.enriched += report["enriched"]
+            stats.written += report["written"]
+            stats.dead_lettered += report["dead_lettered"]
+            for label, count in report["written_by_destination"].items():
+                stats.written_by_destination[label] = stats.written_by_destination.get(label, 0) + count
+            stats.metrics.merge(report)
+        return stats
+
 
 class Pipeline:
     def __init__(
@@ -47,26 +107,124 @@ class Pipeline:
         source: LeadSource,
         deduplicator: Deduplicator,
         enricher: Enricher,
-        writer: LeadDestination,
+        writer: LeadDestination | list[LeadDestination],
         notifier: SlackNotifier,
         config: dict,
     ) -> None:
         self._source = source
         self._deduplicator = deduplicator
         self._enricher = enricher
-        self._writer = writer
+        self._writers = list(writer) if isinstance(writer, (list, tuple)) else [writer]
         self._notifier = notifier
         self._config = config
         self._dry_run = config.get("dry_run", False)
+        pipeline_cfg = config.get("pipeline", {})
+        self._chunk_size = pipeline_cfg.get("chunk_size", 0)
+        self._pipelined = pipeline_cfg.get("pipelined", False)
+        self._max_in_flight = pipeline_cfg.get("max_in_flight", 2)
+        if self._pipelined and not self._chunk_size:
+            self._chunk_size = DEFAULT_CHUNK_SIZE
+        self._keep_dedup_index = pipeline_cfg.get("keep_dedup_index", False)
+        self._max_index_entries = pipeline_cfg.get("max_dedup_index_entries", 1_000_000)
+        self._warm_index: DedupIndex | None = None
+        # Leads written during the current run, merged into the warm index at its end
+        self._written_index: DedupIndex | None = None
+        self._written_lock = threading.Lock()
+        self._metrics_dir = config.get("metrics", {}).get("export_dir", "")
+        checkpoint_cfg = config.get("checkpoint", {})
+        self._checkpoint_enabled = checkpoint_cfg.get("enabled", False)
+        self._checkpoint_dir = checkpoint_cfg.get("dir", "output/runs")
+        self._checkpoint_chunk_size = checkpoint_cfg.get("chunk_size", 50)
+        self._dead_letters = dead_letter_store_from_config(config)
+        self._queue_chunk_size = config.get("distributed", {}).get("chunk_size", 50)
+        profiling_cfg = config.get("profiling", {})
+        self._profile = profiling_cfg.get("enabled", False)
+        self._profile_dir = profiling_cfg.get("dir", "output/profiles")
+        self._profile_top = profiling_cfg.get("top", 10)
+        dest_cfg = config.get("destinations", {})
+        self._write_retries = dest_cfg.get("retries", 2)
+        self._write_backoff = dest_cfg.get("retry_backoff", 1.0)
+        self._fanout: FanOut | None = None
+        if len(self._writers) > 1:
+            self._fanout = FanOut(
+                self._writers,
+                max_pending=dest_cfg.get("max_pending_chunks", 4),
+                retries=self._write_retries,
+                backoff=self._write_backoff,
+            )
+
+    def run(
+        self,
+        existing_leads: Iterable[Lead] | None = None,
+        resume_run_id: str | None = None,
+    ) -> PipelineStats:
+        """Execute the full pipeline. Returns stats.
 
-    def run(self, existing_leads: list[Lead] | None = None) -> PipelineStats:
-        """Execute the full pipeline. Returns stats."""
+        With ``checkpoint.enabled`` (or a *resume_run_id*), stage outputs are
+        persisted under ``checkpoint.dir`` and a resumed run continues after
+        the last completed stage or chunk. Checkpointing takes precedence
+        over ``chunk_size``/``pipelined``; the run directory is deleted once
+        the run completes.
+
+        With ``pipeline.chunk_size`` set, leads stream through every stage in
+        fixed-size chunks instead of being materialized per stage. With
+        ``pipeline.pipelined`` the stages also overlap on worker threads.
+
+        Stage timings and call latencies are collected in ``stats.metrics``
+        and exported to ``metrics.export_dir`` when configured. With
+        ``profiling.enabled`` every stage is also profiled and the artifacts
+        are written under ``profiling.dir``.
+        """
         stats = PipelineStats()
+        if self._profile:
+            stats.profile = stats.metrics.profiler = Profiler(self._profile_top)
+            stats.profile.start()
+        previous = metrics.activate(stats.metrics)
+        try:
+            if self._checkpoint_enabled or resume_run_id:
+                if resume_run_id:
+                    checkpoint = RunCheckpoint.resume(self._checkpoint_dir, resume_run_id)
+                else:
+                    checkpoint = RunCheckpoint(self._checkpoint_dir)
+                if self._chunk_size:
+                    logger.warning(
+                        "Checkpointed runs ignore pipeline.chunk_size/pipelined; "
+                        "enriching and writing in chunks of %d (checkpoint.chunk_size)",
+                        self._checkpoint_chunk_size,
+                    )
+                self._run_checkpointed(existing_leads, stats, checkpoint)
+                checkpoint.remove()
+            elif self._chunk_size:
+                self._run_streaming(existing_leads, stats)
+            else:
+                self._run_batch(existing_leads, stats)
+        finally:
+            self._finish_writes()
+            metrics.activate(previous)
+            self._merge_written()
+            if stats.profile is not None:
+                stats.profile.stop()
+
+        # Duck-typed sources without sync state may not define commit()
+        commit = getattr(self._source, "commit", None)
+        if commit is not None and not self._dry_run:
+            commit()
+        if self._metrics_dir:
+            stats.metrics.export(self._metrics_dir)
+            logger.info("Metrics exported to %s", self._metrics_dir)
+        if stats.profile is not None:
+            run_dir = Path(self._profile_dir) / (stats.run_id or new_run_id())
+            stats.profile_dir = str(stats.profile.write(run_dir))
+        return stats
+
+    def _run_batch(self, existing_leads: Iterable[Lead] | None, stats: PipelineStats) -> PipelineStats:
+        timer = stats.metrics
         start = time.time()
 
         # Step 1: Fetch
         logger.info("Step 1/6: Fetching leads from %s", self._source.name)
-        raw_leads = self._source.fetch()
+        with timer.stage("fetch"):
+            raw_leads = self._source.fetch()
         stats.fetched = len(raw_leads)
         logger.info("Fetched %d leads", stats.fetched)
 
@@ -77,13 +235,17 @@ class Pipeline:
 
         # Step 2: Normalize
         logger.info("Step 2/6: Normalizing leads")
-        normalized = [normalize_lead(lead) for lead in raw_leads]
+        with timer.stage("normalize"):
+            normalized = [normalize_lead(lead) for lead in raw_leads]
         stats.normalized = len(normalized)
         logger.info("Normalized %d leads", stats.normalized)
 
         # Step 3: Deduplicate
         logger.info("Step 3/6: Deduplicating leads")
-        unique, duplicates = self._deduplicator.deduplicate(normalized, existing_leads)
+        with timer.stage("dedup"):
+            unique, duplicates = self._deduplicator.deduplicate_chunk(
+                normalized, self._dedup_index(existing_leads)
+            )
         stats.unique = len(unique)
         stats.duplicates = len(duplicates)
         logger.info("Dedup: %d unique, %d duplicates", stats.unique, stats.duplicates)
@@ -95,16 +257,19 @@ class Pipeline:
 
         # Step 4: Enrich
         logger.info("Step 4/6: Enriching leads")
-        enriched = self._enricher.enrich(unique)
+        with timer.stage("enrich"):
+            enriched = self._enricher.enrich(unique)
         stats.enriched = len([l for l in enriched if l.status == "enriched"])
         logger.info("Enriched %d leads", stats.enriched)
+        enriched = self._writable(enriched, stats)
 
         # Step 5: Write
         if self._dry_run:
             logger.info("Step 5/6: SKIPPED (dry run)")
         else:
-            logger.info("Step 5/6: Writing to %s", self._writer.name)
-            stats.written = self._writer.write(enriched)
+            logger.info("Step 5/6: Writing to %s", self._writer_names)
+            with timer.stage("write"):
+                stats.written = self._write(enriched, stats)
             logger.info("Wrote %d leads", stats.written)
 
         # Step 6: Notify
@@ -112,8 +277,458 @@ class Pipeline:
             logger.info("Step 6/6: SKIPPED (dry run)")
         else:
             logger.info("Step 6/6: Sending notifications")
-            stats.notified = self._notifier.notify(enriched, stats.to_dict())
+            with timer.stage("notify"):
+                stats.notified = self._notifier.notify(enriched, stats.to_dict())
 
         stats.duration_seconds = time.time() - start
         logger.info("Pipeline complete in %.2fs", stats.duration_seconds)
         return stats
+
+    def _run_streaming(self, existing_leads: Iterable[Lead] | None, stats: PipelineStats) -> PipelineStats:
+        """Run every stage over fixed-size chunks with one chunk in flight per stage.
+
+        Memory is bounded by the chunk size plus the dedup index, which keeps
+        only keys and slim name/contact copies of accepted leads.
+
+        When pipelined, fetch+normalize+dedup and enrichment each run on their
+        own thread, connected by queues of at most ``max_in_flight`` chunks,
+        so chunk N is enriched while chunk N-1 is being written.
+        """
+        start = time.time()
+        logger.info(
+            "Streaming from %s in chunks of %d leads%s",
+            self._source.name,
+            self._chunk_size,
+            " (pipelined)" if self._pipelined else "",
+        )
+
+        index = self._dedup_index(existing_leads)
+        fetched = self._fetch_stage(stats, self._chunk_size)
+        chunks = self._dedup_stage(self._normalize_stage(fetched, stats), stats, index)
+        if self._pipelined:
+            chunks = run_ahead(chunks, self._max_in_flight, "dedup")
+        chunks = self._enrich_stage(chunks, stats)
+        if self._pipelined:
+            chunks = run_ahead(chunks, self._max_in_flight, "enrich")
+        preview = self._write_stage(chunks, stats)
+
+        if stats.fetched == 0:
+            logger.info("No leads fetched, pipeline complete")
+        elif stats.unique == 0:
+            logger.info("All leads were duplicates, pipeline complete")
+        elif self._dry_run:
+            logger.info("Write and notify SKIPPED (dry run)")
+        else:
+            with stats.metrics.stage("notify"):
+                stats.notified = self._notifier.notify(preview, stats.to_dict(), total=stats.unique)
+
+        stats.duration_seconds = time.time() - start
+        logger.info("Pipeline complete in %.2fs", stats.duration_seconds)
+        return stats
+
+    def _run_checkpointed(
+        self, existing_leads: Iterable[Lead] | None, stats: PipelineStats, checkpoint: RunCheckpoint
+    ) -> PipelineStats:
+        """Batch run that persists each stage, enriching and writing chunk by chunk.
+
+        Completed stages are loaded from the checkpoint instead of recomputed;
+        chunks already written are skipped and chunks already enriched are
+        written without calling Claude again.
+        """
+        timer = stats.metrics
+        start = time.time()
+        stats.run_id = checkpoint.run_id
+        logger.info("Run %s checkpointing to %s", checkpoint.run_id, checkpoint.path)
+
+        info = checkpoint.stage_info("normalized")
+        if info is not None:
+            normalized = checkpoint.load_stage("normalized")
+            stats.fetched = info["fetched"]
+            logger.info("Resumed %d normalized leads from checkpoint", len(normalized))
+        else:
+            logger.info("Fetching and normalizing leads from %s", self._source.name)
+            with timer.stage("fetch"):
+                raw_leads = self._source.fetch()
+            stats.fetched = len(raw_leads)
+            with timer.stage("normalize"):
+                normalized = [normalize_lead(lead) for lead in raw_leads]
+            checkpoint.complete_stage("normalized", normalized, fetched=stats.fetched)
+        stats.normalized = len(normalized)
+
+        if not normalized:
+            logger.info("No leads fetched, pipeline complete")
+            stats.duration_seconds = time.time() - start
+            return stats
+
+        info = checkpoint.stage_info("unique")
+        if info is not None:
+            unique = checkpoint.load_stage("unique")
+            stats.duplicates = info["duplicates"]
+            logger.info("Resumed %d unique leads from checkpoint", len(unique))
+        else:
+            logger.info("Deduplicating leads")
+            with timer.stage("dedup"):
+                unique, duplicates = self._deduplicator.deduplicate_chunk(
+                    normalized, self._dedup_index(existing_leads)
+                )
+            stats.duplicates = len(duplicates)
+            checkpoint.complete_stage(
+                "unique", unique, duplicates=stats.duplicates, chunk_size=self._checkpoint_chunk_size
+            )
+        stats.unique = len(unique)
+        del normalized
+
+        if not unique:
+            logger.info("All leads were duplicates, pipeline complete")
+            stats.duration_seconds = time.time() - start
+            return stats
+
+        # Resumed chunks keep the boundaries of the interrupted run
+        size = checkpoint.stage_info("unique").get("chunk_size", self._checkpoint_chunk_size)
+        written_keys = checkpoint.written_keys()
+        preview: list[Lead] = []
+        for index, offset in enumerate(range(0, len(unique), size)):
+            status = checkpoint.chunk_status(index)
+            if "enriched" in status:
+                chunk = checkpoint.load_enriched_chunk(index)
+            else:
+                with timer.stage("enrich"):
+                    chunk = self._enricher.enrich(unique[offset : offset + size])
+                enriched = len([l for l in chunk if l.status == "enriched"])
+                checkpoint.save_enriched_chunk(index, chunk, enriched)
+                status = checkpoint.chunk_status(index)
+            stats.enriched += status["enriched"]
+            chunk = self._writable(chunk, stats)
+
+            if not self._dry_run:
+                if "written" in status:
+                    stats.written += status["written"]
+                else:
+                    if status.get("writing"):
+                        logger.warning(
+                            "Chunk %d was interrupted mid-write; leads it wrote before are written again", index
+                        )
+                    # Leads recorded as written (e.g. just before a crash) are not written twice
+                    pending = [lead for lead in chunk if lead.dedup_key() not in written_keys]
+                    checkpoint.begin_chunk_write(index)
+                    with timer.stage("write"):
+                        written = self._write(pending, stats) if pending else 0
+                    written += len(chunk) - len(pending)
+                    checkpoint.mark_chunk_written(index, written, pending)
+                    stats.written += written
+
+            room = NOTIFY_PREVIEW_SIZE - len(preview)
+            if room > 0:
+                preview.extend(chunk[:room])
+
+        if self._dry_run:
+            logger.info("Write and notify SKIPPED (dry run)")
+        elif checkpoint.stage_info("notified") is None:
+            with timer.stage("notify"):
+                stats.notified = self._notifier.notify(preview, stats.to_dict(), total=stats.unique)
+            checkpoint.complete_stage("notified", notified=stats.notified)
+        else:
+            stats.notified = checkpoint.stage_info("notified")["notified"]
+
+        stats.duration_seconds = time.time() - start
+        logger.info("Run %s complete in %.2fs", checkpoint.run_id, stats.duration_seconds)
+        return stats
+
+    def enqueue(self, queue: WorkQueue, existing_leads: Iterable[Lead] | None = None) -> PipelineStats:
+        """Coordinator half of a distributed run: fetch, normalize and dedup, then enqueue.
+
+        Unique leads are queued in chunks of ``distributed.chunk_size`` for
+        workers to enrich and write (see ``leadflow.worker``). The returned
+        stats carry the queue's ``run_id``.
+        """
+        stats = PipelineStats(run_id=new_run_id())
+        start = time.time()
+        queue.start_run(stats.run_id)
+        previous = metrics.activate(stats.metrics)
+        try:
+            index = self._dedup_index(existing_leads)
+            fetched = self._fetch_stage(stats, self._queue_chunk_size)
+            chunks = 0
+            for chunk in self._dedup_stage(self._normalize_stage(fetched, stats), stats, index):
+                with stats.metrics.stage("enqueue"):
+                    queue.enqueue(stats.run_id, chunk)
+                chunks += 1
+        finally:
+            metrics.activate(previous)
+        stats.duration_seconds = time.time() - start
+        queue.set_run_stats(stats.run_id, **stats.to_report())
+
+        # Queued leads are durable, so the source can advance its watermark now
+        commit = getattr(self._source, "commit", None)
+        if commit is not None and not self._dry_run:
+            commit()
+        logger.info(
+            "Run %s: queued %d unique leads in %d chunks (%d duplicates) to %s",
+            stats.run_id,
+            stats.unique,
+            chunks,
+            stats.duplicates,
+            queue.path,
+        )
+        return stats
+
+    def process_chunk(self, leads: list[Lead]) -> PipelineStats:
+        """Worker half of a distributed run: enrich and write one queued chunk in place."""
+        stats = PipelineStats(unique=len(leads))
+        start = time.time()
+        previous = metrics.activate(stats.metrics)
+        try:
+            self._write_stage(self._enrich_stage([leads], stats), stats)
+        finally:
+            self._finish_writes()
+            metrics.activate(previous)
+        stats.duration_seconds = time.time() - start
+        return stats
+
+    def finish_distributed(self, queue: WorkQueue, run_id: str) -> PipelineStats:
+        """Aggregate a finished distributed run and send its notification."""
+        coordinator, reports = queue.run_stats(run_id)
+        stats = PipelineStats.from_reports(run_id, coordinator, reports)
+        # Wall time from enqueue until the last worker finished (or now)
+        stats.duration_seconds = time.time() - coordinator["created_at"]
+        if stats.unique and not self._dry_run:
+            with stats.metrics.stage("notify"):
+                preview = queue.preview(run_id, NOTIFY_PREVIEW_SIZE)
+                stats.notified = self._notifier.notify(preview, stats.to_dict(), total=stats.unique)
+        return stats
+
+    def retry_dead_letters(self, limit: int | None = None) -> PipelineStats:
+        """Reprocess only the due entries of the dead-letter store.
+
+        Enrichment failures are enriched again and written to every
+        destination; write failures are written again to the destination
+        that failed. Entries that fail again stay in the store with a longer
+        backoff, the rest are removed. ``stats.fetched`` is the number of
+        entries retried and ``stats.dead_lettered`` what is left afterwards.
+        """
+        stats = PipelineStats()
+        if self._dead_letters is None:
+            logger.debug("Dead-letter store disabled, nothing to retry")
+            return stats
+        store = self._dead_letters
+        start = time.time()
+        previous = metrics.activate(stats.metrics)
+        try:
+            entries = store.due(limit=limit)
+            stats.fetched = len(entries)
+            if entries:
+                logger.info("Retrying %d dead-lettered leads", len(entries))
+            resolved: list[DeadLetter] = []
+
+            retry_enrich = [entry for entry in entries if entry.stage == "enrich"]
+            if retry_enrich:
+                with stats.metrics.stage("enrich"):
+                    self._enricher.enrich([entry.lead for entry in retry_enrich])
+                enriched = [entry for entry in retry_enrich if entry.lead.status == "enriched"]
+                stats.enriched = len(enriched)
+                if enriched and not self._dry_run:
+                    leads = [entry.lead for entry in enriched]
+                    with stats.metrics.stage("write"), deferred_writes() as failed:
+                        written = self._write(leads, stats)
+                    record_writes(failed)
+                    stats.written += written
+                    # Leads a destination dead-lettered are now retried as write
+                    # failures for that destination. If every lead was written or
+                    # dead-lettered, the enrichment entries are done; otherwise
+                    # some leads were dropped unseen and all entries are kept.
+                    unwritten = {id(lead) for _, group, _, _ in failed for lead in group}
+                    if written == len(leads) or written + len(unwritten) >= len(leads):
+                        resolved.extend(enriched)
+
+            by_target: dict[str, list[DeadLetter]] = {}
+            for entry in entries:
+                if entry.stage == "write":
+                    by_target.setdefault(entry.target, []).append(entry)
+            writers = {writer.name: writer for writer in self._writers}
+            for target, group in by_target.items():
+                writer = writers.get(target)
+                if writer is None:
+                    logger.warning("Destination %s not configured, keeping %d dead letters", target, len(group))
+                    continue
+                if self._dry_run:
+                    continue
+                with stats.metrics.stage("write"):
+                    written = writer.write([entry.lead for entry in group])
+                stats.written += written
+                stats.written_by_destination[target] = stats.written_by_destination.get(target, 0) + written
+                if written:
+                    resolved.extend(group)
+                if written == len(group):
+                    self._remember([entry.lead for entry in group])
+
+            # Entries that failed again during the retry are kept by resolve()
+            removed = store.resolve(resolved) if resolved else 0
+            stats.dead_lettered = store.count()
+        finally:
+            self._finish_writes()
+            metrics.activate(previous)
+            self._merge_written()
+
+        stats.duration_seconds = time.time() - start
+        if entries:
+            logger.info(
+                "Resolved %d of %d dead letters, %d left in %s",
+                removed,
+                len(entries),
+                stats.dead_lettered,
+                store.path,
+            )
+        return stats
+
+    def _writable(self, leads: list[Lead], stats: PipelineStats) -> list[Lead]:
+        """Hold back leads whose enrichment was dead-lettered; a retry writes them once enriched."""
+        writable = [lead for lead in leads if lead.status != DEAD_LETTERED]
+        if len(writable) < len(leads):
+            stats.dead_lettered += len(leads) - len(writable)
+            logger.info("Holding back %d dead-lettered leads", len(leads) - len(writable))
+        return writable
+
+    def _dedup_index(self, existing_leads: Iterable[Lead] | None) -> DedupIndex:
+        """Fresh index per run, or a view of one kept warm across runs when ``keep_dedup_index`` is set.
+
+        The warm index is seeded from *existing_leads* on the first run, and
+        rebuilt from them once it holds more than
+        ``pipeline.max_dedup_index_entries`` leads (0 = no limit); other runs
+        leave *existing_leads* unread. A run dedups against it through a
+        child index. Only leads written to every destination are added to
+        the warm index, at the end of the run, so leads that failed or were
+        dead-lettered are not dropped as duplicates when they come back.
+        """
+        if not self._keep_dedup_index:
+            return self._deduplicator.new_index(existing_leads)
+        warm = self._warm_index
+        if warm is not None and self._max_index_entries and len(warm) > self._max_index_entries:
+            if existing_leads is None:
+                logger.warning(
+                    "Dedup index holds %d leads and there are no stored leads to rebuild it from; "
+                    "starting over with an empty index",
+                    len(warm),
+                )
+            else:
+                logger.info("Dedup index holds %d leads, rebuilding it from the stored leads", len(warm))
+            warm = None
+        if warm is None:
+            warm = self._warm_index = self._deduplicator.new_index(existing_leads)
+            self._merge_written()
+        return DedupIndex(parent=warm)
+
+    def _remember(self, leads: list[Lead]) -> None:
+        """Record leads written to every destination, for the warm dedup index."""
+        if not self._keep_dedup_index:
+            return
+        with self._written_lock:
+            if self._written_index is None:
+                self._written_index = DedupIndex()
+            for lead in leads:
+                self._written_index.add(lead)
+
+    def _merge_written(self) -> None:
+        """Add the leads written so far to the warm dedup index, once there is one."""
+        with self._written_lock:
+            if self._warm_index is None or self._written_index is None:
+                return
+            written, self._written_index = self._written_index, None
+        self._warm_index.merge(written)
+
+    @property
+    def _writer_names(self) -> str:
+        return ", ".join(writer.name for writer in self._writers)
+
+    def _finish_writes(self) -> None:
+        """Let destinations complete what they kept open across this run's writes."""
+        for writer in self._writers:
+            try:
+                writer.finish()
+            except Exception as e:
+                logger.error("Failed to finish writing to %s: %s", writer.name, e)
+
+    def _write(self, leads: list[Lead], stats: PipelineStats) -> int:
+        """Write *leads* to every destination; returns the count written to all of them."""
+        if self._fanout is None:
+            writer = self._writers[0]
+            counts = {writer.name: write_with_retry(writer, leads, self._write_retries, self._write_backoff)}
+        else:
+            counts = self._fanout.write_now(leads)
+        metrics.record_ingest_latency(leads)
+        for label, count in counts.items():
+            stats.written_by_destination[label] = stats.written_by_destination.get(label, 0) + count
+        written = min(counts.values())
+        if written == len(leads):
+            self._remember(leads)
+        return written
+
+    # -- streaming stages ---------------------------------------------------
+
+    def _fetch_stage(self, stats: PipelineStats, chunk_size: int) -> Iterator[list[Lead]]:
+        batches = self._source.iter_batches(chunk_size)
+        while True:
+            with stats.metrics.stage("fetch"):
+                chunk = next(batches, None)
+            if chunk is None:
+                return
+            stats.fetched += len(chunk)
+            logger.debug("Fetched chunk of %d leads (total %d)", len(chunk), stats.fetched)
+            yield chunk
+
+    def _normalize_stage(
+        self, chunks: Iterable[list[Lead]], stats: PipelineStats
+    ) -> Iterator[list[Lead]]:
+        for chunk in chunks:
+            with stats.metrics.stage("normalize"):
+                normalized = [normalize_lead(lead) for lead in chunk]
+            stats.normalized += len(normalized)
+            yield normalized
+
+    def _dedup_stage(
+        self, chunks: Iterable[list[Lead]], stats: PipelineStats, index: DedupIndex
+    ) -> Iterator[list[Lead]]:
+        for chunk in chunks:
+            with stats.metrics.stage("dedup"):
+                unique, duplicates = self._deduplicator.deduplicate_chunk(chunk, index)
+            stats.unique += len(unique)
+            stats.duplicates += len(duplicates)
+            if unique:
+                yield unique
+
+    def _enrich_stage(
+        self, chunks: Iterable[list[Lead]], stats: PipelineStats
+    ) -> Iterator[list[Lead]]:
+        for chunk in chunks:
+            with stats.metrics.stage("enrich"):
+                enriched = self._enricher.enrich(chunk)
+            stats.enriched += len([l for l in enriched if l.status == "enriched"])
+            enriched = self._writable(enriched, stats)
+            if enriched:
+                yield enriched
+
+    def _write_stage(self, chunks: Iterable[list[Lead]], stats: PipelineStats) -> list[Lead]:
+        """Write each chunk (unless dry run). Returns a preview for the notifier.
+
+        With several destinations each one drains its own queue, so a slow
+        destination does not hold back the others until it falls
+        ``destinations.max_pending_chunks`` chunks behind.
+        """
+        preview: list[Lead] = []
+        fanout = None if self._dry_run else self._fanout
+        try:
+            for chunk in chunks:
+                if fanout is not None:
+                    with stats.metrics.stage("write"):
+                        fanout.submit(chunk, self._remember)
+                elif not self._dry_run:
+                    with stats.metrics.stage("write"):
+                        stats.written += self._write(chunk, stats)
+                room = NOTIFY_PREVIEW_SIZE - len(preview)
+                if room > 0:
+                    preview.extend(chunk[:room])
+        finally:
+            if fanout is not None:
+                with stats.metrics.stage("write"):
+                    stats.written_by_destination = fanout.close()
+                stats.written = min(stats.written_by_destination.values())
+        return preview
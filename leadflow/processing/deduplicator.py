@@ -4,11 +4,104 @@ from __future__ import annotations
 
 import logging
 import time
+from typing import Iterable
 
-from leadflow.models import Lead
+from leadflow import metrics
+from leadflow.models import Lead, is_legacy_dedup_key
 
 logger = logging.getLogger(__name__)
 
+# Common titles/prefixes ignored when comparing names
+_NAME_STOPWORDS = {"dr.", "mr.", "ms.", "mrs.", "jr.", "sr.", "dr", "mr", "ms", "mrs"}
+
+
+def _name_tokens(lead: Lead) -> set[str]:
+    return set(lead.name.lower().split()) - _NAME_STOPWORDS
+
+
+class DedupIndex:
+    """Known dedup keys plus a name-token index of accepted leads.
+
+    The index keeps slim copies (name, email, phone, company) of accepted
+    leads so it can outlive the chunk they came from, and looks up fuzzy
+    candidates by shared name token instead of scanning every prior lead.
+
+    An index built with a *parent* also matches everything the parent
+    knows, but records new leads only in itself, so a run can dedup
+    against a long-lived index without changing it.
+    """
+
+    def __init__(self, parent: DedupIndex | None = None) -> None:
+        self.keys: set[bytes] = set()
+        self.legacy_keys: set[str] = set()
+        self._by_token: dict[str, list[tuple[int, Lead]]] = {}
+        self._seq = 0
+        # Leads known only by name, which no key counts
+        self._keyless = 0
+        self._parent = parent
+
+    def __len__(self) -> int:
+        """Leads known to this index itself (each counted once), not to its parent."""
+        return len(self.keys) + len(self.legacy_keys) + self._keyless
+
+    def add_key(self, key: str | bytes) -> None:
+        """Record a stored dedup key, in either the binary or legacy MD5 format."""
+        if is_legacy_dedup_key(key):
+            self.legacy_keys.add(key)
+        else:
+            self.keys.add(key)
+
+    def add(self, lead: Lead) -> None:
+        """Record *lead* as known, for both exact and fuzzy matching."""
+        key = lead.dedup_key()
+        if key:
+            self.keys.add(key)
+        tokens = _name_tokens(lead)
+        if not tokens:
+            return
+        if not key:
+            self._keyless += 1
+        entry = (
+            self._seq,
+            Lead(name=lead.name, email=lead.email, phone=lead.phone, company=lead.company),
+        )
+        self._seq += 1
+        for token in tokens:
+            self._by_token.setdefault(token, []).append(entry)
+
+    def merge(self, other: DedupIndex) -> None:
+        """Add everything *other* recorded itself (not its parent's entries)."""
+        self.keys |= other.keys
+        self.legacy_keys |= other.legacy_keys
+        for token, entries in other._by_token.items():
+            self._by_token.setdefault(token, []).extend(
+                (self._seq + seq, lead) for seq, lead in entries
+            )
+        self._seq += other._seq
+        self._keyless += other._keyless
+
+    def has_key(self, lead: Lead) -> bool:
+        """Exact match on email + phone against known keys."""
+        key = lead.dedup_key()
+        if not key:
+            return False
+        if key in self.keys:
+            return True
+        if self.legacy_keys and lead.legacy_dedup_key() in self.legacy_keys:
+            return True
+        return self._parent is not None and self._parent.has_key(lead)
+
+    def candidates(self, lead: Lead) -> list[Lead]:
+        """Known leads sharing at least one name token with *lead*, oldest first."""
+        seen: dict[int, Lead] = {}
+        for token in _name_tokens(lead):
+            for seq, candidate in self._by_token.get(token, ()):
+                seen[seq] = candidate
+        own = [seen[seq] for seq in sorted(seen)]
+        if self._parent is None:
+            return own
+        return self._parent.candidates(lead) + own
+
 
 class Deduplicator:
     def __init__(self, config: dict, claude_client=None) -> None:
@@ -21,41 +114,70 @@ class Deduplicator:
         self._client = claude_client
 
     def deduplicate(
-        self, incoming: list[Lead], existing: list[Lead] | None = None
+        self,
+        incoming: list[Lead],
+        existing: list[Lead] | None = None,
+        existing_keys: Iterable[str | bytes] | None = None,
     ) -> tuple[list[Lead], list[Lead]]:
-        """Returns (unique_leads, duplicate_leads)."""
-        if existing is None:
-            existing = []
+        """Returns (unique_leads, duplicate_leads).
 
-        # Build set of known dedup keys from existing leads
-        known_keys: set[str] = set()
-        for lead in existing:
-            key = lead.dedup_key()
-            if key:
-                known_keys.add(key)
+        *existing_keys* are stored dedup keys of leads that are not available
+        as full records. Legacy MD5 hex keys are accepted alongside binary ones.
+        """
+        index = self.new_index(existing, existing_keys)
+        unique, duplicates = self.deduplicate_chunk(incoming, index)
 
+        logger.info(
+            "Dedup: %d incoming → %d unique, %d duplicates",
+            len(incoming),
+            len(unique),
+            len(duplicates),
+        )
+        return unique, duplicates
+
+    def new_index(
+        self,
+        existing: Iterable[Lead] | None = None,
+        existing_keys: Iterable[str | bytes] | None = None,
+    ) -> DedupIndex:
+        """Build a DedupIndex seeded with existing leads and stored keys."""
+        index = DedupIndex()
+        for stored in existing_keys or ():
+            index.add_key(stored)
+        for lead in existing or ():
+            index.add(lead)
+        return index
+
+    def deduplicate_chunk(
+        self, incoming: list[Lead], index: DedupIndex
+    ) -> tuple[list[Lead], list[Lead]]:
+        """Dedup *incoming* against *index*, adding accepted leads to it.
+
+        Calling this once per chunk with the same index gives the same result
+        as a single ``deduplicate()`` call over the concatenated input.
+        """
         unique: list[Lead] = []
         duplicates: list[Lead] = []
+        run_metrics = metrics.current()
 
         for lead in incoming:
             # Stage 1: exact hash dedup
-            key = lead.dedup_key()
-            if key and key in known_keys:
+            if index.has_key(lead):
                 lead.status = "duplicate"
                 duplicates.append(lead)
+                run_metrics.incr("dedup.exact_duplicates")
                 logger.debug("Exact duplicate: %s (%s)", lead.name, lead.email)
                 continue
 
-            # Stage 2: fuzzy dedup against existing + already-accepted unique leads
+            # Stage 2: fuzzy dedup against existing + already-accepted unique
+            # leads that share at least one name token
             is_dup = False
-            candidates = existing + unique
-            for candidate in candidates:
-                if not self._has_shared_name_tokens(lead, candidate):
-                    continue
-                # Potential match — use fuzzy check
+            for candidate in index.candidates(lead):
+                run_metrics.incr("dedup.fuzzy_checks")
                 if self._fuzzy_check(lead, candidate):
                     lead.status = "duplicate"
                     duplicates.append(lead)
+                    run_metrics.incr("dedup.fuzzy_duplicates")
                     is_dup = True
                     logger.debug(
                         "Fuzzy duplicate: %s ~ %s", lead.name, candidate.name
@@ -63,27 +185,14 @@ class Deduplicator:
                     break
 
             if not is_dup:
-                if key:
-                    known_keys.add(key)
+                index.add(lead)
                 unique.append(lead)
 
-        logger.info(
-            "Dedup: %d incoming → %d unique, %d duplicates",
-            len(incoming),
-            len(unique),
-            len(duplicates),
-        )
         return unique, duplicates
 
     def _has_shared_name_tokens(self, a: Lead, b: Lead) -> bool:
         """Pre-filter: do the two leads share at least one name token?"""
-        tokens_a = set(a.name.lower().split())
-        tokens_b = set(b.name.lower().split())
-        # Remove common titles/prefixes
-        stop = {"dr.", "mr.", "ms.", "mrs.", "jr.", "sr.", "dr", "mr", "ms", "mrs"}
-        tokens_a -= stop
-        tokens_b -= stop
-        return bool(tokens_a & tokens_b)
+        return bool(_name_tokens(a) & _name_tokens(b))
 
     def _fuzzy_check(self, a: Lead, b: Lead) -> bool:
         """Dispatch to real or mock fuzzy matching."""
@@ -94,11 +203,8 @@ class Deduplicator:
     def _mock_fuzzy_check(self, a: Lead, b: Lead) -> bool:
         """Heuristic fuzzy matching without API calls."""
         # Name token overlap ratio
-        tokens_a = set(a.name.lower().split())
-        tokens_b = set(b.name.lower().split())
-        stop = {"dr.", "mr.", "ms.", "mrs.", "jr.", "sr.", "dr", "mr", "ms", "mrs"}
-        tokens_a -= stop
-        tokens_b -= stop
+        tokens_a = _name_tokens(a)
+        tokens_b = _name_tokens(b)
         if not tokens_a or not tokens_b:
             return False
         overlap = len(tokens_a & tokens_b) / max(len(tokens_a), len(tokens_b))
@@ -136,16 +242,22 @@ class Deduplicator:
             f"Lead B: {b.name}, {b.email}, {b.phone}, {b.company}"
         )
 
+        run_metrics = metrics.current()
         for attempt in range(3):
+            if attempt:
+                run_metrics.incr("claude.dedup.retries")
             try:
-                response = self._client.messages.create(
-                    model=self._claude_model,
-                    max_tokens=self._max_tokens,
-                    messages=[{"role": "user", "content": prompt}],
-                )
+                with run_metrics.time("claude.dedup"):
+                    response = self._client.messages.create(
+                        model=self._claude_model,
+                        max_tokens=self._max_tokens,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                metrics.record_usage("claude.dedup", response)
                 answer = response.content[0].text.strip().upper()
                 return "SAME" in answer
             except Exception as e:
+                run_metrics.incr("claude.dedup.errors")
                 logger.warning("Claude fuzzy check attempt %d failed: %s", attempt + 1, e)
                 if attempt < 2:
                     time.sleep(2 ** attempt)
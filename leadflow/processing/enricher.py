@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
+import threading
 import time
+from collections import OrderedDict
 
+from leadflow import metrics
+from leadflow.dead_letter import DEAD_LETTERED, dead_letter_store_from_config
 from leadflow.models import Lead
 
 logger = logging.getLogger(__name__)
@@ -22,6 +27,11 @@ class Enricher:
         self._max_tokens = enrich_cfg.get("max_tokens", 1024)
         self._valid_tags = set(enrich_cfg.get("valid_tags", []))
         self._client = claude_client
+        # LRU of prompt-input hash → (summary, tags); 0 disables caching
+        self._cache_size = enrich_cfg.get("cache_size", 0)
+        self._cache: OrderedDict[bytes, tuple[str, list[str]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._dead_letters = dead_letter_store_from_config(config)
 
     def enrich(self, leads: list[Lead]) -> list[Lead]:
         """Enrich all leads, processing in batches."""
@@ -31,12 +41,49 @@ class Enricher:
         if self._mock_mode:
             return [self._mock_enrich_single(lead) for lead in leads]
 
-        enriched = []
-        for i in range(0, len(leads), self._batch_size):
-            batch = leads[i : i + self._batch_size]
-            enriched.extend(self._enrich_batch(batch))
-
-        return enriched
+        pending = leads
+        if self._cache_size:
+            pending = [lead for lead in leads if not self._apply_cached(lead)]
+            if len(pending) < len(leads):
+                metrics.current().incr("enrich.cache_hits", len(leads) - len(pending))
+
+        # Batches are enriched in place, so *leads* keeps its order with cache hits
+        for i in range(0, len(pending), self._batch_size):
+            batch = self._enrich_batch(pending[i : i + self._batch_size])
+            if self._cache_size:
+                self._remember(batch)
+
+        return leads
+
+    @staticmethod
+    def _cache_key(lead: Lead) -> bytes:
+        """Hash of the fields that go into the enrichment prompt."""
+        raw = f"{lead.name}\x1f{lead.company}\x1f{lead.notes}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+    def _apply_cached(self, lead: Lead) -> bool:
+        """Fill *lead* from the cache. Returns False on a miss."""
+        key = self._cache_key(lead)
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is None:
+                return False
+            self._cache.move_to_end(key)
+        lead.summary, tags = hit
+        lead.tags = list(tags)
+        lead.status = "enriched"
+        return True
+
+    def _remember(self, batch: list[Lead]) -> None:
+        with self._cache_lock:
+            for lead in batch:
+                if lead.status != "enriched":
+                    continue
+                key = self._cache_key(lead)
+                self._cache[key] = (lead.summary, list(lead.tags))
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
     def _mock_enrich_single(self, lead: Lead) -> Lead:
         """Keyword-based mock enrichment."""
@@ -121,13 +168,19 @@ class Enricher:
             f"{leads_text}"
         )
 
+        run_metrics = metrics.current()
+        error = ""
         for attempt in range(3):
+            if attempt:
+                run_metrics.incr("claude.enrich.retries")
             try:
-                response = self._client.messages.create(
-                    model=self._claude_model,
-                    max_tokens=self._max_tokens,
-                    messages=[{"role": "user", "content": prompt}],
-                )
+                with run_metrics.time("claude.enrich"):
+                    response = self._client.messages.create(
+                        model=self._claude_model,
+                        max_tokens=self._max_tokens,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                metrics.record_usage("claude.enrich", response)
                 text = response.content[0].text.strip()
                 results = self._parse_enrichment_response(text)
 
@@ -142,17 +195,24 @@ class Enricher:
                         lead.status = "enriched"
                     return batch
                 else:
-                    logger.warning(
-                        "Enrichment returned %d results for %d leads",
-                        len(results),
-                        len(batch),
-                    )
+                    error = f"Enrichment returned {len(results)} results for {len(batch)} leads"
+                    logger.warning("%s", error)
 
             except Exception as e:
+                error = str(e)
+                run_metrics.incr("claude.enrich.errors")
                 logger.warning("Enrichment attempt %d failed: %s", attempt + 1, e)
                 if attempt < 2:
                     time.sleep(2 ** attempt)
 
+        if self._dead_letters is not None:
+            logger.warning("Enrichment failed after retries, dead-lettering %d leads", len(batch))
+            for lead in batch:
+                self._dead_letters.add("enrich", lead, error)
+                lead.status = DEAD_LETTERED
+            run_metrics.incr("dead_letter.enrich", len(batch))
+            return batch
+
         logger.warning("Enrichment failed after retries, returning leads un-enriched")
         return batch
 
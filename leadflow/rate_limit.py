@@ -0,0 +1,66 @@
+"""Token-bucket rate limiting shared by every caller of one API credential."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: *rate* requests/second on average, bursts of up to *burst*.
+
+    ``acquire()`` blocks until a token is free. When the API pushes back
+    (HTTP 429), ``backoff(seconds)`` empties the bucket and holds every
+    caller until the pause is over, and halves the rate; each success then
+    adds back a tenth of the target rate, so the limiter settles just under
+    what the API accepts. A *rate* of 0 means unlimited (pauses still apply).
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self._target = rate
+        self.rate = rate
+        self._burst = max(1.0, burst)
+        self._min_rate = rate / 8
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if not self.rate:
+                        return waited
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def backoff(self, seconds: float) -> None:
+        """Hold all callers for *seconds* and slow down (after a 429)."""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+            if self.rate:
+                self.rate = max(self._min_rate, self.rate / 2)
+
+    def recover(self) -> None:
+        """Step the rate back towards its target after a successful request."""
+        with self._lock:
+            if self.rate:
+                self.rate = min(self._target, self.rate + self._target / 10)
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
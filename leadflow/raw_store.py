@@ -0,0 +1,131 @@
+"""Side store for raw source rows.
+
+Sources can spill each row's ``raw_data`` here so leads only carry a small
+``RawRef`` handle through normalize/dedup/enrich. The row is read back from
+disk only when a destination asks for it via ``Lead.get_raw_data()``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RawRef:
+    """Lazy handle to a row held in a RawStore."""
+
+    store: RawStore
+    key: int
+
+    def load(self) -> dict:
+        return self.store.get(self.key)
+
+
+@dataclass
+class _Segment:
+    """One side file and the offsets of the rows in it, starting at key *base*."""
+
+    file: object
+    base: int
+    offsets: array = field(default_factory=lambda: array("Q"))
+    lengths: array = field(default_factory=lambda: array("Q"))
+    end: int = 0
+
+
+class RawStore:
+    """Append-only file of compact JSON rows, addressed by sequential lead ID.
+
+    Offsets and lengths live in two ``array('Q')`` columns, so the in-memory
+    index costs 16 bytes per row regardless of how wide the row is.
+
+    A long-running process calls ``rotate()`` once per cycle so the file
+    does not grow without bound. Rows from before the previous rotation
+    are discarded.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._path = str(path) if path else None
+        self._current = self._open(0)
+        self._previous: _Segment | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._current.offsets)
+
+    def put(self, row: dict) -> RawRef:
+        """Append *row* and return a handle to it."""
+        data = json.dumps(row, separators=(",", ":"), default=str).encode()
+        with self._lock:
+            segment = self._current
+            key = segment.base + len(segment.offsets)
+            segment.file.seek(segment.end)
+            segment.file.write(data)
+            segment.offsets.append(segment.end)
+            segment.lengths.append(len(data))
+            segment.end += len(data)
+        return RawRef(self, key)
+
+    def get(self, key: int) -> dict:
+        """Read back the row stored under *key*."""
+        with self._lock:
+            segment = self._current
+            if key < segment.base:
+                segment = self._previous
+                if segment is None or key < segment.base:
+                    raise KeyError(f"Raw row {key} was discarded by an earlier rotation")
+            offset, length = segment.offsets[key - segment.base], segment.lengths[key - segment.base]
+            segment.file.flush()
+        return json.loads(os.pread(segment.file.fileno(), length, offset))
+
+    def rotate(self) -> None:
+        """Start a new file, keeping the current one readable until the next rotation.
+
+        Rows spilled just before a rotation (webhook leads waiting for the
+        next cycle, say) can still be read during that cycle.
+        """
+        with self._lock:
+            if self._previous is not None:
+                self._previous.file.close()
+            if self._path:
+                os.replace(self._path, f"{self._path}.prev")
+            base = self._current.base + len(self._current.offsets)
+            self._previous, self._current = self._current, self._open(base)
+        logger.debug("Raw store rotated at row %d", base)
+
+    def close(self) -> None:
+        self._current.file.close()
+        if self._previous is not None:
+            self._previous.file.close()
+
+    def _open(self, base: int) -> _Segment:
+        file = open(self._path, "w+b") if self._path else tempfile.TemporaryFile()
+        return _Segment(file, base)
+
+
+_stores: dict[str | None, RawStore] = {}
+_stores_lock = threading.Lock()
+
+
+def raw_store_from_config(config: dict) -> RawStore | None:
+    """Return the shared RawStore configured under ``raw_store``, or None if disabled."""
+    store_cfg = config.get("raw_store", {})
+    if not store_cfg.get("enabled", False):
+        return None
+
+    path = store_cfg.get("path") or None
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = RawStore(path)
+            logger.debug("Raw store opened at %s", path or "(temp file)")
+        return _stores[path]
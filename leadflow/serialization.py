@@ -0,0 +1,126 @@
+"""Lead serialization codecs — compact JSON lines and msgpack.
+
+Codecs stream leads to and from binary file objects one record at a time,
+so checkpoints, caches and file destinations never need the whole lead list
+in memory. Paths ending in ``.gz`` are transparently gzip-compressed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator, Type
+
+from leadflow.models import Lead
+
+
+class LeadCodec(ABC):
+    """Interface for streaming lead codecs."""
+
+    #: Conventional file extension (without leading dot).
+    extension: str = ""
+
+    @abstractmethod
+    def dump(self, leads: Iterable[Lead], fp: IO[bytes]) -> int:
+        """Encode *leads* to *fp*. Returns the number of leads written."""
+        ...
+
+    @abstractmethod
+    def load(self, fp: IO[bytes]) -> Iterator[Lead]:
+        """Yield leads decoded from *fp*."""
+        ...
+
+
+_codecs: dict[str, Type[LeadCodec]] = {}
+
+
+def register_codec(key: str) -> Callable[[Type[LeadCodec]], Type[LeadCodec]]:
+    """Decorator that registers a LeadCodec subclass under *key*."""
+
+    def decorator(cls: Type[LeadCodec]) -> Type[LeadCodec]:
+        _codecs[key] = cls
+        return cls
+
+    return decorator
+
+
+@register_codec("jsonl")
+class JsonLinesCodec(LeadCodec):
+    """One compact JSON object per line."""
+
+    extension = "jsonl"
+
+    def encode(self, lead: Lead) -> bytes:
+        return json.dumps(lead.to_dict(), separators=(",", ":"), default=str).encode() + b"\n"
+
+    def dump(self, leads: Iterable[Lead], fp: IO[bytes]) -> int:
+        count = 0
+        for lead in leads:
+            fp.write(self.encode(lead))
+            count += 1
+        return count
+
+    def load(self, fp: IO[bytes]) -> Iterator[Lead]:
+        for line in fp:
+            if line.strip():
+                yield Lead.from_dict(json.loads(line))
+
+
+@register_codec("msgpack")
+class MsgpackCodec(LeadCodec):
+    """Concatenated msgpack maps. Requires the optional ``msgpack`` package."""
+
+    extension = "msgpack"
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "The msgpack codec requires the 'msgpack' package (pip install leadflow-ai[msgpack])"
+            ) from e
+        self._msgpack = msgpack
+
+    def dump(self, leads: Iterable[Lead], fp: IO[bytes]) -> int:
+        packer = self._msgpack.Packer(default=str)
+        count = 0
+        for lead in leads:
+            fp.write(packer.pack(lead.to_dict()))
+            count += 1
+        return count
+
+    def load(self, fp: IO[bytes]) -> Iterator[Lead]:
+        for record in self._msgpack.Unpacker(fp, raw=False):
+            yield Lead.from_dict(record)
+
+
+def get_codec(key: str) -> LeadCodec:
+    """Instantiate the codec registered under *key*.
+
+    Raises ``ValueError`` if *key* is not registered.
+    """
+    if key not in _codecs:
+        available = ", ".join(sorted(_codecs))
+        raise ValueError(f"Unknown codec {key!r}. Available codecs: {available}")
+    return _codecs[key]()
+
+
+def open_binary(path: str | Path, mode: str) -> IO[bytes]:
+    """Open *path* in binary *mode*, gzip-wrapped if it ends in ``.gz``."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "b")
+    return open(path, mode + "b")
+
+
+def dump_leads(leads: Iterable[Lead], path: str | Path, codec: str = "jsonl", append: bool = False) -> int:
+    """Stream *leads* to *path* with the named codec. Returns the count written."""
+    with open_binary(path, "a" if append else "w") as fp:
+        return get_codec(codec).dump(leads, fp)
+
+
+def load_leads(path: str | Path, codec: str = "jsonl") -> Iterator[Lead]:
+    """Lazily yield leads from *path* with the named codec."""
+    with open_binary(path, "r") as fp:
+        yield from get_codec(codec).load(fp)
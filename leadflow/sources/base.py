@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
 from leadflow.models import Lead
 
@@ -15,8 +16,36 @@ class LeadSource(ABC):
         """Fetch leads from the source. Returns a list of raw Lead objects."""
         ...
 
+    def iter_batches(self, batch_size: int) -> Iterator[list[Lead]]:
+        """Yield leads in chunks of at most *batch_size*.
+
+        The default slices the result of ``fetch()``. Sources that can page
+        through their backend override this to keep memory bounded.
+        """
+        leads = self.fetch()
+        for i in range(0, len(leads), batch_size):
+            yield leads[i : i + batch_size]
+
+    def commit(self) -> None:
+        """Persist sync state (e.g. a watermark) once fetched leads are written.
+
+        Called by the pipeline after a successful, non-dry run. The default
+        does nothing; incremental sources override it.
+        """
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Human-readable source name."""
         ...
+
+
+def rebatch(pages: Iterable[list[Lead]], batch_size: int) -> Iterator[list[Lead]]:
+    """Split *pages* into batches of at most *batch_size* as each page arrives.
+
+    Short pages are passed on as they are rather than held back to fill a
+    batch, so downstream stages never wait on the next backend request.
+    """
+    for page in pages:
+        for i in range(0, len(page), batch_size):
+            yield page[i : i + batch_size]
@@ -0,0 +1,165 @@
+"""File lead source — streams CSV or JSON-lines exports, optionally gzipped."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import logging
+import mmap
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from leadflow import metrics
+from leadflow.models import Lead
+from leadflow.raw_store import raw_store_from_config
+from leadflow.registry import register_source
+from leadflow.sources.base import LeadSource
+
+logger = logging.getLogger(__name__)
+
+_FIELDS = ("name", "email", "phone", "company", "notes")
+_GZIP_MAGIC = b"\x1f\x8b"
+_JSONL_SUFFIXES = (".jsonl", ".ndjson", ".json")
+
+
+@register_source("file")
+class FileSource(LeadSource):
+    """Streams leads from a CSV or JSON-lines file without loading it whole.
+
+    ``format`` follows the extension (``.csv``/``.tsv``, ``.jsonl``/``.ndjson``,
+    with or without ``.gz``) unless set; gzip is detected from the file's
+    magic bytes. ``columns`` maps Lead fields to column names, e.g.
+    ``{name: "Full Name"}``; unmapped fields read the column of the same
+    name. With ``mmap`` an uncompressed file is memory-mapped and split
+    into lines straight from the page cache instead of through a read buffer.
+    """
+
+    def __init__(self, config: dict | None = None) -> None:
+        self._config = config or {}
+        src_cfg = self._config.get("sources", {}).get("file", {})
+        self._path = src_cfg.get("path", "")
+        self._format = src_cfg.get("format", "auto")
+        columns = src_cfg.get("columns") or {}
+        self._columns = tuple(columns.get(field, field) for field in _FIELDS)
+        self._delimiter = src_cfg.get("delimiter", "")
+        self._encoding = src_cfg.get("encoding", "utf-8-sig")
+        self._mmap = src_cfg.get("mmap", False)
+        self._chunk_rows = src_cfg.get("chunk_rows", 10_000)
+        self._raw_store = raw_store_from_config(self._config)
+
+    @property
+    def name(self) -> str:
+        return "file"
+
+    def fetch(self) -> list[Lead]:
+        leads = [lead for batch in self.iter_batches(self._chunk_rows) for lead in batch]
+        logger.info("Read %d leads from %s", len(leads), self._path)
+        return leads
+
+    def iter_batches(self, batch_size: int) -> Iterator[list[Lead]]:
+        """Parse *batch_size* rows at a time; only the current batch is in memory."""
+        if not self._path or not Path(self._path).is_file():
+            logger.error("Lead file not found: %s", self._path or "(sources.file.path not set)")
+            return
+
+        run_metrics = metrics.current()
+        with self._open_lines() as lines:
+            if self._resolved_format() == "jsonl":
+                rows, to_lead = self._jsonl_rows(lines), self._jsonl_to_lead
+            else:
+                rows, to_lead = self._csv_rows(lines), self._to_lead
+            while True:
+                batch = [to_lead(row) for row in islice(rows, batch_size)]
+                if not batch:
+                    return
+                run_metrics.incr("source.file.rows", len(batch))
+                yield batch
+
+    def _resolved_format(self) -> str:
+        if self._format != "auto":
+            return self._format
+        suffixes = [s.lower() for s in Path(self._path).suffixes if s.lower() != ".gz"]
+        return "jsonl" if suffixes and suffixes[-1] in _JSONL_SUFFIXES else "csv"
+
+    @contextmanager
+    def _open_lines(self) -> Iterator[Iterable[bytes]]:
+        """Yield the file's lines as bytes, through gzip and/or mmap as configured."""
+        with ExitStack() as stack:
+            raw = stack.enter_context(open(self._path, "rb", buffering=1 << 20))
+            if self._mmap and Path(self._path).stat().st_size:
+                raw = stack.enter_context(mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ))
+            compressed = raw.read(2) == _GZIP_MAGIC
+            raw.seek(0)
+            if compressed:
+                yield stack.enter_context(gzip.GzipFile(fileobj=raw, mode="rb"))
+            elif isinstance(raw, mmap.mmap):
+                yield iter(raw.readline, b"")
+            else:
+                yield raw
+
+    def _csv_rows(self, lines: Iterable[bytes]) -> Iterator[dict]:
+        suffixes = [s.lower() for s in Path(self._path).suffixes if s.lower() != ".gz"]
+        delimiter = self._delimiter or ("\t" if suffixes and suffixes[-1] == ".tsv" else ",")
+        encoding = self._encoding
+        reader = csv.reader((line.decode(encoding) for line in lines), delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            return
+        header = [column.strip() for column in header]
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            yield dict(zip(header, row))
+
+    def _jsonl_rows(self, lines: Iterable[bytes]) -> Iterator[dict]:
+        # Decoding to str up front skips json.loads' per-call encoding sniffing
+        decode, encoding = json.JSONDecoder().decode, self._encoding
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                row = decode(line.decode(encoding))
+            except ValueError:
+                row = None
+            if not isinstance(row, dict):
+                logger.warning("Skipping line %d of %s: not a JSON object", number, self._path)
+                metrics.current().incr("source.file.skipped")
+                continue
+            yield row
+
+    def _to_lead(self, row: dict) -> Lead:
+        """Build a lead from a row whose values are all strings (CSV)."""
+        name, email, phone, company, notes = self._columns
+        get = row.get
+        lead = Lead(
+            name=get(name, ""),
+            email=get(email, ""),
+            phone=get(phone, ""),
+            company=get(company, ""),
+            source="file",
+            notes=get(notes, ""),
+            raw_data=row,
+        )
+        if self._raw_store is not None:
+            lead.spill_raw(self._raw_store)
+        return lead
+
+    def _jsonl_to_lead(self, row: dict) -> Lead:
+        """Like ``_to_lead`` but JSON values may be numbers, nulls or nested."""
+        lead = self._to_lead(row)
+        for field, column in zip(_FIELDS, self._columns):
+            if not isinstance(getattr(lead, field), str):
+                setattr(lead, field, _text(row[column]))
+        return lead
+
+
+def _text(value: object) -> str:
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
@@ -2,52 +2,181 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator
 
+from leadflow import clients, metrics
+from leadflow.executor import in_current_context, merge_ahead
 from leadflow.models import Lead
+from leadflow.raw_store import raw_store_from_config
 from leadflow.registry import register_source
-from leadflow.sources.base import LeadSource
+from leadflow.sources.base import LeadSource, rebatch
+from leadflow.watermarks import watermark_store_from_config
 
 logger = logging.getLogger(__name__)
 
 
 @register_source("google_sheets")
 class GoogleSheetsSource(LeadSource):
-    """Fetches leads from a Google Sheets spreadsheet."""
+    """Fetches leads from one or more worksheets of a Google Sheets spreadsheet.
+
+    Rows are read in windows of ``window_rows`` (the header once, then
+    ``A2:F5001``, ``A5002:F10001``, ...) with up to ``max_concurrent_reads``
+    windows in flight across all worksheets, so no single request covers a
+    whole large sheet and ``iter_batches`` streams leads window by window.
+    ``worksheets`` lists indexes or titles to read in parallel; it defaults
+    to ``[worksheet_index]``.
+    """
 
     def __init__(self, config: dict) -> None:
+        self._root_config = config
         self._config = config.get("sources", {}).get("google_sheets", {})
+        self._credentials_file = self._config.get("credentials_file", "")
         self._spreadsheet_name = self._config.get("spreadsheet_name", "LeadFlow Raw Leads")
-        self._worksheet_index = self._config.get("worksheet_index", 0)
+        self._worksheet_ids = self._config.get("worksheets") or [self._config.get("worksheet_index", 0)]
+        self._window_rows = max(1, self._config.get("window_rows", 5000))
+        self._max_reads = max(1, self._config.get("max_concurrent_reads", 4))
+        self._raw_store = raw_store_from_config(config)
+        self._watermarks = watermark_store_from_config(config)
+        self._pending_watermarks: dict[str, dict] = {}
+        self._spreadsheet = None
 
     @property
     def name(self) -> str:
         return "google_sheets"
 
     def fetch(self) -> list[Lead]:
-        try:
-            import gspread
+        leads = [lead for window in self._iter_windows() for lead in window]
+        logger.info("Fetched %d leads from Google Sheets", len(leads))
+        return leads
+
+    def iter_batches(self, batch_size: int) -> Iterator[list[Lead]]:
+        return rebatch(self._iter_windows(), batch_size)
+
+    def commit(self) -> None:
+        if self._watermarks is not None:
+            for key, mark in self._pending_watermarks.items():
+                self._watermarks.set(key, mark)
+            self._pending_watermarks = {}
 
-            gc = gspread.service_account()
-            spreadsheet = gc.open(self._spreadsheet_name)
-            worksheet = spreadsheet.get_worksheet(self._worksheet_index)
-            records = worksheet.get_all_records()
+    def _iter_windows(self) -> Iterator[list[Lead]]:
+        """Leads per row window from every worksheet, in arrival order."""
+        try:
+            worksheets = self._get_worksheets()
         except Exception as e:
             logger.error("Failed to fetch from Google Sheets: %s", e)
-            return []
-
-        leads = []
-        for row in records:
-            lead = Lead(
-                name=str(row.get("name", "") or ""),
-                email=str(row.get("email", "") or ""),
-                phone=str(row.get("phone", "") or ""),
-                company=str(row.get("company", "") or ""),
-                source="google_sheets",
-                notes=str(row.get("notes", "") or ""),
-                raw_data=dict(row),
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_reads, thread_name_prefix="leadflow-sheets") as pool:
+            readers = [self._read_worksheet(key, worksheet, pool) for key, worksheet in worksheets]
+            if len(readers) == 1:
+                yield from readers[0]
+            else:
+                yield from merge_ahead(readers, self._max_reads, "sheets")
+
+    def _get_worksheets(self) -> list[tuple[str, object]]:
+        """``(watermark key, worksheet)`` pairs.
+
+        The spreadsheet handle is shared (see ``leadflow.clients``); the
+        worksheets are looked up each time so ``row_count`` is current.
+        """
+        if self._spreadsheet is None:
+            self._spreadsheet = clients.spreadsheet(
+                self._root_config, self._spreadsheet_name, self._credentials_file
             )
-            leads.append(lead)
+        worksheets = []
+        for ws_id in self._worksheet_ids:
+            if isinstance(ws_id, int):
+                worksheet = self._spreadsheet.get_worksheet(ws_id)
+            else:
+                worksheet = self._spreadsheet.worksheet(ws_id)
+            worksheets.append((f"google_sheets:{self._spreadsheet_name}:{ws_id}", worksheet))
+        return worksheets
 
-        logger.info("Fetched %d leads from Google Sheets", len(leads))
-        return leads
+    def _read_worksheet(self, key: str, worksheet, pool: ThreadPoolExecutor) -> Iterator[list[Lead]]:
+        """Yield leads window by window, keeping up to ``max_concurrent_reads`` reads queued.
+
+        With incremental sync the first window starts below the committed
+        watermark (the last processed row plus a hash of the header row; if
+        the header changes the sheet is read from the top). The new
+        watermark is only held as pending once the whole worksheet was read.
+        Rows edited above the watermark are not read again; a full sync
+        (``sync.incremental: false``) picks the edits up.
+        """
+        from gspread.utils import rowcol_to_a1
+
+        try:
+            header = worksheet.row_values(1)
+        except Exception as e:
+            logger.error("Failed to fetch from Google Sheets (%s): %s", key, e)
+            return
+        if not header:
+            return
+        header_hash = hashlib.blake2b("\x1f".join(header).encode(), digest_size=8).hexdigest()
+
+        last_row = 1
+        if self._watermarks is not None:
+            mark = self._watermarks.get(key)
+            if mark.get("header_hash") == header_hash:
+                last_row = mark.get("last_row", 1)
+        first_row = last_row + 1
+        last_col = rowcol_to_a1(1, len(header))[:-1]
+        starts = iter(range(first_row, worksheet.row_count + 1, self._window_rows))
+
+        def submit(start: int) -> tuple[int, Future]:
+            range_name = f"A{start}:{last_col}{start + self._window_rows - 1}"
+            return start, pool.submit(in_current_context(self._read_window), worksheet, range_name)
+
+        in_flight = deque(submit(start) for start in islice(starts, self._max_reads))
+        fetched = 0
+        try:
+            while in_flight:
+                start, future = in_flight.popleft()
+                try:
+                    values = future.result()
+                except Exception as e:
+                    logger.error("Failed to fetch from Google Sheets (%s, row %d): %s", key, start, e)
+                    return
+                next_start = next(starts, None)
+                if next_start is not None:
+                    in_flight.append(submit(next_start))
+                if values:
+                    last_row = start + len(values) - 1
+                leads = [
+                    self._row_to_lead(dict(zip(header, row + [""] * (len(header) - len(row)))))
+                    for row in values
+                    if any(cell != "" for cell in row)
+                ]
+                fetched += len(leads)
+                if leads:
+                    yield leads
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+        if self._watermarks is not None:
+            self._pending_watermarks[key] = {"last_row": last_row, "header_hash": header_hash}
+        logger.info("Read %d leads from %s through row %d (from row %d)", fetched, key, last_row, first_row)
+
+    @staticmethod
+    def _read_window(worksheet, range_name: str) -> list[list[str]]:
+        with metrics.current().time("source.google_sheets.read_window"):
+            return worksheet.get_values(range_name)
+
+    def _row_to_lead(self, row: dict) -> Lead:
+        lead = Lead(
+            name=str(row.get("name", "") or ""),
+            email=str(row.get("email", "") or ""),
+            phone=str(row.get("phone", "") or ""),
+            company=str(row.get("company", "") or ""),
+            source="google_sheets",
+            notes=str(row.get("notes", "") or ""),
+            raw_data=row,
+        )
+        if self._raw_store is not None:
+            lead.spill_raw(self._raw_store)
+        return lead
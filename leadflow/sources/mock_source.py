@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from leadflow.models import Lead
+from leadflow.raw_store import raw_store_from_config
 from leadflow.registry import register_source
 from leadflow.sources.base import LeadSource
 
@@ -13,6 +14,7 @@ class MockSource(LeadSource):
 
     def __init__(self, config: dict | None = None) -> None:
         self._config = config or {}
+        self._raw_store = raw_store_from_config(self._config)
 
     @property
     def name(self) -> str:
@@ -129,6 +131,8 @@ class MockSource(LeadSource):
                 notes=raw.get("notes", ""),
                 raw_data=raw,
             )
+            if self._raw_store is not None:
+                lead.spill_raw(self._raw_store)
             leads.append(lead)
 
         return leads
@@ -4,19 +4,33 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+from datetime import datetime, timezone
+from typing import Iterator
 
 from notion_client import Client
 
+from leadflow import clients
+from leadflow.executor import merge_ahead
 from leadflow.models import Lead
+from leadflow.rate_limit import TokenBucket
 from leadflow.registry import register_source
-from leadflow.sources.base import LeadSource
+from leadflow.sources.base import LeadSource, rebatch
+from leadflow.watermarks import watermark_store_from_config
 
 logger = logging.getLogger(__name__)
 
 
 @register_source("notion")
 class NotionSource(LeadSource):
-    """Fetches leads from a Notion database."""
+    """Fetches leads from a Notion database.
+
+    ``iter_batches`` yields leads as each 100-item query page arrives, so
+    downstream stages start before pagination finishes. With ``partitions``
+    the database is split into ``created_time`` ranges queried in parallel:
+    an int splits the span from the oldest page to now evenly, a list gives
+    the boundary timestamps explicitly.
+    """
 
     def __init__(self, config: dict) -> None:
         self._config = config
@@ -25,41 +39,163 @@ class NotionSource(LeadSource):
         db_var = src_cfg.get("database_id_env_var", "NOTION_SOURCE_DATABASE_ID")
         self._token = os.getenv(token_var, "")
         self._database_id = os.getenv(db_var, "")
+        self._partitions = src_cfg.get("partitions", 1)
+        self._client: Client | None = None
+        self._watermarks = watermark_store_from_config(config)
+        self._pending_watermark: dict | None = None
+        self._failed = False
 
     @property
     def name(self) -> str:
         return "notion"
 
     def fetch(self) -> list[Lead]:
-        if not self._token or not self._database_id:
-            logger.error("Notion credentials not set (NOTION_TOKEN / NOTION_SOURCE_DATABASE_ID)")
+        """All leads, or none if any query failed (as before streaming)."""
+        leads = []
+        for page in self._iter_pages():
+            leads.extend(page)
+        if self._failed:
             return []
+        logger.info("Fetched %d leads from Notion", len(leads))
+        return leads
 
-        try:
-            notion = Client(auth=self._token)
-            leads = []
-            has_more = True
-            start_cursor = None
-
-            while has_more:
-                kwargs: dict = {"database_id": self._database_id, "page_size": 100}
-                if start_cursor:
-                    kwargs["start_cursor"] = start_cursor
-
-                response = notion.databases.query(**kwargs)
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+    def iter_batches(self, batch_size: int) -> Iterator[list[Lead]]:
+        return rebatch(self._iter_pages(), batch_size)
 
-                for page in response.get("results", []):
-                    lead = self._page_to_lead(page)
-                    leads.append(lead)
+    def _iter_pages(self) -> Iterator[list[Lead]]:
+        """Leads per query page, from every partition, in arrival order.
 
-            logger.info("Fetched %d leads from Notion", len(leads))
-            return leads
+        A failed query ends its partition and holds back the watermark, so
+        the next incremental run fetches the same delta again.
+        """
+        self._failed = False
+        if not self._token or not self._database_id:
+            logger.error("Notion credentials not set (NOTION_TOKEN / NOTION_SOURCE_DATABASE_ID)")
+            self._failed = True
+            return
 
+        try:
+            notion = self._get_client()
+            ranges = self._partition_ranges(notion)
         except Exception as e:
             logger.error("Failed to fetch from Notion: %s", e)
+            self._failed = True
+            return
+
+        since, seen = self._watermark_since()
+        latest = [since]
+        boundary = set(seen)
+        lock = threading.Lock()
+
+        def query(start: str, end: str) -> Iterator[list[Lead]]:
+            try:
+                for results in self._query(notion, since, start, end):
+                    pages = [
+                        page
+                        for page in results
+                        if page.get("last_edited_time", "") != since or page.get("id", "") not in seen
+                    ]
+                    with lock:
+                        for page in pages:
+                            edited = page.get("last_edited_time", "")
+                            if edited > latest[0]:
+                                latest[0] = edited
+                                boundary.clear()
+                            if edited == latest[0]:
+                                boundary.add(page.get("id", ""))
+                    yield [self._page_to_lead(page) for page in pages]
+            except Exception as e:
+                logger.error("Failed to fetch from Notion (created %s..%s): %s", start or "*", end or "*", e)
+                self._failed = True
+
+        queries = [query(start, end) for start, end in ranges]
+        if len(queries) == 1:
+            yield from queries[0]
+        else:
+            yield from merge_ahead(queries, len(queries), "notion")
+
+        if self._watermarks is not None and latest[0] and not self._failed:
+            self._pending_watermark = {"last_edited_time": latest[0], "page_ids": sorted(boundary)}
+
+    def _query(self, notion: Client, since: str, start: str, end: str) -> Iterator[list[dict]]:
+        """Page through ``databases.query`` for one ``created_time`` range [start, end)."""
+        conditions = []
+        if since:
+            conditions.append({"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}})
+        if start:
+            conditions.append({"timestamp": "created_time", "created_time": {"on_or_after": start}})
+        if end:
+            conditions.append({"timestamp": "created_time", "created_time": {"before": end}})
+
+        has_more = True
+        start_cursor = None
+        while has_more:
+            kwargs: dict = {"database_id": self._database_id, "page_size": 100}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+            if conditions:
+                kwargs["filter"] = conditions[0] if len(conditions) == 1 else {"and": conditions}
+            if since:
+                kwargs["sorts"] = [{"timestamp": "last_edited_time", "direction": "ascending"}]
+
+            self._limiter().acquire()
+            response = notion.databases.query(**kwargs)
+            has_more = response.get("has_more", False)
+            start_cursor = response.get("next_cursor")
+            yield response.get("results", [])
+
+    def _partition_ranges(self, notion: Client) -> list[tuple[str, str]]:
+        """``created_time`` ranges ``[start, end)`` to query in parallel ("" = unbounded)."""
+        if isinstance(self._partitions, list):
+            bounds = sorted(str(b) for b in self._partitions)
+        elif self._partitions > 1:
+            bounds = self._split_created_time(notion, self._partitions)
+        else:
+            bounds = []
+        edges = ["", *bounds, ""]
+        return list(zip(edges, edges[1:]))
+
+    def _split_created_time(self, notion: Client, parts: int) -> list[str]:
+        """Evenly spaced boundaries between the oldest page's ``created_time`` and now."""
+        self._limiter().acquire()
+        response = notion.databases.query(
+            database_id=self._database_id,
+            page_size=1,
+            sorts=[{"timestamp": "created_time", "direction": "ascending"}],
+        )
+        results = response.get("results", [])
+        if not results:
             return []
+        oldest = datetime.fromisoformat(results[0]["created_time"])
+        step = (datetime.now(timezone.utc) - oldest) / parts
+        return [(oldest + step * i).isoformat() for i in range(1, parts)]
+
+    def commit(self) -> None:
+        if self._watermarks is not None and self._pending_watermark is not None:
+            self._watermarks.set(self._watermark_key, self._pending_watermark)
+            self._pending_watermark = None
+
+    @property
+    def _watermark_key(self) -> str:
+        return f"notion:{self._database_id}"
+
+    def _watermark_since(self) -> tuple[str, set[str]]:
+        """Committed ``last_edited_time`` cursor ("" for a full fetch) and the
+        IDs of the pages already fetched at exactly that time.
+
+        The filter is inclusive (``on_or_after``) because Notion timestamps
+        are minute-granular; the boundary pages it returns again are skipped
+        by ID. A page edited again within that same minute is skipped too.
+
+        An edited page comes back as a lead with the same dedup key as
+        before, so when the earlier version is already known to dedup
+        (``dedup_existing``, daemon mode) the edit never reaches the
+        destinations.
+        """
+        if self._watermarks is None:
+            return "", set()
+        mark = self._watermarks.get(self._watermark_key)
+        return mark.get("last_edited_time", ""), set(mark.get("page_ids", []))
 
     def _page_to_lead(self, page: dict) -> Lead:
         """Convert a Notion page to a Lead object."""
@@ -75,6 +211,16 @@ class NotionSource(LeadSource):
             raw_data={"notion_page_id": page.get("id", "")},
         )
 
+    def _limiter(self) -> TokenBucket:
+        """Rate limit shared with every other user of this token (e.g. the Notion writer)."""
+        return clients.rate_limiter(self._config, "notion", self._token)
+
+    def _get_client(self) -> Client:
+        """The shared, pooled Notion client for this token."""
+        if self._client is None:
+            self._client = clients.notion(self._config, self._token, Client)
+        return self._client
+
     @staticmethod
     def _get_title(props: dict, key: str) -> str:
         """Extract text from a Notion title property."""
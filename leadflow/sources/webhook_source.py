@@ -0,0 +1,261 @@
+"""Webhook source — a local HTTP endpoint that receives leads as they are submitted."""
+
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+import os
+import queue
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+from leadflow import metrics
+from leadflow.models import Lead
+from leadflow.raw_store import raw_store_from_config
+from leadflow.registry import register_source
+from leadflow.sources.base import LeadSource
+
+logger = logging.getLogger(__name__)
+
+# How often blocking waits re-check for shutdown
+_POLL_SECONDS = 0.2
+
+
+class _Server(ThreadingHTTPServer):
+    # Join request threads on close, so every accepted lead is in the inbox
+    daemon_threads = False
+
+
+@register_source("webhook")
+class WebhookSource(LeadSource):
+    """Accepts lead JSON over HTTP and hands it to the pipeline in micro-batches.
+
+    ``POST <path>`` takes one lead object or a list of them (``name``,
+    ``email``, ``phone``, ``company``, ``notes``; the whole object is kept as
+    ``raw_data``) and answers ``202`` once they are queued. A batch is handed
+    on when it reaches the batch size or ``batch_window_seconds`` after its
+    first lead arrived, whichever comes first.
+
+    Run it in streaming mode (``--chunk-size``) to process batches until
+    SIGTERM/SIGINT, which stops the endpoint and flushes what was received.
+    ``fetch()`` returns a single window's worth of leads, for batch runs.
+    Every lead is stamped with ``received_at``, so the run metrics carry an
+    ``ingest_to_write`` latency histogram.
+    """
+
+    def __init__(self, config: dict | None = None) -> None:
+        self._config = config or {}
+        src_cfg = self._config.get("sources", {}).get("webhook", {})
+        self._host = src_cfg.get("host", "127.0.0.1")
+        self._port = src_cfg.get("port", 8080)
+        self._path = src_cfg.get("path", "/leads")
+        self._batch_size = src_cfg.get("batch_size", 50)
+        self._window = src_cfg.get("batch_window_seconds", 2.0)
+        self._max_body = src_cfg.get("max_body_bytes", 1_000_000)
+        self._token = os.getenv(src_cfg.get("token_env_var", "WEBHOOK_TOKEN"), "")
+        self._inbox: queue.Queue[Lead] = queue.Queue(maxsize=src_cfg.get("max_pending", 10_000))
+        self._raw_store = raw_store_from_config(self._config)
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+        self._handle_signals = src_cfg.get("handle_signals", True)
+        self._stopping = threading.Event()
+        # Request handlers run on server threads; they record into the metrics
+        # of the run that last asked for leads
+        self._metrics = metrics.current()
+
+    @property
+    def name(self) -> str:
+        return "webhook"
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Bound ``(host, port)``; starts the endpoint if needed (port 0 picks a free one)."""
+        self.start()
+        return self._server.server_address[:2]
+
+    def start(self) -> None:
+        """Start serving in a background thread (idempotent)."""
+        if self._server is not None:
+            return
+        self._server = _Server((self._host, self._port), _handler_for(self))
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="leadflow-webhook", daemon=True
+        )
+        self._thread.start()
+        logger.info("Webhook listening on http://%s:%d%s", *self._server.server_address[:2], self._path)
+
+    def stop(self, *_args) -> None:
+        """Stop accepting leads; the current stream flushes and ends. Usable as a signal handler."""
+        if not self._stopping.is_set():
+            logger.info("Webhook shutdown requested, flushing received leads")
+        self._stopping.set()
+
+    def close(self) -> None:
+        """Shut the endpoint down; requests in progress finish first."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def fetch(self) -> list[Lead]:
+        """Leads received within one batch window (possibly none)."""
+        self._metrics = metrics.current()
+        self.start()
+        return self._next_batch(self._batch_size, wait_for_first=self._window)
+
+    def iter_batches(self, batch_size: int) -> Iterator[list[Lead]]:
+        """Yield micro-batches until ``stop()``, then flush whatever was received.
+
+        When driven from the main thread (not ``--pipelined``), SIGTERM and
+        SIGINT call ``stop()`` for the duration of the stream.
+        """
+        self._metrics = metrics.current()
+        self.start()
+        size = min(batch_size, self._batch_size)
+        previous_handlers = {}
+        if self._handle_signals and threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                previous_handlers[sig] = signal.signal(sig, self.stop)
+        try:
+            while not self._stopping.is_set():
+                batch = self._next_batch(size)
+                if batch:
+                    yield batch
+            self.close()
+            while True:
+                batch = self._next_batch(size, wait_for_first=0)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            self.close()
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+
+    def _next_batch(self, size: int, wait_for_first: float | None = None) -> list[Lead]:
+        """Block for a first lead (up to *wait_for_first*, None = until stopped), then fill a window."""
+        first = self._get(time.monotonic() + wait_for_first if wait_for_first is not None else None)
+        if first is None:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self._window
+        while len(batch) < size:
+            lead = self._get(deadline)
+            if lead is None:
+                break
+            batch.append(lead)
+        return batch
+
+    def _get(self, deadline: float | None) -> Lead | None:
+        while True:
+            if deadline is None:
+                timeout = _POLL_SECONDS
+            else:
+                timeout = min(_POLL_SECONDS, deadline - time.monotonic())
+                if timeout <= 0:
+                    try:
+                        return self._inbox.get_nowait()
+                    except queue.Empty:
+                        return None
+            try:
+                return self._inbox.get(timeout=timeout)
+            except queue.Empty:
+                if deadline is None and self._stopping.is_set():
+                    return None
+
+    def _accept(self, rows: list[dict]) -> int:
+        """Queue *rows* as leads. Returns how many fit before the inbox filled up."""
+        now = time.time()
+        accepted = 0
+        for row in rows:
+            lead = Lead(
+                name=str(row.get("name") or ""),
+                email=str(row.get("email") or ""),
+                phone=str(row.get("phone") or ""),
+                company=str(row.get("company") or ""),
+                notes=str(row.get("notes") or ""),
+                source="webhook",
+                raw_data=row,
+                received_at=now,
+            )
+            if self._raw_store is not None:
+                lead.spill_raw(self._raw_store)
+            try:
+                self._inbox.put_nowait(lead)
+            except queue.Full:
+                break
+            accepted += 1
+        self._metrics.incr("source.webhook.received", accepted)
+        return accepted
+
+    def _authorized(self, header: str) -> bool:
+        if not self._token:
+            return True
+        return hmac.compare_digest(header, f"Bearer {self._token}")
+
+
+def _handler_for(source: WebhookSource) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._reply(200, {"status": "ok", "pending": source._inbox.qsize()})
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            if self.path != source._path:
+                self._reply(404, {"error": "not found"})
+                return
+            if not source._authorized(self.headers.get("Authorization", "")):
+                self._reply(401, {"error": "unauthorized"})
+                return
+            if source._stopping.is_set():
+                self._reply(503, {"error": "shutting down"})
+                return
+            header = self.headers.get("Content-Length")
+            if header is None:
+                self._reply(411, {"error": "Content-Length required"})
+                return
+            try:
+                length = int(header)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._reply(400, {"error": f"invalid Content-Length: {header}"})
+                return
+            if length > source._max_body:
+                self._reply(413, {"error": f"body over {source._max_body} bytes"})
+                return
+            try:
+                body = json.loads(self.rfile.read(length) or b"null")
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                self._reply(400, {"error": f"invalid JSON: {e}"})
+                return
+            rows = body if isinstance(body, list) else [body]
+            if not rows or not all(isinstance(row, dict) for row in rows):
+                self._reply(400, {"error": "expected a lead object or a list of them"})
+                return
+
+            accepted = source._accept(rows)
+            if accepted < len(rows):
+                source._metrics.incr("source.webhook.rejected", len(rows) - accepted)
+                self._reply(503, {"error": "inbox full", "accepted": accepted})
+            else:
+                self._reply(202, {"accepted": accepted})
+
+        def _reply(self, status: int, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args) -> None:
+            logger.debug("%s %s", self.address_string(), format % args)
+
+    return Handler
@@ -0,0 +1,57 @@
+"""Per-source sync watermarks for incremental fetches.
+
+Sources read their cursor before fetching, hold the new cursor as pending,
+and only persist it from ``LeadSource.commit()`` once the run has written
+the fetched leads — so a failed run re-fetches the same delta next time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class WatermarkStore:
+    """Small JSON file mapping a source key to its last committed cursor."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict:
+        """Committed cursor for *key*, or ``{}`` if the source was never synced."""
+        with self._lock:
+            return self._load().get(key, {})
+
+    def set(self, key: str, value: dict) -> None:
+        """Persist *value* as the cursor for *key* (atomic file replace)."""
+        with self._lock:
+            data = self._load()
+            data[key] = value
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_name(self._path.name + ".tmp")
+            tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+            os.replace(tmp, self._path)
+        logger.debug("Watermark %s → %s", key, value)
+
+    def _load(self) -> dict:
+        if not self._path.exists():
+            return {}
+        try:
+            return json.loads(self._path.read_text())
+        except json.JSONDecodeError:
+            logger.warning("Corrupt watermark file %s, starting from scratch", self._path)
+            return {}
+
+
+def watermark_store_from_config(config: dict) -> WatermarkStore | None:
+    """Return the WatermarkStore for ``sync.watermark_path``, or None if incremental sync is off."""
+    sync_cfg = config.get("sync", {})
+    if not sync_cfg.get("incremental", False):
+        return None
+    return WatermarkStore(sync_cfg.get("watermark_path", "output/watermarks.json"))
@@ -0,0 +1,231 @@
+"""Local work queue for coordinator/worker runs — SQLite, no external broker.
+
+The coordinator fetches, normalizes and dedups, then enqueues the unique
+leads in chunks. Workers (any number of processes, on this host or on hosts
+sharing the queue file over a filesystem with working locks) lease one
+chunk at a time, enrich and write it, and report per-chunk stats that the
+coordinator aggregates.
+
+A lease expires unless its worker heartbeats, after which the chunk is
+handed to another worker. The lease's attempt number fences out a worker
+that lost its lease, so only the current holder can complete a chunk.
+Delivery is at-least-once: a worker that dies after writing but before
+completing leaves the chunk to be written again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from leadflow.models import Lead
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    stats TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT NOT NULL DEFAULT '',
+    lease_expires REAL NOT NULL DEFAULT 0,
+    stats TEXT NOT NULL DEFAULT '{}',
+    error TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS chunks_by_status ON chunks (status, id);
+CREATE INDEX IF NOT EXISTS chunks_by_run ON chunks (run_id, status);
+"""
+
+PENDING, LEASED, DONE, FAILED = "pending", "leased", "done", "failed"
+
+
+@dataclass
+class Lease:
+    chunk_id: int
+    run_id: str
+    attempt: int
+    leads: list[Lead] = field(repr=False)
+
+
+class WorkQueue:
+    """SQLite-backed chunk queue with leases, heartbeats and per-chunk stats."""
+
+    def __init__(self, path: str | Path, lease_seconds: float = 120.0, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # Autocommit mode; multi-statement updates use explicit BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    # -- coordinator ----------------------------------------------------------
+
+    def start_run(self, run_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO runs (run_id, created_at) VALUES (?, ?)", (run_id, time.time())
+            )
+
+    def set_run_stats(self, run_id: str, **stats) -> None:
+        """Record coordinator-side counts (fetched, unique, ...) for *run_id*."""
+        with self._lock:
+            self._conn.execute("UPDATE runs SET stats = ? WHERE run_id = ?", (json.dumps(stats), run_id))
+
+    def enqueue(self, run_id: str, leads: list[Lead]) -> int:
+        """Add a chunk of *leads* to *run_id*. Returns the chunk ID."""
+        payload = json.dumps([lead.to_dict() for lead in leads])
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO chunks (run_id, payload, size) VALUES (?, ?, ?)", (run_id, payload, len(leads))
+            )
+        return cursor.lastrowid
+
+    # -- worker ---------------------------------------------------------------
+
+    def lease(self, worker: str) -> Lease | None:
+        """Take the oldest pending (or abandoned) chunk, or None if there is none."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire(now)
+                row = self._conn.execute(
+                    "SELECT id, run_id, attempts, payload FROM chunks"
+                    " WHERE status = ? OR (status = ? AND lease_expires < ?)"
+                    " ORDER BY id LIMIT 1",
+                    (PENDING, LEASED, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                chunk_id, run_id, attempts, payload = row
+                self._conn.execute(
+                    "UPDATE chunks SET status = ?, worker = ?, attempts = ?, lease_expires = ? WHERE id = ?",
+                    (LEASED, worker, attempts + 1, now + self.lease_seconds, chunk_id),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        leads = [Lead.from_dict(data) for data in json.loads(payload)]
+        return Lease(chunk_id=chunk_id, run_id=run_id, attempt=attempts + 1, leads=leads)
+
+    def heartbeat(self, lease: Lease) -> bool:
+        """Extend *lease*. Returns False if it was lost to another worker."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE chunks SET lease_expires = ? WHERE id = ? AND status = ? AND attempts = ?",
+                (time.time() + self.lease_seconds, lease.chunk_id, LEASED, lease.attempt),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, lease: Lease, leads: list[Lead], stats: dict) -> bool:
+        """Mark the chunk done with its processed *leads* and *stats*. False if the lease was lost."""
+        payload = json.dumps([lead.to_dict() for lead in leads])
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE chunks SET status = ?, payload = ?, stats = ?, error = ''"
+                " WHERE id = ? AND status = ? AND attempts = ?",
+                (DONE, payload, json.dumps(stats), lease.chunk_id, LEASED, lease.attempt),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, lease: Lease, error: str | BaseException) -> None:
+        """Release the chunk for another attempt, or mark it failed once attempts run out."""
+        status = FAILED if lease.attempt >= self._max_attempts else PENDING
+        with self._lock:
+            self._conn.execute(
+                "UPDATE chunks SET status = ?, error = ?, lease_expires = 0"
+                " WHERE id = ? AND status = ? AND attempts = ?",
+                (status, str(error), lease.chunk_id, LEASED, lease.attempt),
+            )
+
+    # -- progress -------------------------------------------------------------
+
+    def progress(self, run_id: str | None = None) -> dict[str, int]:
+        """Chunk counts per status, for one run or the whole queue."""
+        query = "SELECT status, count(*) FROM chunks"
+        params: tuple = ()
+        if run_id is not None:
+            query, params = query + " WHERE run_id = ?", (run_id,)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire(time.time())
+                rows = self._conn.execute(query + " GROUP BY status", params).fetchall()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        counts = dict.fromkeys((PENDING, LEASED, DONE, FAILED), 0)
+        counts.update(rows)
+        return counts
+
+    def is_finished(self, run_id: str) -> bool:
+        counts = self.progress(run_id)
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def run_stats(self, run_id: str) -> tuple[dict, list[dict]]:
+        """Coordinator stats of *run_id* (plus ``created_at``) and the stats of each done chunk."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stats, created_at FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            chunks = self._conn.execute(
+                "SELECT stats FROM chunks WHERE run_id = ? AND status = ? ORDER BY id", (run_id, DONE)
+            ).fetchall()
+        if row is None:
+            raise KeyError(f"Unknown run {run_id!r} in {self.path}")
+        coordinator = {**json.loads(row[0]), "created_at": row[1]}
+        return coordinator, [json.loads(stats) for (stats,) in chunks]
+
+    def preview(self, run_id: str, limit: int) -> list[Lead]:
+        """Up to *limit* processed leads of *run_id*, in chunk order."""
+        leads: list[Lead] = []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM chunks WHERE run_id = ? AND status = ? ORDER BY id", (run_id, DONE)
+            )
+            for (payload,) in rows:
+                leads.extend(Lead.from_dict(data) for data in json.loads(payload)[: limit - len(leads)])
+                if len(leads) >= limit:
+                    break
+        return leads
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _expire(self, now: float) -> None:
+        # Abandoned chunks with no attempts left would otherwise stay leased forever
+        self._conn.execute(
+            "UPDATE chunks SET status = ?, error = 'lease expired'"
+            " WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+            (FAILED, LEASED, now, self._max_attempts),
+        )
+
+
+def work_queue_from_config(config: dict) -> WorkQueue:
+    dist_cfg = config.get("distributed", {})
+    return WorkQueue(
+        dist_cfg.get("queue_path", "output/work_queue.db"),
+        lease_seconds=dist_cfg.get("lease_seconds", 120.0),
+        max_attempts=dist_cfg.get("max_attempts", 3),
+    )
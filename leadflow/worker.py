@@ -0,0 +1,108 @@
+"""Distributed worker mode — enrich and write chunks leased from the work queue."""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import signal
+import socket
+import threading
+
+from leadflow.pipeline import Pipeline
+from leadflow.work_queue import Lease, WorkQueue
+
+logger = logging.getLogger(__name__)
+
+
+def new_worker_id() -> str:
+    """Unique per process, e.g. ``host-1234-9f3a``."""
+    return f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(2)}"
+
+
+class Worker:
+    """Leases chunks from a WorkQueue and runs the pipeline's enrich and write stages on them.
+
+    While a chunk is processed a heartbeat thread extends its lease every
+    third of ``lease_seconds``. A failing chunk is released for another
+    attempt. With *drain* the worker exits once the queue has no work left;
+    otherwise it polls every *poll_seconds* until stopped.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        queue: WorkQueue,
+        worker_id: str | None = None,
+        poll_seconds: float = 2.0,
+        drain: bool = False,
+    ) -> None:
+        self._pipeline = pipeline
+        self._queue = queue
+        self.worker_id = worker_id or new_worker_id()
+        self._poll_seconds = poll_seconds
+        self._drain = drain
+        self._stop = threading.Event()
+        self.chunks = 0
+        self.failures = 0
+
+    def stop(self, *_args) -> None:
+        """Request shutdown after the current chunk. Usable as a signal handler."""
+        if not self._stop.is_set():
+            logger.info("Shutdown requested, finishing current chunk")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGTERM and SIGINT."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def run(self) -> None:
+        """Process chunks until stopped (or, with *drain*, until the queue is empty)."""
+        logger.info("Worker %s started on %s", self.worker_id, self._queue.path)
+        while not self._stop.is_set():
+            lease = self._queue.lease(self.worker_id)
+            if lease is not None:
+                self._process(lease)
+                continue
+            if self._drain and self._queue.progress()["leased"] == 0:
+                break
+            self._stop.wait(self._poll_seconds)
+        logger.info(
+            "Worker %s stopped after %d chunks (%d failed)", self.worker_id, self.chunks, self.failures
+        )
+
+    def _process(self, lease: Lease) -> None:
+        logger.info(
+            "Chunk %d of run %s: %d leads (attempt %d)",
+            lease.chunk_id,
+            lease.run_id,
+            len(lease.leads),
+            lease.attempt,
+        )
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(lease, done), name=f"leadflow-heartbeat-{lease.chunk_id}", daemon=True
+        )
+        heartbeat.start()
+        try:
+            stats = self._pipeline.process_chunk(lease.leads)
+        except Exception as e:
+            self.failures += 1
+            logger.exception("Chunk %d failed", lease.chunk_id)
+            self._queue.fail(lease, e)
+            return
+        finally:
+            done.set()
+            heartbeat.join()
+
+        self.chunks += 1
+        if not self._queue.complete(lease, lease.leads, stats.to_report()):
+            logger.warning("Lease on chunk %d was lost; another worker owns it now", lease.chunk_id)
+
+    def _heartbeat(self, lease: Lease, done: threading.Event) -> None:
+        interval = self._queue.lease_seconds / 3
+        while not done.wait(interval):
+            if not self._queue.heartbeat(lease):
+                logger.warning("Lost lease on chunk %d", lease.chunk_id)
+                return
@@ -4,24 +4,44 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 
 from rich.console import Console
 from rich.table import Table
 
 from leadflow.config import load_config
+from leadflow.daemon import Daemon
+from leadflow.dead_letter import dead_letter_store_from_config
+from leadflow.destinations.mock_writer import DEFAULT_JSONL_PATH, compact_archive
 from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.destinations.sqlite_writer import existing_leads_from_config
 from leadflow.pipeline import Pipeline
 from leadflow.processing.deduplicator import Deduplicator
 from leadflow.processing.enricher import Enricher
+from leadflow.raw_store import raw_store_from_config
 from leadflow.registry import get_source, get_destination, available_sources, available_destinations
+from leadflow.sources.multi_source import MultiSource
+from leadflow.work_queue import work_queue_from_config
+from leadflow.worker import Worker
 
 # Import backend modules to trigger registration decorators
 import leadflow.sources.mock_source  # noqa: F401
 import leadflow.sources.google_sheets  # noqa: F401
 import leadflow.sources.notion_source  # noqa: F401
+import leadflow.sources.webhook_source  # noqa: F401
+import leadflow.sources.file_source  # noqa: F401
 import leadflow.destinations.mock_writer  # noqa: F401
 import leadflow.destinations.master_sheet  # noqa: F401
 import leadflow.destinations.notion_writer  # noqa: F401
+import leadflow.destinations.sqlite_writer  # noqa: F401
+import leadflow.destinations.columnar_writer  # noqa: F401
+
+
+def backend_keys(value: str | list[str]) -> list[str]:
+    """Normalize a backend setting — a key, a comma-separated string or a list."""
+    if isinstance(value, str):
+        return [key.strip() for key in value.split(",") if key.strip()]
+    return list(value)
 
 
 def build_pipeline(config: dict) -> Pipeline:
@@ -29,11 +49,12 @@ def build_pipeline(config: dict) -> Pipeline:
     mock_mode = config.get("mock_mode", True)
 
     # Determine backends from config or CLI, defaulting based on mock_mode
-    source_key = config.get("source_backend", "mock" if mock_mode else "google_sheets")
-    dest_key = config.get("destination_backend", "mock" if mock_mode else "google_sheets")
+    source_keys = backend_keys(config.get("source_backend", "mock" if mock_mode else "google_sheets"))
+    dest_keys = backend_keys(config.get("destination_backend", "mock" if mock_mode else "google_sheets"))
 
-    source = get_source(source_key, config)
-    destination = get_destination(dest_key, config)
+    sources = [get_source(key, config) for key in source_keys]
+    source = sources[0] if len(sources) == 1 else MultiSource(sources, config)
+    destinations = [get_destination(key, config) for key in dest_keys]
 
     # Claude client (only if not mock)
     claude_client = None
@@ -54,7 +75,7 @@ def build_pipeline(config: dict) -> Pipeline:
         source=source,
         deduplicator=deduplicator,
         enricher=enricher,
-        writer=destination,
+        writer=destinations,
         notifier=notifier,
         config=config,
     )
@@ -74,21 +95,134 @@ def print_summary(stats, config: dict) -> None:
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="bold")
 
-    table.add_row("Source", config.get("source_backend", "—"))
-    table.add_row("Destination", config.get("destination_backend", "—"))
+    if stats.run_id:
+        table.add_row("Run ID", stats.run_id)
+    table.add_row("Source", ", ".join(backend_keys(config.get("source_backend", "—"))))
+    table.add_row("Destination", ", ".join(backend_keys(config.get("destination_backend", "—"))))
     table.add_row("Leads fetched", str(stats.fetched))
+    for key, count in stats.metrics.counters.items():
+        if key.startswith("source.") and key.endswith(".fetched"):
+            table.add_row(f"  {key[len('source.'):-len('.fetched')]}", str(int(count)))
     table.add_row("Normalized", str(stats.normalized))
     table.add_row("Unique", str(stats.unique))
     table.add_row("Duplicates", str(stats.duplicates))
     table.add_row("Enriched", str(stats.enriched))
     table.add_row("Written", str(stats.written))
+    if len(stats.written_by_destination) > 1:
+        for label, count in stats.written_by_destination.items():
+            table.add_row(f"  {label}", str(count))
+    if stats.dead_lettered:
+        table.add_row("Dead-lettered", str(stats.dead_lettered))
     table.add_row("Notified", "Yes" if stats.notified else "No")
     table.add_row("Duration", f"{stats.duration_seconds:.2f}s")
+    for name, latency in stats.metrics.histograms.items():
+        if name.startswith("ingest_to_write") and latency.count:
+            label = "Ingest→write" + name[len("ingest_to_write"):].replace(".", " ", 1)
+            table.add_row(
+                label,
+                f"p50 {latency.percentile(50):.2f}s / p95 {latency.percentile(95):.2f}s"
+                f" / p99 {latency.percentile(99):.2f}s",
+            )
+    for stage, timing in stats.metrics.stages.items():
+        table.add_row(
+            f"  {stage}",
+            f"{timing.wall_seconds:.2f}s wall / {timing.cpu_seconds:.2f}s thread cpu",
+        )
+    if stats.profile is not None:
+        table.add_row("Profile", stats.profile_dir)
+        for stage, spots in stats.profile.hot_spots().items():
+            peak_mb = stats.profile.stages[stage].peak_bytes / 1e6
+            for spot in spots:
+                table.add_row(
+                    f"  {stage} hot spot",
+                    f"{spot.function} {spot.own_seconds:.2f}s, peak {peak_mb:.1f} MB",
+                )
 
     console.print(table)
     console.print()
 
 
+def run_daemon(config: dict, args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Build the pipeline once and run it until SIGTERM/SIGINT."""
+    daemon_cfg = config.get("daemon", {})
+    interval = args.interval if args.interval is not None else daemon_cfg.get("interval", 300)
+    trigger_file = args.trigger_file or daemon_cfg.get("trigger_file") or None
+    if not interval and not trigger_file:
+        parser.error("--daemon needs a positive --interval or a --trigger-file")
+
+    # Remember written leads across cycles so later cycles dedup against them
+    config.setdefault("pipeline", {})["keep_dedup_index"] = True
+
+    pipeline = build_pipeline(config)
+    daemon = Daemon(
+        pipeline,
+        interval=interval,
+        trigger_file=trigger_file,
+        on_cycle=lambda stats: print_summary(stats, config),
+        existing_leads=lambda: existing_leads_from_config(config),
+        raw_store=raw_store_from_config(config),
+    )
+    daemon.install_signal_handlers()
+    daemon.run()
+
+
+def run_coordinator(config: dict, args: argparse.Namespace) -> None:
+    """Queue a distributed run, wait for the workers and print the aggregated stats."""
+    queue = work_queue_from_config(config)
+    pipeline = build_pipeline(config)
+    queued = pipeline.enqueue(queue, existing_leads_from_config(config))
+    if args.no_wait or not queued.unique:
+        print_summary(queued, config)
+        return
+
+    poll_seconds = config.get("distributed", {}).get("poll_seconds", 2.0)
+    Console().print(f"  Waiting for workers on run {queued.run_id} (queue: {queue.path})")
+    while not queue.is_finished(queued.run_id):
+        time.sleep(poll_seconds)
+
+    failed = queue.progress(queued.run_id)["failed"]
+    if failed:
+        Console().print(f"  [bold red]{failed} chunks failed after all attempts[/bold red]")
+    print_summary(pipeline.finish_distributed(queue, queued.run_id), config)
+
+
+def show_dead_letters(config: dict, purge: bool) -> None:
+    """Print the dead-letter store's status and the entries no longer retried; optionally purge them."""
+    store = dead_letter_store_from_config(config)
+    exhausted = store.exhausted()
+    console = Console()
+    console.print(f"\n[bold]Dead letters in {store.path}[/bold]")
+    console.print(f"  {store.count()} entries, {len(store.due())} due for retry, {len(exhausted)} out of attempts")
+    if exhausted:
+        table = Table(show_header=True, header_style="bold")
+        for column in ("Stage", "Target", "Lead", "Attempts", "Last failed", "Error"):
+            table.add_column(column)
+        for entry in exhausted:
+            table.add_row(
+                entry.stage,
+                entry.target or "-",
+                entry.lead.name or entry.lead.email,
+                str(entry.attempts),
+                entry.last_failed_at,
+                entry.error,
+            )
+        console.print(table)
+    if purge:
+        console.print(f"  Purged {store.purge_exhausted()} entries that were out of attempts")
+
+
+def run_worker(config: dict, args: argparse.Namespace) -> None:
+    """Enrich and write chunks from the work queue until stopped."""
+    worker = Worker(
+        build_pipeline(config),
+        work_queue_from_config(config),
+        poll_seconds=config.get("distributed", {}).get("poll_seconds", 2.0),
+        drain=args.drain,
+    )
+    worker.install_signal_handlers()
+    worker.run()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="LeadFlow AI — AI-powered lead automation suite",
@@ -111,11 +245,79 @@ def main() -> None:
     )
     parser.add_argument(
         "--source", default=None,
-        help=f"Source backend (available: mock, google_sheets, notion)",
+        help=f"Source backend(s), comma-separated (available: mock, google_sheets, notion, webhook, file)",
+    )
+    parser.add_argument(
+        "--file", metavar="PATH", default=None,
+        help="Import leads from a CSV/JSONL file (optionally gzipped); implies --source file",
     )
     parser.add_argument(
         "--dest", default=None,
-        help=f"Destination backend (available: mock, google_sheets, notion)",
+        help=f"Destination backend(s), comma-separated (available: mock, google_sheets, notion, sqlite, parquet)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="Stream leads through the pipeline in chunks of N (0 = whole input at once)",
+    )
+    parser.add_argument(
+        "--pipelined", action="store_true",
+        help="Overlap fetch, enrichment and writing of successive chunks",
+    )
+    parser.add_argument(
+        "--checkpoint", action="store_true",
+        help="Persist stage outputs so the run can be resumed with --resume",
+    )
+    parser.add_argument(
+        "--resume", metavar="RUN_ID", default=None,
+        help="Resume an interrupted checkpointed run from its last completed chunk",
+    )
+    parser.add_argument(
+        "--coordinator", action="store_true",
+        help="Fetch, normalize and dedup, then queue chunks for --worker processes",
+    )
+    parser.add_argument(
+        "--no-wait", action="store_true",
+        help="With --coordinator, exit after queueing instead of waiting for the workers",
+    )
+    parser.add_argument(
+        "--worker", action="store_true",
+        help="Enrich and write chunks leased from the work queue",
+    )
+    parser.add_argument(
+        "--drain", action="store_true",
+        help="With --worker, exit once the queue is empty",
+    )
+    parser.add_argument(
+        "--retry-dead-letters", action="store_true",
+        help="Only reprocess dead-lettered leads whose retry backoff has elapsed",
+    )
+    parser.add_argument(
+        "--dead-letters", action="store_true",
+        help="Show the dead-letter store, listing entries that used up their attempts, and exit",
+    )
+    parser.add_argument(
+        "--purge-dead-letters", action="store_true",
+        help="Delete dead letters that used up their attempts (implies --dead-letters)",
+    )
+    parser.add_argument(
+        "--compact-output", action="store_true",
+        help="Compact the mock destination's JSON-lines archive (destinations.mock.path) and exit",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Profile every stage (cProfile + tracemalloc) and write the artifacts to profiling.dir",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Keep running: build the pipeline once and run it on a schedule",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=None,
+        help="Seconds between daemon cycles (0 = only on --trigger-file)",
+    )
+    parser.add_argument(
+        "--trigger-file", default=None,
+        help="In daemon mode, run a cycle as soon as this file appears",
     )
     args = parser.parse_args()
 
@@ -129,11 +331,48 @@ def main() -> None:
     # CLI overrides for backends
     if args.source:
         config["source_backend"] = args.source
+    if args.file:
+        config.setdefault("sources", {}).setdefault("file", {})["path"] = args.file
+        if not args.source:
+            config["source_backend"] = "file"
     if args.dest:
         config["destination_backend"] = args.dest
+    if args.chunk_size is not None:
+        config.setdefault("pipeline", {})["chunk_size"] = args.chunk_size
+    if args.pipelined:
+        config.setdefault("pipeline", {})["pipelined"] = True
+
+    if args.checkpoint:
+        config.setdefault("checkpoint", {})["enabled"] = True
+    if args.profile:
+        config.setdefault("profiling", {})["enabled"] = True
+    if args.retry_dead_letters or args.dead_letters or args.purge_dead_letters:
+        config.setdefault("dead_letter", {})["enabled"] = True
+
+    if args.dead_letters or args.purge_dead_letters:
+        show_dead_letters(config, purge=args.purge_dead_letters)
+        return
+    if args.compact_output:
+        path = config.get("destinations", {}).get("mock", {}).get("path") or DEFAULT_JSONL_PATH
+        read, kept = compact_archive(path)
+        print(f"Compacted {path}: {read} records -> {kept}")
+        return
+    if args.daemon:
+        run_daemon(config, args, parser)
+        return
+    if args.coordinator:
+        run_coordinator(config, args)
+        return
+    if args.worker:
+        run_worker(config, args)
+        return
 
     pipeline = build_pipeline(config)
-    stats = pipeline.run()
+    if args.retry_dead_letters:
+        print_summary(pipeline.retry_dead_letters(), config)
+        return
+
+    stats = pipeline.run(existing_leads=existing_leads_from_config(config), resume_run_id=args.resume)
     print_summary(stats, config)
 
     # Exit with error if nothing was processed
@@ -7,11 +7,19 @@ from pathlib import Path
 
 import pytest
 
+from leadflow import clients
 from leadflow.models import Lead
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_clients():
+    """Tests patch client constructors, so never let a client outlive its test."""
+    yield
+    clients.reset()
+
+
 @pytest.fixture
 def mock_config() -> dict:
     """Minimal mock-mode configuration."""
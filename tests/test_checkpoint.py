@@ -0,0 +1,147 @@
+"""Tests for run checkpoints and resume."""
+
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from leadflow.checkpoint import RunCheckpoint
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.mock_source import MockSource
+
+
+class TestRunCheckpoint:
+    def test_stage_roundtrip(self, tmp_path):
+        cp = RunCheckpoint(tmp_path, "run-1")
+        assert cp.stage_info("normalized") is None
+        cp.complete_stage("normalized", [Lead(name="Alice")], fetched=1)
+        reopened = RunCheckpoint.resume(tmp_path, "run-1")
+        assert reopened.stage_info("normalized") == {"fetched": 1}
+        assert [l.name for l in reopened.load_stage("normalized")] == ["Alice"]
+
+    def test_chunk_progress(self, tmp_path):
+        cp = RunCheckpoint(tmp_path)
+        assert cp.chunk_status(0) == {}
+        cp.save_enriched_chunk(0, [Lead(name="Bob", status="enriched")], enriched=1)
+        cp.begin_chunk_write(0)
+        assert cp.chunk_status(0) == {"enriched": 1, "writing": True}
+        cp.mark_chunk_written(0, 1, [Lead(name="Bob", email="bob@x.com"), Lead(name="No key")])
+        reopened = RunCheckpoint.resume(tmp_path, cp.run_id)
+        assert reopened.chunk_status(0) == {"enriched": 1, "written": 1}
+        assert reopened.written_keys() == {Lead(email="bob@x.com").dedup_key()}
+
+    def test_remove(self, tmp_path):
+        cp = RunCheckpoint(tmp_path)
+        cp.remove()
+        assert not cp.path.exists()
+
+    def test_resume_unknown_run(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            RunCheckpoint.resume(tmp_path, "missing")
+
+
+class TestCheckpointedPipeline:
+    def _build(self, config, writer=None, enricher=None):
+        return Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(config),
+            enricher=enricher or Enricher(config),
+            writer=writer or MockWriter(config),
+            notifier=SlackNotifier(config),
+            config=config,
+        )
+
+    def test_completed_run_is_removed(self, mock_config, tmp_path, monkeypatch, caplog):
+        monkeypatch.chdir(tmp_path)
+        mock_config["pipeline"] = {"chunk_size": 5}
+        mock_config["checkpoint"] = {"enabled": True, "dir": str(tmp_path / "runs"), "chunk_size": 3}
+        with caplog.at_level(logging.WARNING, logger="leadflow.pipeline"):
+            stats = self._build(mock_config).run()
+        assert stats.written == 10
+        assert "ignore pipeline.chunk_size" in caplog.text
+        assert list((tmp_path / "runs").iterdir()) == []
+
+    def test_resume_skips_recorded_leads(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["checkpoint"] = {"enabled": True, "dir": str(tmp_path / "runs"), "chunk_size": 3}
+        written = []
+
+        class RecordingWriter(MockWriter):
+            def write(self, leads):
+                written.extend(lead.email for lead in leads)
+                return super().write(leads)
+
+        class Crash(BaseException):
+            """The process dies after the chunk's keys were synced, before its manifest update."""
+
+        save_manifest = RunCheckpoint._save_manifest
+
+        def crash_once_chunk_1_is_written(self):
+            if "written" in self._manifest["chunks"].get("1", {}):
+                raise Crash("after the keys were synced")
+            save_manifest(self)
+
+        with patch.object(RunCheckpoint, "_save_manifest", crash_once_chunk_1_is_written):
+            with pytest.raises(Crash):
+                self._build(mock_config, writer=RecordingWriter(mock_config)).run()
+        assert len(written) == 6
+        run_id = next((tmp_path / "runs").iterdir()).name
+
+        stats = self._build(mock_config, writer=RecordingWriter(mock_config)).run(resume_run_id=run_id)
+        assert stats.written == 10
+        assert len(written) == len(set(written)) == 10
+
+    def test_resume_after_crash(self, mock_config, tmp_path, monkeypatch, caplog):
+        monkeypatch.chdir(tmp_path)
+        mock_config["checkpoint"] = {"enabled": True, "dir": str(tmp_path / "runs"), "chunk_size": 3}
+
+        class Crash(BaseException):
+            """Stands in for the process dying; write retries do not catch it."""
+
+        class CrashingWriter(MockWriter):
+            calls = 0
+
+            def write(self, leads):
+                CrashingWriter.calls += 1
+                if CrashingWriter.calls == 2:
+                    raise Crash("deploy")
+                return super().write(leads)
+
+        with pytest.raises(Crash):
+            self._build(mock_config, writer=CrashingWriter(mock_config)).run()
+        run_id = next((tmp_path / "runs").iterdir()).name
+
+        enriched_sizes = []
+
+        class CountingEnricher(Enricher):
+            def enrich(self, leads):
+                enriched_sizes.append(len(leads))
+                return super().enrich(leads)
+
+        with caplog.at_level(logging.WARNING, logger="leadflow.pipeline"):
+            stats = self._build(mock_config, enricher=CountingEnricher(mock_config)).run(resume_run_id=run_id)
+
+        assert "Chunk 1 was interrupted mid-write" in caplog.text
+        assert not (tmp_path / "runs" / run_id).exists()
+        assert stats.run_id == run_id
+        assert stats.fetched == 12
+        assert stats.unique == 10
+        assert stats.written == 10
+        assert stats.notified is True
+        # Chunks 0 and 1 were enriched before the crash; only 2 and 3 call the enricher
+        assert enriched_sizes == [3, 1]
+        data = json.loads((tmp_path / "output" / "leads.json").read_text())
+        assert len(data) == 10
+
+    def test_same_stats_as_batch(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        batch = self._build(mock_config).run().to_dict()
+        mock_config["checkpoint"] = {"enabled": True, "dir": str(tmp_path / "runs"), "chunk_size": 4}
+        checkpointed = self._build(mock_config).run().to_dict()
+        assert checkpointed == {**batch, "duration_seconds": checkpointed["duration_seconds"]}
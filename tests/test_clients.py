@@ -0,0 +1,108 @@
+"""Tests for the shared client registry."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from leadflow import clients
+from leadflow.destinations.master_sheet import GoogleSheetsWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.models import Lead
+from leadflow.sources.google_sheets import GoogleSheetsSource
+
+
+class TestRegistry:
+    def test_one_client_per_service_and_credential(self):
+        build = MagicMock(side_effect=lambda: object())
+        a = clients.get_client("svc", "token-a", build)
+        assert clients.get_client("svc", "token-a", build) is a
+        assert clients.get_client("svc", "token-b", build) is not a
+        assert clients.get_client("other", "token-a", build) is not a
+        assert build.call_count == 3
+
+    def test_slow_build_does_not_block_other_keys(self):
+        started, release = threading.Event(), threading.Event()
+        built = []
+
+        def slow_build():
+            started.set()
+            release.wait(5)
+            built.append(object())
+            return built[-1]
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(clients.get_client("svc", "slow", slow_build)))
+            for _ in range(2)
+        ]
+        threads[0].start()
+        assert started.wait(5)
+        threads[1].start()
+        try:
+            # Served while "slow" is still building
+            assert clients.get_client("svc", "fast", object) is not None
+        finally:
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        assert len(built) == 1
+        assert results == [built[0], built[0]]
+
+    def test_settings_merge_default_and_service(self):
+        config = {"clients": {"default": {"pool_size": 4}, "notion": {"timeout_seconds": 5}}}
+        notion = clients.settings(config, "notion")
+        assert (notion["pool_size"], notion["timeout_seconds"]) == (4, 5)
+        assert notion["requests_per_second"] == 3.0
+        slack = clients.settings({}, "slack")
+        assert slack["pool_size"] == clients.DEFAULT_POOL_SIZE
+        assert slack["timeout_seconds"] == clients.DEFAULT_TIMEOUT_SECONDS
+        assert slack["requests_per_second"] == 0
+
+    def test_reset_closes_clients(self):
+        client = MagicMock()
+        clients.get_client("svc", "", lambda: client)
+        clients.reset()
+        client.close.assert_called_once()
+        assert clients.get_client("svc", "", MagicMock) is not client
+
+
+class TestServiceClients:
+    def test_notion_client_is_pooled_and_shared(self):
+        config = {"clients": {"notion": {"pool_size": 3, "timeout_seconds": 7}}}
+        client_cls = MagicMock()
+        first = clients.notion(config, "secret", client_cls)
+        assert clients.notion(config, "secret", client_cls) is first
+
+        kwargs = client_cls.call_args.kwargs
+        assert kwargs["auth"] == "secret"
+        assert kwargs["timeout_ms"] == 7000
+        assert kwargs["client"]._transport._pool._max_connections == 3
+        client_cls.assert_called_once()
+
+    def test_sheets_source_and_writer_share_one_spreadsheet(self):
+        config = {
+            "clients": {"google_sheets": {"pool_size": 2, "timeout_seconds": 9}},
+            "sources": {"google_sheets": {"spreadsheet_name": "Leads"}},
+            "destinations": {"google_sheets": {"spreadsheet_name": "Leads"}},
+        }
+        gc = MagicMock()
+        with patch("gspread.service_account", return_value=gc) as service_account:
+            GoogleSheetsSource(config)._get_worksheets()
+            GoogleSheetsWriter(config)._get_worksheet()
+
+        service_account.assert_called_once()
+        gc.open.assert_called_once_with("Leads")
+        gc.set_timeout.assert_called_once_with(9)
+        adapter = gc.http_client.session.mount.call_args.args[1]
+        assert adapter._pool_maxsize == 2
+
+    def test_slack_reuses_session(self, monkeypatch):
+        monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.example.com/x")
+        config = {"mock_mode": False, "clients": {"slack": {"timeout_seconds": 4}}}
+        with patch("requests.Session.post") as post:
+            notifier = SlackNotifier(config)
+            assert notifier.notify([Lead(name="A")])
+            assert SlackNotifier(config).notify([Lead(name="B")])
+
+        assert post.call_count == 2
+        assert post.call_args.kwargs["timeout"] == 4
+        assert clients.requests_session(config, "slack") is clients.requests_session(config, "slack")
@@ -0,0 +1,161 @@
+"""Tests for the columnar (Parquet / Arrow IPC) destination."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from leadflow.dead_letter import DeadLetterStore
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.mock_source import MockSource
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from leadflow.destinations.columnar_writer import ColumnarWriter  # noqa: E402
+
+
+def _writer(tmp_path, **cfg):
+    return ColumnarWriter({"destinations": {"parquet": {"dir": str(tmp_path / "leads"), **cfg}}})
+
+
+def _leads(n):
+    return [
+        Lead(
+            name=f"Lead {i}",
+            email=f"l{i}@example.com",
+            source="sheets" if i % 2 else "notion",
+            tags=["seo", "web-design"][: i % 3],
+            raw_data={"row": i},
+        )
+        for i in range(n)
+    ]
+
+
+def _write(writer, leads):
+    written = writer.write(leads)
+    writer.finish()
+    return written
+
+
+def _files(tmp_path, ext="parquet"):
+    return sorted((tmp_path / "leads").rglob(f"*.{ext}"))
+
+
+class TestColumnarWriter:
+    def test_tags_are_list_typed(self, tmp_path):
+        assert _write(_writer(tmp_path), _leads(3)) == 3
+        table = ds.dataset(tmp_path / "leads", format="parquet", partitioning="hive").to_table()
+
+        assert table.schema.field("tags").type == pa.list_(pa.string())
+        assert table.schema.field("ingested_at").type == pa.timestamp("us", tz="UTC")
+        rows = sorted(table.to_pylist(), key=lambda r: r["name"])
+        assert [r["tags"] for r in rows] == [[], ["seo"], ["seo", "web-design"]]
+        assert rows[1]["raw_data"] == '{"row": 1}'
+
+    def test_partitioned_by_date_and_source(self, tmp_path):
+        writer = _writer(tmp_path, partition_by=["ingested_date", "source"])
+        _write(writer, _leads(4))
+
+        files = _files(tmp_path)
+        assert {f.parent.name for f in files} == {"source=notion", "source=sheets"}
+        assert all(f.parent.parent.name.startswith("ingested_date=20") for f in files)
+        # Partition values come from the path, not the file
+        assert "source" not in pq.read_schema(files[0]).names
+
+        table = ds.dataset(tmp_path / "leads", format="parquet", partitioning="hive").to_table(
+            filter=ds.field("source") == "sheets"
+        )
+        assert sorted(table.column("name").to_pylist()) == ["Lead 1", "Lead 3"]
+
+    def test_files_stay_open_across_writes(self, tmp_path):
+        writer = _writer(tmp_path, row_group_rows=4, partition_by=["source"])
+        writer.write(_leads(10))
+        writer.write(_leads(3))
+        assert not _files(tmp_path)  # nothing visible until the run finishes
+
+        writer.finish()
+        files = _files(tmp_path)
+        assert [f.parent.name for f in files] == ["source=notion", "source=sheets"]
+        # Each write adds row groups of at most row_group_rows: 5 leads -> 4 + 1, then 1 more
+        assert [pq.ParquetFile(f).metadata.num_row_groups for f in files] == [3, 3]
+        assert sum(pq.ParquetFile(f).metadata.num_rows for f in files) == 13
+        assert not list((tmp_path / "leads").rglob("*.tmp"))
+
+        writer.write(_leads(1))
+        writer.finish()
+        assert len(_files(tmp_path)) == 3
+
+    def test_arrow_ipc_format(self, tmp_path):
+        _write(_writer(tmp_path, format="arrow"), _leads(3))
+        (path,) = _files(tmp_path, "arrow")
+        with pa.ipc.open_file(path) as reader:
+            assert reader.read_all().num_rows == 3
+
+    def _failing_config(self, tmp_path):
+        return {
+            "destinations": {"parquet": {"dir": str(tmp_path / "leads"), "partition_by": ["source"]}},
+            "dead_letter": {"enabled": True, "path": str(tmp_path / "dlq.db")},
+        }
+
+    def test_failed_partition_dead_letters_its_leads(self, tmp_path):
+        writer = ColumnarWriter(self._failing_config(tmp_path))
+        real = pq.ParquetWriter.write_batch
+        calls = []
+
+        def write_batch(self, batch, *args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            return real(self, batch, *args, **kwargs)
+
+        with patch.object(pq.ParquetWriter, "write_batch", write_batch):
+            # notion (leads 0, 2) is written, sheets (lead 1) fails
+            assert writer.write(_leads(3)) == 2
+        writer.finish()
+        assert [f.parent.name for f in _files(tmp_path)] == ["source=notion"]
+        assert DeadLetterStore(tmp_path / "dlq.db").count("write") == 1
+
+    def test_failed_finish_leaves_no_partial_files(self, tmp_path):
+        writer = ColumnarWriter(self._failing_config(tmp_path))
+        assert writer.write(_leads(3)) == 3
+        with patch("os.replace", side_effect=OSError("disk full")):
+            writer.finish()
+        assert not [p for p in (tmp_path / "leads").rglob("*") if p.is_file()]
+
+    def test_streaming_run_writes_one_file_per_partition(self, mock_config, tmp_path):
+        config = {
+            **mock_config,
+            "pipeline": {"chunk_size": 3},
+            "destinations": {"parquet": {"dir": str(tmp_path / "leads"), "partition_by": ["source"]}},
+        }
+        pipeline = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(config),
+            enricher=Enricher(config),
+            writer=ColumnarWriter(config),
+            notifier=SlackNotifier(config),
+            config=config,
+        )
+        stats = pipeline.run()
+
+        (path,) = _files(tmp_path)
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_rows == stats.written == 10
+        assert metadata.num_row_groups > 1
+
+    def test_invalid_settings(self, tmp_path):
+        with pytest.raises(ValueError, match="format"):
+            _writer(tmp_path, format="csv")
+        with pytest.raises(ValueError, match="partition"):
+            _writer(tmp_path, partition_by=["email"])
+
+    def test_missing_pyarrow(self, tmp_path):
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(ImportError, match="leadflow-ai\\[parquet\\]"):
+                _writer(tmp_path)
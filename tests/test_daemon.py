@@ -0,0 +1,181 @@
+"""Tests for daemon mode."""
+
+import logging
+import threading
+
+import pytest
+
+from leadflow.daemon import Daemon
+from leadflow.destinations.base import LeadDestination
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.raw_store import RawStore
+from leadflow.sources.mock_source import MockSource
+
+
+def _pipeline(config, writer=None):
+    return Pipeline(
+        source=MockSource(),
+        deduplicator=Deduplicator(config),
+        enricher=Enricher(config),
+        writer=writer if writer is not None else MockWriter(config),
+        notifier=SlackNotifier(config),
+        config=config,
+    )
+
+
+class SwitchableDestination(LeadDestination):
+    def __init__(self, name="switch", failing=False):
+        self._name = name
+        self.failing = failing
+
+    @property
+    def name(self):
+        return self._name
+
+    def write(self, leads):
+        return 0 if self.failing else len(leads)
+
+
+def _tracked(leads, reads):
+    """Yield *leads*, counting in *reads* how often the iterable is consumed."""
+    reads.append(1)
+    yield from leads
+
+
+class TestDaemon:
+    def test_runs_cycles_until_stopped(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["pipeline"] = {"keep_dedup_index": True}
+        results = []
+
+        def on_cycle(stats):
+            results.append(stats)
+            if len(results) == 2:
+                daemon.stop()
+
+        daemon = Daemon(_pipeline(mock_config), interval=0.01, on_cycle=on_cycle, poll_seconds=0.01)
+        daemon.run()
+
+        assert daemon.cycles == 2
+        assert results[0].unique == 10
+        # The warm dedup index remembers the first cycle's leads
+        assert results[1].unique == 0
+        assert results[1].duplicates == 12
+
+    def test_trigger_file(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        trigger = tmp_path / "run.now"
+        cycles = []
+        daemon = Daemon(
+            _pipeline(mock_config),
+            interval=0,
+            trigger_file=str(trigger),
+            on_cycle=lambda stats: (cycles.append(stats), daemon.stop()),
+            poll_seconds=0.01,
+        )
+        thread = threading.Thread(target=daemon.run)
+        thread.start()
+        trigger.touch()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert len(cycles) == 1
+        assert not trigger.exists()
+
+    def test_failed_cycle_keeps_running(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pipeline = _pipeline(mock_config)
+        calls = []
+
+        def flaky_run(**kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("rate limit storm")
+            daemon.stop()
+            return None
+
+        pipeline.run = flaky_run
+        daemon = Daemon(pipeline, interval=0.01, poll_seconds=0.01)
+        daemon.run()
+        assert len(calls) == 2
+
+    def test_cycle_reads_store_and_rotates_raw_rows(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pipeline = _pipeline(mock_config)
+        raw_store = RawStore()
+        spilled = raw_store.put({"row": 0})
+        seen = []
+
+        def run(**kwargs):
+            seen.append(kwargs["existing_leads"])
+            if len(seen) == 2:
+                daemon.stop()
+            return None
+
+        pipeline.run = run
+        daemon = Daemon(
+            pipeline,
+            interval=0.01,
+            poll_seconds=0.01,
+            existing_leads=lambda: ["stored"],
+            raw_store=raw_store,
+        )
+        daemon.run()
+        assert seen == [["stored"], ["stored"]]
+        with pytest.raises(KeyError):
+            spilled.load()
+
+
+class TestWarmDedupIndex:
+    def _config(self, mock_config, **pipeline_cfg):
+        mock_config["pipeline"] = {"keep_dedup_index": True, **pipeline_cfg}
+        mock_config["destinations"] = {"retries": 0, "retry_backoff": 0}
+        return mock_config
+
+    def test_index_reused_and_store_read_once(self, mock_config):
+        pipeline = _pipeline(self._config(mock_config), SwitchableDestination())
+        reads = []
+        first = pipeline.run(existing_leads=_tracked([], reads))
+        second = pipeline.run(existing_leads=_tracked([], reads))
+        assert (first.unique, second.unique) == (10, 0)
+        assert second.duplicates == 12
+        assert len(reads) == 1
+
+    def test_only_written_leads_are_remembered(self, mock_config):
+        writer = SwitchableDestination(failing=True)
+        pipeline = _pipeline(self._config(mock_config), writer)
+        assert pipeline.run().written == 0
+        writer.failing = False
+        assert pipeline.run().unique == 10
+        assert pipeline.run().unique == 0
+
+    def test_streaming_fanout_remembers_chunks_every_destination_wrote(self, mock_config):
+        config = self._config(mock_config, chunk_size=5)
+        broken = SwitchableDestination("broken", failing=True)
+        pipeline = _pipeline(config, [SwitchableDestination("ok"), broken])
+        pipeline.run()
+        broken.failing = False
+        second = pipeline.run()
+        assert second.unique == 10
+        assert second.written == 10
+        assert pipeline.run().unique == 0
+
+    def test_rebuilt_from_stored_leads_past_limit(self, mock_config):
+        pipeline = _pipeline(self._config(mock_config, max_dedup_index_entries=5), SwitchableDestination())
+        reads = []
+        pipeline.run(existing_leads=_tracked([], reads))
+        # Over the limit: the next run rebuilds from the store instead of the index
+        second = pipeline.run(existing_leads=_tracked([], reads))
+        assert len(reads) == 2
+        assert second.unique == 10
+
+    def test_rebuild_without_stored_leads_warns(self, mock_config, caplog):
+        pipeline = _pipeline(self._config(mock_config, max_dedup_index_entries=5), SwitchableDestination())
+        pipeline.run()
+        with caplog.at_level(logging.WARNING, logger="leadflow.pipeline"):
+            assert pipeline.run().unique == 10
+        assert "empty index" in caplog.text
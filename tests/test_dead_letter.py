@@ -0,0 +1,229 @@
+"""Tests for the dead-letter store and dead-letter retries."""
+
+import copy
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from leadflow.dead_letter import DEAD_LETTERED, DeadLetterStore, dead_letter_store_from_config, dead_letter_writes
+from leadflow.destinations.base import LeadDestination
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.notion_writer import NotionWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.mock_source import MockSource
+
+
+class TestDeadLetterStore:
+    def test_add_and_due(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0)
+        store.add("enrich", Lead(name="Alice", email="a@x.com", tags=["seo"]), RuntimeError("boom"))
+        [entry] = store.due()
+        assert (entry.stage, entry.target, entry.error, entry.attempts) == ("enrich", "", "boom", 1)
+        assert entry.lead.name == "Alice"
+        assert entry.lead.tags == ["seo"]
+
+    def test_repeat_failure_updates_entry_with_backoff(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=10, max_backoff_seconds=25)
+        lead = Lead(name="Alice", email="a@x.com")
+        store.add("write", lead, "first", target="notion")
+        [first] = store.due(now=1e12)
+        store.add("write", lead, "second", target="notion")
+        store.add("write", lead, "third", target="notion")
+        [entry] = store.due(now=1e12)
+        assert entry.id == first.id
+        assert entry.attempts == 3
+        assert entry.error == "third"
+        # 10s after the first failure, then 20s, 40s capped at 25s
+        assert entry.next_retry_at - first.next_retry_at == pytest.approx(15, abs=1)
+        assert store.due(now=first.next_retry_at) == []
+
+    def test_stages_and_targets_are_separate_entries(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db")
+        lead = Lead(name="Alice")
+        store.add("enrich", lead, "x")
+        store.add("write", lead, "x", target="notion")
+        assert store.count() == 2
+        assert store.count("write") == 1
+
+    def test_max_attempts(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0, max_attempts=2)
+        lead = Lead(name="Alice")
+        store.add("enrich", lead, "x")
+        store.add("enrich", lead, "x")
+        assert store.due(now=1e12) == []
+        assert store.count() == 1
+
+    def test_exhausted_entries_listed_and_purged(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0, max_attempts=2)
+        store.add("enrich", Lead(name="Alice"), "x")
+        store.add("enrich", Lead(name="Alice"), "again")
+        store.add("write", Lead(name="Bob"), "x", target="notion")
+        [entry] = store.exhausted()
+        assert (entry.lead.name, entry.attempts, entry.error) == ("Alice", 2, "again")
+
+        assert store.purge_exhausted() == 1
+        assert [e.lead.name for e in store.due(now=1e12)] == ["Bob"]
+        assert store.exhausted() == []
+
+    def test_resolve_keeps_entries_that_failed_again(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0)
+        store.add("enrich", Lead(name="Alice"), "x")
+        store.add("enrich", Lead(name="Bob"), "x")
+        entries = store.due()
+        store.add("enrich", Lead(name="Bob"), "again")
+        assert store.resolve(entries) == 1
+        [left] = store.due(now=1e12)
+        assert left.lead.name == "Bob"
+
+    def test_persists_across_instances(self, tmp_path):
+        DeadLetterStore(tmp_path / "dlq.db").add("enrich", Lead(name="Alice"), "x")
+        assert DeadLetterStore(tmp_path / "dlq.db").count() == 1
+
+
+class PartialWriter(LeadDestination):
+    """Writes only the first *accepts* leads of a call, dead-lettering the rest if *report*."""
+
+    def __init__(self, config, accepts, report=True):
+        self._dead_letters = dead_letter_store_from_config(config)
+        self._accepts = accepts
+        self._report = report
+
+    @property
+    def name(self):
+        return "partial"
+
+    def write(self, leads):
+        if self._report:
+            dead_letter_writes(self._dead_letters, leads[self._accepts :], "quota", self.name)
+        return min(len(leads), self._accepts)
+
+
+@patch("leadflow.processing.enricher.time.sleep")
+class TestEnrichmentDeadLetters:
+    def _setup(self, mock_config, tmp_path, writer=None):
+        mock_config["dead_letter"] = {"enabled": True, "path": str(tmp_path / "dlq.db"), "backoff_seconds": 0}
+        mock_config["destinations"] = {"retries": 0}
+        live_config = copy.deepcopy(mock_config)
+        live_config["mock_mode"] = False
+        client = MagicMock()
+        client.messages.create.side_effect = RuntimeError("overloaded")
+        pipeline = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(live_config, client),
+            writer=writer(mock_config) if writer is not None else MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+        return pipeline, client
+
+    @staticmethod
+    def _succeed(client):
+        def create(**kwargs):
+            n = kwargs["messages"][0]["content"].count("Lead ")
+            response = MagicMock()
+            response.content[0].text = json.dumps([{"summary": "S", "tags": ["seo"]}] * n)
+            return response
+
+        client.messages.create.side_effect = create
+
+    def test_failed_leads_are_held_back_then_retried(self, _sleep, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pipeline, client = self._setup(mock_config, tmp_path)
+
+        stats = pipeline.run()
+        assert stats.unique == 10
+        assert stats.enriched == 0
+        assert stats.dead_lettered == 10
+        assert stats.written == 0
+        assert not (tmp_path / "output" / "leads.json").exists()
+
+        self._succeed(client)
+        calls_before = client.messages.create.call_count
+        retry = pipeline.retry_dead_letters()
+        assert retry.fetched == 10
+        assert retry.enriched == 10
+        assert retry.written == 10
+        assert retry.dead_lettered == 0
+        # Only the failed leads were reprocessed: 10 leads in batches of 5
+        assert client.messages.create.call_count - calls_before == 2
+        data = json.loads((tmp_path / "output" / "leads.json").read_text())
+        assert len(data) == 10
+        assert {row["status"] for row in data} == {"enriched"}
+
+    def test_retry_that_fails_again_backs_off(self, _sleep, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        pipeline, _client = self._setup(mock_config, tmp_path)
+        pipeline.run()
+
+        retry = pipeline.retry_dead_letters()
+        assert retry.fetched == 10
+        assert retry.written == 0
+        assert retry.dead_lettered == 10
+        store = DeadLetterStore(tmp_path / "dlq.db")
+        assert {entry.attempts for entry in store.due(now=1e12)} == {2}
+
+    def test_partial_retry_write_leaves_failures_to_their_destination(
+        self, _sleep, mock_config, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        pipeline, client = self._setup(mock_config, tmp_path, lambda config: PartialWriter(config, 4))
+        pipeline.run()
+        self._succeed(client)
+
+        retry = pipeline.retry_dead_letters()
+        assert retry.written == 4
+        store = DeadLetterStore(tmp_path / "dlq.db")
+        assert store.count("enrich") == 0
+        assert {entry.target for entry in store.due(now=1e12)} == {"partial"}
+        assert store.count("write") == 6
+
+    def test_partial_retry_write_without_dead_letters_keeps_entries(
+        self, _sleep, mock_config, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        pipeline, client = self._setup(
+            mock_config, tmp_path, lambda config: PartialWriter(config, 4, report=False)
+        )
+        pipeline.run()
+        self._succeed(client)
+
+        assert pipeline.retry_dead_letters().written == 4
+        assert DeadLetterStore(tmp_path / "dlq.db").count("enrich") == 10
+
+    def test_streaming_run_holds_back_failed_leads(self, _sleep, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["pipeline"] = {"chunk_size": 4}
+        pipeline, _client = self._setup(mock_config, tmp_path)
+        stats = pipeline.run()
+        assert stats.dead_lettered == stats.unique
+        assert stats.written == 0
+
+
+@patch("leadflow.destinations.notion_writer.os.getenv")
+class TestNotionDeadLetters:
+    def test_failed_page_create_is_dead_lettered(self, mock_getenv, tmp_path):
+        mock_getenv.side_effect = lambda key, default="": {
+            "NOTION_TOKEN": "test-token",
+            "NOTION_DEST_DATABASE_ID": "test-db-id",
+        }.get(key, default)
+        config = {
+            "destinations": {"notion": {}},
+            "dead_letter": {"enabled": True, "path": str(tmp_path / "dlq.db"), "backoff_seconds": 0},
+        }
+        writer = NotionWriter(config)
+        leads = [Lead(name="Alice"), Lead(name="Bob")]
+
+        with patch("leadflow.destinations.notion_writer.Client") as MockClient:
+            MockClient.return_value.pages.create.side_effect = [None, RuntimeError("conflict")]
+            assert writer.write(leads) == 1
+
+        [entry] = DeadLetterStore(tmp_path / "dlq.db").due()
+        assert (entry.stage, entry.target, entry.error) == ("write", "notion", "conflict")
+        assert entry.lead.name == "Bob"
+        assert entry.lead.status != DEAD_LETTERED
@@ -1,7 +1,7 @@
 """Tests for the deduplication module."""
 
 from leadflow.models import Lead
-from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.deduplicator import DedupIndex, Deduplicator
 from leadflow.processing.normalizer import normalize_lead
 
 
@@ -79,3 +79,68 @@ class TestFuzzyDedup:
         assert not dedup._has_shared_name_tokens(
             Lead(name="Alice Smith"), Lead(name="Bob Jones")
         )
+
+
+class TestStoredKeys:
+    def test_binary_existing_key(self, mock_config):
+        dedup = Deduplicator(mock_config)
+        stored = Lead(email="sarah@example.com", phone="5551234567").dedup_key()
+        incoming = [Lead(name="Sarah Chen", email="sarah@example.com", phone="5551234567")]
+        unique, dups = dedup.deduplicate(incoming, existing_keys=[stored])
+        assert len(unique) == 0
+        assert len(dups) == 1
+
+    def test_legacy_md5_existing_key(self, mock_config):
+        dedup = Deduplicator(mock_config)
+        stored = Lead(email="sarah@example.com", phone="5551234567").legacy_dedup_key()
+        incoming = [
+            Lead(name="Sarah Chen", email="sarah@example.com", phone="5551234567"),
+            Lead(name="Bob", email="bob@example.com", phone="2222222222"),
+        ]
+        unique, dups = dedup.deduplicate(incoming, existing_keys=[stored])
+        assert [l.name for l in unique] == ["Bob"]
+        assert len(dups) == 1
+
+
+class TestChunkedDedup:
+    def test_chunks_match_single_pass(self, mock_config, sample_leads):
+        dedup = Deduplicator(mock_config)
+        leads = [normalize_lead(l) for l in sample_leads]
+        unique, dups = dedup.deduplicate(leads)
+
+        index = dedup.new_index()
+        chunked_unique, chunked_dups = [], []
+        for i in range(0, len(leads), 3):
+            u, d = dedup.deduplicate_chunk(leads[i : i + 3], index)
+            chunked_unique += u
+            chunked_dups += d
+        assert [l.name for l in chunked_unique] == [l.name for l in unique]
+        assert len(chunked_dups) == len(dups)
+
+    def test_index_candidates_share_name_token(self, mock_config):
+        dedup = Deduplicator(mock_config)
+        index = dedup.new_index([Lead(name="Sarah Chen"), Lead(name="Bob Jones")])
+        names = [c.name for c in index.candidates(Lead(name="Dr. Sarah Smith"))]
+        assert names == ["Sarah Chen"]
+
+    def test_child_index_leaves_parent_unchanged(self, mock_config):
+        dedup = Deduplicator(mock_config)
+        parent = dedup.new_index([Lead(name="Sarah Chen", email="sarah@acme.com")])
+        child = DedupIndex(parent=parent)
+        unique, dups = dedup.deduplicate_chunk(
+            [Lead(name="Sarah Chen", email="sarah@acme.com"), Lead(name="Bob Jones", email="bob@x.com")],
+            child,
+        )
+        assert [l.name for l in unique] == ["Bob Jones"]
+        assert len(dups) == 1
+        assert not parent.has_key(Lead(name="Bob Jones", email="bob@x.com"))
+
+        parent.merge(child)
+        assert parent.has_key(Lead(name="Bob Jones", email="bob@x.com"))
+        assert [c.name for c in parent.candidates(Lead(name="Bob"))] == ["Bob Jones"]
+
+    def test_len_counts_each_lead_once(self, mock_config):
+        index = Deduplicator(mock_config).new_index(
+            [Lead(name="Sarah Chen", email="sarah@acme.com"), Lead(name="Bob Jones"), Lead(email="x@y.com")]
+        )
+        assert len(index) == 3
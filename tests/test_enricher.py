@@ -1,5 +1,8 @@
 """Tests for the enrichment module."""
 
+import json
+from unittest.mock import MagicMock
+
 from leadflow.models import Lead
 from leadflow.processing.enricher import Enricher
 
@@ -61,3 +64,35 @@ class TestMockEnrichment:
         )
         result = enricher.enrich([lead])[0]
         assert len(result.tags) <= 5
+
+
+class TestEnrichmentCache:
+    def _live_enricher(self, mock_config, cache_size):
+        mock_config["mock_mode"] = False
+        mock_config["processing"]["enrichment"]["cache_size"] = cache_size
+        client = MagicMock()
+
+        def create(**kwargs):
+            n = kwargs["messages"][0]["content"].count("Lead ")
+            response = MagicMock()
+            response.content[0].text = json.dumps([{"summary": "S", "tags": ["seo"]}] * n)
+            return response
+
+        client.messages.create.side_effect = create
+        return Enricher(mock_config, client), client
+
+    def test_cache_hit_skips_claude(self, mock_config):
+        enricher, client = self._live_enricher(mock_config, cache_size=10)
+        enricher.enrich([Lead(name="Alice", company="Acme", notes="seo")])
+        lead = Lead(name="Alice", company="Acme", notes="seo")
+        result = enricher.enrich([lead])
+        assert client.messages.create.call_count == 1
+        assert result == [lead]
+        assert lead.status == "enriched"
+        assert lead.tags == ["seo"]
+
+    def test_cache_disabled(self, mock_config):
+        enricher, client = self._live_enricher(mock_config, cache_size=0)
+        enricher.enrich([Lead(name="Alice", company="Acme", notes="seo")])
+        enricher.enrich([Lead(name="Alice", company="Acme", notes="seo")])
+        assert client.messages.create.call_count == 2
@@ -0,0 +1,49 @@
+"""Tests for threaded stage execution."""
+
+import threading
+import time
+
+import pytest
+
+from leadflow.executor import run_ahead
+
+
+class TestRunAhead:
+    def test_yields_in_order(self):
+        assert list(run_ahead(iter(range(10)), 2, "test")) == list(range(10))
+
+    def test_runs_on_worker_thread(self):
+        threads = []
+
+        def gen():
+            for i in range(3):
+                threads.append(threading.current_thread())
+                yield i
+
+        list(run_ahead(gen(), 1, "test"))
+        assert all(t is not threading.current_thread() for t in threads)
+
+    def test_bounded_lookahead(self):
+        produced = []
+
+        def gen():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        it = run_ahead(gen(), 2, "test")
+        assert next(it) == 0
+        time.sleep(0.1)
+        # one consumed, two queued, one blocked in put
+        assert len(produced) <= 4
+        it.close()
+
+    def test_propagates_exceptions(self):
+        def gen():
+            yield 1
+            raise RuntimeError("boom")
+
+        it = run_ahead(gen(), 2, "test")
+        assert next(it) == 1
+        with pytest.raises(RuntimeError, match="boom"):
+            next(it)
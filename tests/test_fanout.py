@@ -0,0 +1,196 @@
+"""Tests for concurrent multi-destination fan-out."""
+
+import threading
+import time
+
+from leadflow.dead_letter import DeadLetterStore, dead_letter_writes
+from leadflow.destinations.base import LeadDestination
+from leadflow.destinations.fanout import FanOut, write_with_retry
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.mock_source import MockSource
+
+
+class RecordingDestination(LeadDestination):
+    def __init__(self, name, delay=0.0, failures=0, barrier=None):
+        self._name = name
+        self._delay = delay
+        self._failures = failures
+        self._barrier = barrier
+        self.calls = 0
+        self.written: list[str] = []
+        self.finished_at = 0.0
+
+    @property
+    def name(self):
+        return self._name
+
+    def write(self, leads):
+        self.calls += 1
+        if self._barrier is not None:
+            self._barrier.wait(timeout=2)
+        time.sleep(self._delay)
+        if self._failures:
+            self._failures -= 1
+            raise RuntimeError("rate limited")
+        self.written.extend(l.name for l in leads)
+        self.finished_at = time.perf_counter()
+        return len(leads)
+
+
+class DeadLetteringDestination(RecordingDestination):
+    """Swallows its failures into a dead-letter store, like the real writers."""
+
+    def __init__(self, name, store, failures=0):
+        super().__init__(name, failures=failures)
+        self._store = store
+
+    def write(self, leads):
+        try:
+            return super().write(leads)
+        except RuntimeError as e:
+            dead_letter_writes(self._store, leads, e, self.name)
+            return 0
+
+
+def _leads(n, prefix="L"):
+    return [Lead(name=f"{prefix}{i}") for i in range(n)]
+
+
+class TestFanOut:
+    def test_write_now_is_concurrent(self):
+        # Both writes must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2)
+        a = RecordingDestination("a", barrier=barrier)
+        b = RecordingDestination("b", barrier=barrier)
+        counts = FanOut([a, b]).write_now(_leads(3))
+        assert counts == {"a": 3, "b": 3}
+        assert not barrier.broken
+
+    def test_retries_are_independent(self):
+        flaky = RecordingDestination("flaky", failures=1)
+        steady = RecordingDestination("steady")
+        counts = FanOut([flaky, steady], backoff=0).write_now(_leads(2))
+        assert counts == {"flaky": 2, "steady": 2}
+        assert flaky.calls == 2
+        assert steady.calls == 1
+
+    def test_gives_up_after_retries(self):
+        broken = RecordingDestination("broken", failures=5)
+        assert write_with_retry(broken, _leads(1), retries=2, backoff=0) == 0
+        assert broken.calls == 3
+
+    def test_dead_letters_only_after_last_attempt(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0)
+        recovered = DeadLetteringDestination("recovered", store, failures=1)
+        assert FanOut([recovered], backoff=0).write_now(_leads(2)) == {"recovered": 2}
+        assert store.count("write") == 0
+
+        broken = DeadLetteringDestination("broken", store, failures=5)
+        assert write_with_retry(broken, _leads(2), retries=2, backoff=0) == 0
+        assert broken.calls == 3
+        assert [entry.attempts for entry in store.due()] == [1, 1]
+
+    def test_partial_write_retries_dead_lettered_leads(self, tmp_path):
+        store = DeadLetterStore(tmp_path / "dlq.db")
+
+        class HalfFirstTime(DeadLetteringDestination):
+            def write(self, leads):
+                self.calls += 1
+                if self.calls == 1:
+                    dead_letter_writes(self._store, leads[2:], "quota", self.name)
+                    leads = leads[:2]
+                self.written.extend(l.name for l in leads)
+                return len(leads)
+
+        destination = HalfFirstTime("half", store)
+        assert write_with_retry(destination, _leads(5), retries=2, backoff=0) == 5
+        assert destination.calls == 2
+        assert sorted(destination.written) == [f"L{i}" for i in range(5)]
+        assert store.count() == 0
+
+    def test_slow_destination_does_not_block_fast_one(self):
+        slow = RecordingDestination("slow", delay=0.05)
+        fast = RecordingDestination("fast")
+        fanout = FanOut([slow, fast], max_pending=4)
+        for i in range(4):
+            fanout.submit(_leads(2, prefix=f"C{i}-"))
+        totals = fanout.close()
+        assert totals == {"slow": 8, "fast": 8}
+        assert fast.finished_at < slow.finished_at - 0.1
+
+    def test_duplicate_names_get_unique_labels(self):
+        fanout = FanOut([RecordingDestination("mock"), RecordingDestination("mock")])
+        assert fanout.labels == ["mock", "mock#2"]
+
+    def test_totals_reset_between_runs(self):
+        a, b = RecordingDestination("a"), RecordingDestination("b")
+        fanout = FanOut([a, b])
+        fanout.submit(_leads(2))
+        assert fanout.close() == {"a": 2, "b": 2}
+        fanout.submit(_leads(1))
+        assert fanout.close() == {"a": 1, "b": 1}
+
+
+class TestPipelineFanOut:
+    def _build(self, config, writers):
+        return Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(config),
+            enricher=Enricher(config),
+            writer=writers,
+            notifier=SlackNotifier(config),
+            config=config,
+        )
+
+    def test_batch_writes_every_destination(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        extra = RecordingDestination("extra")
+        stats = self._build(mock_config, [MockWriter(mock_config), extra]).run()
+        assert stats.written_by_destination == {"mock": stats.unique, "extra": stats.unique}
+        assert stats.written == stats.unique
+        assert len(extra.written) == stats.unique
+
+    def test_single_destination_retries_and_dead_letters_once(self, mock_config, tmp_path):
+        mock_config["destinations"] = {"retries": 1, "retry_backoff": 0}
+        store = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0)
+        recovered = DeadLetteringDestination("recovered", store, failures=1)
+        assert self._build(mock_config, recovered).run().written == 10
+        assert recovered.calls == 2
+        assert store.count() == 0
+
+        broken = DeadLetteringDestination("broken", store, failures=5)
+        assert self._build(mock_config, broken).run().written == 0
+        assert broken.calls == 2
+        assert {entry.attempts for entry in store.due()} == {1}
+        assert store.count() == 10
+
+    def test_streaming_writes_every_destination(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["pipeline"] = {"chunk_size": 3, "pipelined": True}
+        slow = RecordingDestination("slow", delay=0.01)
+        stats = self._build(mock_config, [MockWriter(mock_config), slow]).run()
+        assert stats.written_by_destination == {"mock": stats.unique, "slow": stats.unique}
+        assert stats.written == stats.unique
+
+    def test_written_counts_leads_in_every_destination(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["destinations"]["retries"] = 0
+        broken = RecordingDestination("broken", failures=100)
+        stats = self._build(mock_config, [MockWriter(mock_config), broken]).run()
+        assert stats.written_by_destination["mock"] == stats.unique
+        assert stats.written_by_destination["broken"] == 0
+        assert stats.written == 0
+
+    def test_dry_run_writes_nothing(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["dry_run"] = True
+        mock_config["pipeline"] = {"chunk_size": 4}
+        a, b = RecordingDestination("a"), RecordingDestination("b")
+        stats = self._build(mock_config, [a, b]).run()
+        assert stats.written == 0
+        assert a.calls == b.calls == 0
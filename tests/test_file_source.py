@@ -0,0 +1,82 @@
+"""Tests for the CSV/JSONL file source."""
+
+import gzip
+import json
+
+import pytest
+
+from leadflow.sources.file_source import FileSource
+
+CSV = (
+    "Full Name,E-mail,phone,company,notes,Booth\n"
+    "Jane Doe,jane@acme.com,555-0100,Acme,\"Wants SEO,\nand a redesign\",12\n"
+    "\n"
+    "Bob Ray,bob@globex.com\n"
+)
+
+
+def _source(path, **cfg):
+    return FileSource({"sources": {"file": {"path": str(path), **cfg}}})
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+class TestFileSource:
+    def test_csv_with_column_mapping(self, tmp_path, use_mmap):
+        path = tmp_path / "leads.csv"
+        path.write_text("\ufeff" + CSV)
+        leads = _source(path, mmap=use_mmap, columns={"name": "Full Name", "email": "E-mail"}).fetch()
+
+        assert [l.name for l in leads] == ["Jane Doe", "Bob Ray"]
+        assert leads[0].email == "jane@acme.com"
+        assert leads[0].notes == "Wants SEO,\nand a redesign"
+        assert leads[0].source == "file"
+        assert leads[0].raw_data["Booth"] == "12"
+        # Short rows are padded
+        assert leads[1].phone == ""
+
+    def test_gzip_is_detected(self, tmp_path, use_mmap):
+        path = tmp_path / "leads.csv.gz"
+        path.write_bytes(gzip.compress(CSV.encode()))
+        leads = _source(path, mmap=use_mmap, columns={"name": "Full Name"}).fetch()
+        assert [l.name for l in leads] == ["Jane Doe", "Bob Ray"]
+
+    def test_jsonl(self, tmp_path, use_mmap):
+        path = tmp_path / "leads.jsonl.gz"
+        lines = [
+            json.dumps({"name": "Jane", "phone": 5550100, "company": None}),
+            "{not json",
+            "",
+            json.dumps(["not", "an", "object"]),
+            json.dumps({"name": "Bob"}),
+        ]
+        path.write_bytes(gzip.compress("\n".join(lines).encode()))
+        leads = _source(path, mmap=use_mmap).fetch()
+
+        assert [l.name for l in leads] == ["Jane", "Bob"]
+        assert leads[0].phone == "5550100"
+        assert leads[0].company == ""
+
+    def test_iter_batches(self, tmp_path, use_mmap):
+        path = tmp_path / "leads.tsv"
+        path.write_text("name\temail\n" + "".join(f"Lead {i}\tl{i}@x.com\n" for i in range(7)))
+        batches = list(_source(path, mmap=use_mmap).iter_batches(3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert batches[2][0].email == "l6@x.com"
+
+
+class TestFileSourceErrors:
+    def test_missing_file(self, tmp_path):
+        assert _source(tmp_path / "nope.csv").fetch() == []
+
+    def test_path_not_set(self):
+        assert FileSource({}).fetch() == []
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+        assert _source(path, mmap=True).fetch() == []
+
+    def test_explicit_format(self, tmp_path):
+        path = tmp_path / "export.txt"
+        path.write_text(json.dumps({"name": "Jane"}) + "\n")
+        assert [l.name for l in _source(path, format="jsonl").fetch()] == ["Jane"]
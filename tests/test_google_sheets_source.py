@@ -0,0 +1,119 @@
+"""Tests for the Google Sheets source."""
+
+import re
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from leadflow.sources.google_sheets import GoogleSheetsSource
+
+
+def _worksheet(rows, row_count=None, delay=0.0, fail_at=None):
+    """Fake worksheet serving ``get_values("A{start}:{col}{end}")`` from *rows*."""
+    header, body = rows[0], rows[1:]
+    ws = MagicMock()
+    ws.row_values.return_value = header
+    ws.row_count = row_count or len(rows)
+    ws.ranges = []
+    ws.active = ws.peak = 0
+    lock = threading.Lock()
+
+    def get_values(range_name):
+        start, end = (int(n) for n in re.findall(r"\d+", range_name))
+        with lock:
+            ws.ranges.append(range_name)
+            ws.active += 1
+            ws.peak = max(ws.peak, ws.active)
+        try:
+            time.sleep(delay)
+            if fail_at == start:
+                raise RuntimeError("quota exceeded")
+            values = [list(r) for r in body[start - 2 : end - 1]]
+            while values and not any(values[-1]):
+                values.pop()  # the API omits trailing empty rows
+            return values
+        finally:
+            with lock:
+                ws.active -= 1
+
+    ws.get_values.side_effect = get_values
+    return ws
+
+
+def _rows(n, prefix="Lead"):
+    return [["name", "email"]] + [[f"{prefix} {i}", f"{i}@example.com"] for i in range(n)]
+
+
+def _source(spreadsheet, sync=None, **cfg):
+    gc = MagicMock()
+    gc.open.return_value = spreadsheet
+    config = {"sources": {"google_sheets": {"window_rows": 3, "max_concurrent_reads": 2, **cfg}}}
+    if sync:
+        config["sync"] = sync
+    return GoogleSheetsSource(config), patch("gspread.service_account", return_value=gc)
+
+
+class TestWindowedReads:
+    def test_reads_header_once_then_row_windows(self):
+        ws = _worksheet(_rows(7))
+        spreadsheet = MagicMock()
+        spreadsheet.get_worksheet.return_value = ws
+        source, service_account = _source(spreadsheet)
+        with service_account:
+            leads = source.fetch()
+
+        assert [l.name for l in leads] == [f"Lead {i}" for i in range(7)]
+        assert ws.ranges == ["A2:B4", "A5:B7", "A8:B10"]
+        ws.row_values.assert_called_once_with(1)
+        assert leads[0].raw_data == {"name": "Lead 0", "email": "0@example.com"}
+
+    def test_reads_are_concurrent_but_bounded(self):
+        ws = _worksheet(_rows(30), delay=0.02)
+        spreadsheet = MagicMock()
+        spreadsheet.get_worksheet.return_value = ws
+        source, service_account = _source(spreadsheet)
+        with service_account:
+            assert len(source.fetch()) == 30
+        assert ws.peak == 2
+
+    def test_iter_batches_splits_windows(self):
+        ws = _worksheet(_rows(7))
+        spreadsheet = MagicMock()
+        spreadsheet.get_worksheet.return_value = ws
+        source, service_account = _source(spreadsheet)
+        with service_account:
+            sizes = [len(b) for b in source.iter_batches(2)]
+        assert sizes == [2, 1, 2, 1, 1]
+
+    def test_blank_rows_are_skipped(self):
+        rows = _rows(2) + [["", ""]] * 4 + [["Late", "late@example.com"]]
+        ws = _worksheet(rows, row_count=20)
+        spreadsheet = MagicMock()
+        spreadsheet.get_worksheet.return_value = ws
+        source, service_account = _source(spreadsheet)
+        with service_account:
+            assert [l.name for l in source.fetch()] == ["Lead 0", "Lead 1", "Late"]
+
+    def test_several_worksheets_by_index_and_title(self):
+        first, second = _worksheet(_rows(4, "First")), _worksheet(_rows(5, "Second"))
+        spreadsheet = MagicMock()
+        spreadsheet.get_worksheet.return_value = first
+        spreadsheet.worksheet.return_value = second
+        source, service_account = _source(spreadsheet, worksheets=[0, "Imports"])
+        with service_account:
+            names = sorted(l.name for l in source.fetch())
+
+        spreadsheet.worksheet.assert_called_once_with("Imports")
+        assert names == sorted([f"First {i}" for i in range(4)] + [f"Second {i}" for i in range(5)])
+
+    def test_failed_window_ends_that_worksheet(self, tmp_path):
+        ws = _worksheet(_rows(9), fail_at=5)
+        spreadsheet = MagicMock()
+        spreadsheet.get_worksheet.return_value = ws
+        source, service_account = _source(
+            spreadsheet, sync={"incremental": True, "watermark_path": str(tmp_path / "wm.json")}
+        )
+        with service_account:
+            assert [l.name for l in source.fetch()] == ["Lead 0", "Lead 1", "Lead 2"]
+        # No watermark for a partially read worksheet
+        assert source._pending_watermarks == {}
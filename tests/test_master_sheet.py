@@ -0,0 +1,100 @@
+"""Tests for the Google Sheets destination writer."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from leadflow.dead_letter import DeadLetterStore
+from leadflow.destinations.master_sheet import HEADERS, GoogleSheetsWriter
+from leadflow.models import Lead
+
+
+class FakeAPIError(Exception):
+    """Shaped like ``gspread.exceptions.APIError``."""
+
+    def __init__(self, code, retry_after=None):
+        super().__init__(f"API error {code}")
+        self.code = code
+        self.response = MagicMock()
+        self.response.headers = {"Retry-After": retry_after} if retry_after else {}
+
+
+def _leads(n):
+    return [Lead(name=f"Lead {i}", email=f"l{i}@example.com", tags=["seo"]) for i in range(n)]
+
+
+@pytest.fixture
+def worksheet():
+    ws = MagicMock()
+    ws.row_values.return_value = []
+    with patch("gspread.service_account") as service_account:
+        service_account.return_value.open.return_value.get_worksheet.return_value = ws
+        yield ws
+
+
+def _writer(**cfg):
+    return GoogleSheetsWriter({"destinations": {"google_sheets": {"retry_backoff": 0, **cfg}}})
+
+
+class TestBatchedWrites:
+    def test_writes_in_batches(self, worksheet):
+        assert _writer(batch_rows=500).write(_leads(1200)) == 1200
+        sizes = [len(c.args[0]) for c in worksheet.append_rows.call_args_list]
+        assert sizes == [500, 500, 200]
+        assert worksheet.append_rows.call_args.args[0][0][:2] == ["Lead 1000", "l1000@example.com"]
+        worksheet.get_all_values.assert_not_called()
+
+    def test_batches_respect_payload_size(self, worksheet):
+        _writer(batch_rows=500, max_batch_bytes=1000).write(_leads(50))
+        sizes = [len(c.args[0]) for c in worksheet.append_rows.call_args_list]
+        assert sum(sizes) == 50
+        assert max(sizes) < 50
+
+    def test_header_written_once_when_row_1_empty(self, worksheet):
+        writer = _writer()
+        writer.write(_leads(2))
+        writer.write(_leads(2))
+        worksheet.row_values.assert_called_once_with(1)
+        worksheet.append_row.assert_called_once_with(HEADERS)
+
+    def test_existing_header_is_kept(self, worksheet):
+        worksheet.row_values.return_value = HEADERS
+        _writer().write(_leads(1))
+        worksheet.append_row.assert_not_called()
+
+
+class TestRetries:
+    def test_quota_error_is_retried(self, worksheet):
+        worksheet.append_rows.side_effect = [FakeAPIError(429, retry_after="3"), None]
+        with patch("leadflow.destinations.master_sheet.time.sleep") as sleep:
+            assert _writer().write(_leads(3)) == 3
+        sleep.assert_called_once_with(3.0)
+        assert worksheet.append_rows.call_count == 2
+
+    def test_gives_up_after_retries(self, worksheet):
+        worksheet.append_rows.side_effect = FakeAPIError(429)
+        with patch("leadflow.destinations.master_sheet.time.sleep"):
+            assert _writer(retries=2).write(_leads(3)) == 0
+        assert worksheet.append_rows.call_count == 3
+
+    def test_other_errors_are_not_retried(self, worksheet):
+        worksheet.append_rows.side_effect = FakeAPIError(400)
+        assert _writer().write(_leads(3)) == 0
+        assert worksheet.append_rows.call_count == 1
+
+    def test_server_error_retries_reads_not_appends(self, worksheet):
+        worksheet.row_values.side_effect = [FakeAPIError(503), HEADERS]
+        worksheet.append_rows.side_effect = FakeAPIError(503)
+        with patch("leadflow.destinations.master_sheet.time.sleep"):
+            assert _writer().write(_leads(3)) == 0
+        assert worksheet.row_values.call_count == 2
+        assert worksheet.append_rows.call_count == 1
+
+    def test_unwritten_batches_are_dead_lettered(self, worksheet, tmp_path):
+        worksheet.append_rows.side_effect = [None, FakeAPIError(403)]
+        config = {
+            "destinations": {"google_sheets": {"batch_rows": 2}},
+            "dead_letter": {"enabled": True, "path": str(tmp_path / "dlq.db")},
+        }
+        assert GoogleSheetsWriter(config).write(_leads(5)) == 2
+        assert DeadLetterStore(tmp_path / "dlq.db").count("write") == 3
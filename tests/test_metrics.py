@@ -0,0 +1,111 @@
+"""Tests for run instrumentation."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from leadflow import metrics
+from leadflow.executor import in_current_context, run_ahead
+from leadflow.metrics import Histogram, Metrics
+
+
+class TestHistogram:
+    def test_buckets_and_percentiles(self):
+        hist = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(value)
+        assert hist.counts == [2, 1, 1]
+        assert hist.count == 4
+        assert hist.percentile(0) == 0.05
+        assert hist.percentile(100) == 2.0
+
+    def test_empty_percentile(self):
+        assert Histogram().percentile(50) == 0.0
+
+
+class TestMetrics:
+    def test_stage_accumulates(self):
+        m = Metrics()
+        for _ in range(2):
+            with m.stage("dedup"):
+                sum(range(1000))
+        assert m.stages["dedup"].calls == 2
+        assert m.stages["dedup"].wall_seconds > 0
+
+    def test_counters_and_timers(self):
+        m = Metrics()
+        m.incr("claude.enrich.retries")
+        m.incr("claude.enrich.retries", 2)
+        with m.time("claude.enrich"):
+            pass
+        assert m.counters["claude.enrich.retries"] == 3
+        assert m.histograms["claude.enrich"].count == 1
+
+    def test_prometheus_format(self):
+        m = Metrics()
+        with m.stage("fetch"):
+            pass
+        m.incr("claude.enrich.input_tokens", 120)
+        m.observe("destination.notion.request", 0.2)
+        text = m.to_prometheus()
+        assert 'leadflow_stage_wall_seconds{stage="fetch"}' in text
+        assert "leadflow_claude_enrich_input_tokens_total 120" in text
+        assert 'leadflow_call_latency_seconds_bucket{call="destination.notion.request",le="+Inf"} 1' in text
+        assert 'leadflow_call_latency_seconds_count{call="destination.notion.request"} 1' in text
+
+    def test_export(self, tmp_path):
+        m = Metrics()
+        m.incr("dedup.fuzzy_checks")
+        m.export(tmp_path)
+        data = json.loads((tmp_path / "metrics.json").read_text())
+        assert data["counters"] == {"dedup.fuzzy_checks": 1}
+        assert (tmp_path / "metrics.prom").exists()
+
+    def test_record_usage(self):
+        m = Metrics()
+        previous = metrics.activate(m)
+        try:
+            response = SimpleNamespace(usage=SimpleNamespace(input_tokens=10, output_tokens=3))
+            metrics.record_usage("claude.dedup", response)
+        finally:
+            metrics.activate(previous)
+        assert m.counters == {"claude.dedup.input_tokens": 10, "claude.dedup.output_tokens": 3}
+
+
+class TestActiveMetrics:
+    def test_concurrent_runs_record_separately(self):
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def run(name):
+            m = Metrics()
+            metrics.activate(m)
+            barrier.wait()  # both runs active at once
+            for _ in range(100):
+                metrics.current().incr("leads")
+            results[name] = m.counters["leads"]
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == {"a": 100, "b": 100}
+
+    def test_worker_threads_inherit_active_metrics(self):
+        m = Metrics()
+        previous = metrics.activate(m)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(in_current_context(lambda _: metrics.current().incr("x")), range(8)))
+            list(run_ahead(iter(range(3)), 1, "test"))
+        finally:
+            metrics.activate(previous)
+        assert m.counters == {"x": 8}
+
+    def test_prometheus_labels_cpu_as_thread_time(self):
+        m = Metrics()
+        with m.stage("fetch"):
+            pass
+        assert "CPU time of the thread running the stage" in m.to_prometheus()
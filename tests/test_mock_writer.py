@@ -0,0 +1,117 @@
+"""Tests for the mock destination's JSON-lines archive mode."""
+
+import gzip
+import json
+
+import pytest
+
+from leadflow.destinations.mock_writer import MockWriter, archive_segments, compact_archive
+from leadflow.models import Lead
+from leadflow.serialization import load_leads
+
+
+def _writer(path, **cfg):
+    return MockWriter({"destinations": {"mock": {"format": "jsonl", "path": str(path), **cfg}}})
+
+
+def _leads(n, start=0, notes=""):
+    return [Lead(name=f"Lead {i}", email=f"l{i}@example.com", notes=notes) for i in range(start, start + n)]
+
+
+class TestAppend:
+    def test_runs_append_without_rewriting(self, tmp_path):
+        path = tmp_path / "leads.jsonl"
+        writer = _writer(path)
+        assert writer.write(_leads(3)) == 3
+        first = path.read_bytes()
+        assert writer.write(_leads(2, start=3)) == 2
+
+        assert path.read_bytes().startswith(first)
+        assert [lead.name for lead in load_leads(path)] == [f"Lead {i}" for i in range(5)]
+
+    def test_gzip_archive_appends_members(self, tmp_path):
+        path = tmp_path / "leads.jsonl.gz"
+        _writer(path).write(_leads(2))
+        _writer(path).write(_leads(2, start=2))
+        assert len(list(load_leads(path))) == 4
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+    def test_rotates_by_size(self, tmp_path):
+        path = tmp_path / "leads.jsonl"
+        writer = _writer(path, rotate_bytes=1200)
+        for run in range(4):
+            writer.write(_leads(3, start=run * 3))
+
+        segments = archive_segments(path)
+        assert len(segments) > 1
+        assert segments[-1] == path
+        assert all(s.stat().st_size <= 1200 for s in segments)
+        assert sum(len(list(load_leads(s))) for s in segments) == 12
+
+    def test_torn_tail_does_not_swallow_next_record(self, tmp_path):
+        path = tmp_path / "leads.jsonl"
+        _writer(path).write(_leads(1))
+        with open(path, "ab") as f:
+            f.write(b'{"name": "half a rec')  # crash mid-write
+
+        _writer(path).write(_leads(1, start=1))
+        read, kept = compact_archive(path)
+        assert (read, kept) == (2, 2)
+
+    def test_json_format_is_default(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        MockWriter({}).write(_leads(2))
+        assert len(json.loads((tmp_path / "output" / "leads.json").read_text())) == 2
+
+    def test_unknown_format_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="format"):
+            _writer(tmp_path / "x", format="csv")
+
+
+class TestCompaction:
+    def test_keeps_latest_record_per_lead(self, tmp_path):
+        path = tmp_path / "leads.jsonl"
+        writer = _writer(path, rotate_bytes=400)
+        writer.write(_leads(3, notes="old"))
+        writer.write(_leads(2, notes="new") + [Lead(name="No contact")])
+        writer.write([Lead(name="No contact")])
+        assert len(archive_segments(path)) > 1
+
+        assert compact_archive(path) == (7, 5)
+        assert archive_segments(path) == [path]
+        notes = {lead.email: lead.notes for lead in load_leads(path) if lead.email}
+        assert notes == {"l0@example.com": "new", "l1@example.com": "new", "l2@example.com": "old"}
+
+    def test_compacts_gzip_archive(self, tmp_path):
+        path = tmp_path / "leads.jsonl.gz"
+        _writer(path).write(_leads(2))
+        _writer(path).write(_leads(2))
+        assert compact_archive(path) == (4, 2)
+        assert len(gzip.decompress(path.read_bytes()).splitlines()) == 2
+
+    def test_truncated_gzip_member_keeps_earlier_records(self, tmp_path):
+        path = tmp_path / "leads.jsonl.gz"
+        _writer(path).write(_leads(2))
+        with open(path, "ab") as f:
+            f.write(gzip.compress(b'{"name":"x"}\n')[:15])
+        assert compact_archive(path) == (2, 2)
+
+    def test_dotted_stem(self, tmp_path):
+        path = tmp_path / "leads.v2.jsonl"
+        other = tmp_path / "leads.jsonl"
+        writer = _writer(path, rotate_bytes=400)
+        for run in range(3):
+            writer.write(_leads(2, start=run * 2))
+            _writer(other, rotate_bytes=400).write(_leads(2, start=run * 2))
+
+        segments = archive_segments(path)
+        assert len(segments) > 1
+        assert all(s.name.startswith("leads.v2.") and s.name.endswith(".jsonl") for s in segments)
+        assert not set(segments) & set(archive_segments(other))
+
+        assert compact_archive(path) == (6, 6)
+        assert archive_segments(path) == [path]
+        assert len(archive_segments(other)) > 1
+
+    def test_missing_archive(self, tmp_path):
+        assert compact_archive(tmp_path / "leads.jsonl") == (0, 0)
@@ -0,0 +1,45 @@
+"""Tests for the Lead data model."""
+
+from leadflow.models import Lead, is_legacy_dedup_key
+
+
+class TestDedupKey:
+    def test_binary_digest(self):
+        key = Lead(email="a@example.com", phone="555").dedup_key()
+        assert isinstance(key, bytes)
+        assert len(key) == 16
+
+    def test_normalizes_email_case_and_whitespace(self):
+        a = Lead(email=" A@Example.com ", phone="555")
+        b = Lead(email="a@example.com", phone="555")
+        assert a.dedup_key() == b.dedup_key()
+
+    def test_empty_email_and_phone(self):
+        assert Lead(name="Nobody").dedup_key() is None
+
+    def test_cached_until_email_changes(self):
+        lead = Lead(email="a@example.com", phone="555")
+        first = lead.dedup_key()
+        assert lead.dedup_key() is first
+        lead.email = "b@example.com"
+        assert lead.dedup_key() != first
+        assert lead.dedup_key() == Lead(email="b@example.com", phone="555").dedup_key()
+
+    def test_cached_until_phone_changes(self):
+        lead = Lead(email="a@example.com", phone="555")
+        first = lead.dedup_key()
+        lead.phone = "666"
+        assert lead.dedup_key() != first
+
+
+class TestLegacyDedupKey:
+    def test_md5_hex(self):
+        key = Lead(email="a@example.com", phone="555").legacy_dedup_key()
+        assert is_legacy_dedup_key(key)
+        assert key == "92a7a972b5780380976c81e83be1ca14"
+
+    def test_matches_either_format(self):
+        lead = Lead(email="a@example.com", phone="555")
+        assert lead.matches_dedup_key(lead.dedup_key())
+        assert lead.matches_dedup_key(lead.legacy_dedup_key())
+        assert not lead.matches_dedup_key(Lead(email="b@example.com").legacy_dedup_key())
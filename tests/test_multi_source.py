@@ -0,0 +1,102 @@
+"""Tests for concurrent multi-source fan-in."""
+
+import threading
+import time
+
+from leadflow import metrics
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.metrics import Metrics
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.base import LeadSource
+from leadflow.sources.mock_source import MockSource
+from leadflow.sources.multi_source import MultiSource
+
+
+class StaticSource(LeadSource):
+    def __init__(self, name, leads, delay=0.0, barrier=None):
+        self._name = name
+        self._leads = leads
+        self._delay = delay
+        self._barrier = barrier
+        self.committed = False
+
+    @property
+    def name(self):
+        return self._name
+
+    def fetch(self):
+        if self._barrier is not None:
+            self._barrier.wait(timeout=2)
+        time.sleep(self._delay)
+        return list(self._leads)
+
+    def commit(self):
+        self.committed = True
+
+
+class TestMultiSource:
+    def test_fetches_concurrently(self):
+        # Both fetches must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2)
+        source = MultiSource([
+            StaticSource("a", [Lead(name="A")], barrier=barrier),
+            StaticSource("b", [Lead(name="B")], barrier=barrier),
+        ])
+        assert [l.name for l in source.fetch()] == ["A", "B"]
+        assert not barrier.broken
+
+    def test_records_per_source_metrics(self):
+        m = Metrics()
+        previous = metrics.activate(m)
+        try:
+            MultiSource([
+                StaticSource("a", [Lead(name="A1"), Lead(name="A2")]),
+                StaticSource("b", [Lead(name="B")]),
+            ]).fetch()
+        finally:
+            metrics.activate(previous)
+        assert m.counters["source.a.fetched"] == 2
+        assert m.counters["source.b.fetched"] == 1
+        assert m.histograms["source.a.fetch"].count == 1
+
+    def test_iter_batches_merges_all_chunks(self):
+        source = MultiSource([
+            StaticSource("slow", [Lead(name=f"S{i}") for i in range(3)], delay=0.05),
+            StaticSource("fast", [Lead(name=f"F{i}") for i in range(5)]),
+        ])
+        chunks = list(source.iter_batches(2))
+        names = sorted(l.name for chunk in chunks for l in chunk)
+        assert names == ["F0", "F1", "F2", "F3", "F4", "S0", "S1", "S2"]
+        # The fast source is not held back by the slow one
+        assert chunks[0][0].name.startswith("F")
+
+    def test_name_and_commit(self):
+        a, b = StaticSource("a", []), StaticSource("b", [])
+        source = MultiSource([a, b])
+        assert source.name == "a+b"
+        source.commit()
+        assert a.committed and b.committed
+
+    def test_cross_source_duplicates(self, mock_config, tmp_path, monkeypatch):
+        """Leads from different sources are deduplicated against each other."""
+        monkeypatch.chdir(tmp_path)
+        other = StaticSource("other", [
+            Lead(name="Sarah Chen", email="sarah@blueridgedesign.com", phone="(555) 123-4567"),
+        ])
+        pipeline = Pipeline(
+            source=MultiSource([MockSource(), other]),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+        stats = pipeline.run()
+        assert stats.fetched == 13
+        assert stats.unique == 10
+        assert stats.duplicates == 3
+        assert stats.metrics.counters["source.other.fetched"] == 1
@@ -0,0 +1,199 @@
+"""Tests for the Notion page index and the writer's upsert mode."""
+
+import itertools
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from leadflow.destinations.notion_index import NotionPageIndex, content_hash, page_to_lead
+from leadflow.destinations.notion_writer import NotionWriter
+from leadflow.models import Lead
+
+
+class NotFound(Exception):
+    """Shaped like ``notion_client.APIResponseError`` for a deleted page."""
+
+    status = 404
+
+
+class FakeNotion:
+    """In-memory Notion database: pages.create/update and a last_edited_time query."""
+
+    def __init__(self):
+        self.pages_by_id: dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._clock = itertools.count(1)
+        self.pages = MagicMock()
+        self.pages.create.side_effect = self._create
+        self.pages.update.side_effect = self._update
+        self.databases = MagicMock()
+        self.databases.query.side_effect = self._query
+
+    def _stamp(self, page):
+        minutes, seconds = divmod(next(self._clock), 60)
+        page["last_edited_time"] = f"2026-01-01T00:{minutes:02d}:{seconds:02d}.000Z"
+
+    def _create(self, parent, properties):
+        page = {"id": f"page-{next(self._ids)}", "properties": dict(properties), "archived": False}
+        self._stamp(page)
+        self.pages_by_id[page["id"]] = page
+        return page
+
+    def _update(self, page_id, properties):
+        page = self.pages_by_id.get(page_id)
+        if page is None or page["archived"]:
+            raise NotFound(f"page {page_id} not found")
+        page["properties"].update(properties)
+        self._stamp(page)
+        return page
+
+    def edit(self, page_id, **properties):
+        """An edit made in Notion by someone else."""
+        self.pages_by_id[page_id]["properties"].update(properties)
+        self._stamp(self.pages_by_id[page_id])
+
+    def archive(self, page_id):
+        self.pages_by_id[page_id]["archived"] = True
+        self._stamp(self.pages_by_id[page_id])
+
+    def _query(self, database_id, filter=None, sorts=None, start_cursor=None, page_size=100):
+        since = filter["last_edited_time"]["on_or_after"] if filter else ""
+        pages = sorted(
+            (p for p in self.pages_by_id.values() if p["last_edited_time"] >= since),
+            key=lambda p: p["last_edited_time"],
+        )
+        offset = int(start_cursor or 0)
+        chunk = pages[offset:offset + page_size]
+        more = offset + page_size < len(pages)
+        return {"results": chunk, "has_more": more, "next_cursor": str(offset + page_size) if more else None}
+
+
+def _lead(email="jane@acme.com", **fields):
+    return Lead(name="Jane Doe", email=email, company="Acme", tags=["seo"], status="enriched", **fields)
+
+
+class TestContentHash:
+    def test_page_round_trips_to_same_hash(self):
+        lead = _lead(phone="5551234567", notes="n", summary="s", source="mock")
+        lead.stamp_ingested()
+        page = {"properties": NotionWriter._lead_to_properties(lead)}
+        assert content_hash(page_to_lead(page)) == content_hash(lead)
+
+    def test_ingested_at_is_ignored(self):
+        a, b = _lead(), _lead()
+        b.stamp_ingested()
+        assert content_hash(a) == content_hash(b)
+        assert content_hash(a) != content_hash(_lead(notes="changed"))
+
+
+class TestSync:
+    def test_sync_is_incremental(self, tmp_path):
+        notion = FakeNotion()
+        for i in range(5):
+            notion._create({}, NotionWriter._lead_to_properties(_lead(f"l{i}@x.com")))
+        index = NotionPageIndex(tmp_path / "index.db")
+
+        assert index.sync(notion, "db") == 5
+        assert index.count("db") == 5
+        # Only the boundary page (inclusive cursor) is re-read
+        assert index.sync(notion, "db") == 1
+
+        notion.edit("page-2", Notes={"rich_text": [{"text": {"content": "edited"}}]})
+        index.sync(notion, "db")
+        indexed = index.get("db", _lead("l1@x.com").dedup_key())
+        assert indexed.content_hash == content_hash(_lead("l1@x.com", notes="edited"))
+
+    def test_sync_paginates_and_drops_archived_pages(self, tmp_path):
+        notion = FakeNotion()
+        for i in range(250):
+            notion._create({}, NotionWriter._lead_to_properties(_lead(f"l{i}@x.com")))
+        index = NotionPageIndex(tmp_path / "index.db")
+        index.sync(notion, "db")
+        assert index.count("db") == 250
+        assert notion.databases.query.call_count == 3
+
+        notion.archive("page-1")
+        index.sync(notion, "db")
+        assert index.count("db") == 249
+        assert index.get("db", _lead("l0@x.com").dedup_key()) is None
+
+    def test_cursor_persists_across_instances(self, tmp_path):
+        notion = FakeNotion()
+        notion._create({}, NotionWriter._lead_to_properties(_lead()))
+        NotionPageIndex(tmp_path / "index.db").sync(notion, "db")
+        notion.databases.query.reset_mock()
+
+        NotionPageIndex(tmp_path / "index.db").sync(notion, "db")
+        assert "filter" in notion.databases.query.call_args.kwargs
+
+
+@pytest.fixture
+def notion():
+    fake = FakeNotion()
+    with patch("leadflow.destinations.notion_writer.Client", return_value=fake):
+        yield fake
+
+
+@patch.dict("os.environ", {"NOTION_TOKEN": "t", "NOTION_DEST_DATABASE_ID": "db"})
+class TestUpsert:
+    @pytest.fixture(autouse=True)
+    def _config(self, tmp_path):
+        self.config = {
+            "clients": {"notion": {"requests_per_second": 0}},
+            "destinations": {"notion": {"upsert": True, "index_path": str(tmp_path / "index.db")}},
+        }
+
+    def test_rerun_makes_no_writes(self, notion):
+        leads = [_lead(f"l{i}@x.com") for i in range(3)]
+        assert NotionWriter(self.config).write(leads) == 3
+        assert NotionWriter(self.config).write([_lead(f"l{i}@x.com") for i in range(3)]) == 3
+        assert notion.pages.create.call_count == 3
+        notion.pages.update.assert_not_called()
+
+    def test_changed_lead_updates_its_page(self, notion):
+        writer = NotionWriter(self.config)
+        writer.write([_lead(notes="first", summary="old")])
+        writer.write([_lead(notes="second")])
+
+        notion.pages.create.assert_called_once()
+        update = notion.pages.update.call_args.kwargs
+        assert update["page_id"] == "page-1"
+        assert update["properties"]["Notes"]["rich_text"][0]["text"]["content"] == "second"
+        # Summary was emptied: cleared rather than left stale
+        assert update["properties"]["Summary"] == {"rich_text": []}
+
+    def test_pages_created_elsewhere_are_found_by_sync(self, notion):
+        notion._create({}, NotionWriter._lead_to_properties(_lead()))
+        assert NotionWriter(self.config).write([_lead()]) == 1
+        notion.pages.create.assert_not_called()
+        notion.pages.update.assert_not_called()
+
+    def test_duplicates_in_one_batch_write_one_page(self, notion):
+        writer = NotionWriter({**self.config, "destinations": {"notion": {
+            **self.config["destinations"]["notion"], "concurrency": 3,
+        }}})
+        assert writer.write([_lead(notes="a"), _lead("other@x.com"), _lead(notes="b")]) == 3
+        assert notion.pages.create.call_count == 2
+        assert notion.pages.update.call_args.kwargs["page_id"] == "page-1"
+
+    def test_deleted_page_is_recreated(self, notion):
+        writer = NotionWriter(self.config)
+        writer.write([_lead(notes="first")])
+        del notion.pages_by_id["page-1"]  # hard delete: invisible to the sync query
+
+        assert writer.write([_lead(notes="second")]) == 1
+        assert notion.pages.create.call_count == 2
+        assert writer._index.get("db", _lead().dedup_key()).page_id == "page-2"
+
+    def test_keyless_leads_are_always_created(self, notion):
+        writer = NotionWriter(self.config)
+        writer.write([Lead(name="No contact")])
+        writer.write([Lead(name="No contact")])
+        assert notion.pages.create.call_count == 2
+
+    def test_upsert_off_always_creates(self, notion):
+        config = {**self.config, "destinations": {"notion": {}}}
+        NotionWriter(config).write([_lead()])
+        NotionWriter(config).write([_lead()])
+        assert notion.pages.create.call_count == 2
+        notion.databases.query.assert_not_called()
@@ -117,3 +117,148 @@ class TestNotionSource:
         assert lead.phone == ""
         assert lead.company == ""
         assert lead.source == "notion"
+
+    @patch("leadflow.sources.notion_source.os.getenv")
+    def test_incremental_fetch_uses_watermark(self, mock_getenv, tmp_path):
+        """After commit, the next fetch filters on last_edited_time."""
+        mock_getenv.side_effect = lambda key, default="": {
+            "NOTION_TOKEN": "test-token",
+            "NOTION_SOURCE_DATABASE_ID": "test-db-id",
+        }.get(key, default)
+        config = {
+            "sources": {"notion": {}},
+            "sync": {"incremental": True, "watermark_path": str(tmp_path / "wm.json")},
+        }
+        response = {
+            "results": [
+                {"id": "page-1", "last_edited_time": "2026-01-01T10:00:00.000Z", "properties": {}},
+                {"id": "page-2", "last_edited_time": "2026-01-02T10:00:00.000Z", "properties": {}},
+            ],
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        with patch("leadflow.sources.notion_source.Client") as MockClient:
+            mock_notion = MagicMock()
+            mock_notion.databases.query.return_value = response
+            MockClient.return_value = mock_notion
+
+            source = NotionSource(config)
+            source.fetch()
+            assert "filter" not in mock_notion.databases.query.call_args.kwargs
+            source.commit()
+
+            NotionSource(config).fetch()
+            kwargs = mock_notion.databases.query.call_args.kwargs
+            assert kwargs["filter"]["last_edited_time"] == {"on_or_after": "2026-01-02T10:00:00.000Z"}
+
+    @patch("leadflow.sources.notion_source.os.getenv")
+    def test_incremental_fetch_skips_boundary_pages(self, mock_getenv, tmp_path):
+        """Pages returned again by the inclusive filter are not fetched twice."""
+        mock_getenv.side_effect = lambda key, default="": {
+            "NOTION_TOKEN": "test-token",
+            "NOTION_SOURCE_DATABASE_ID": "test-db-id",
+        }.get(key, default)
+        config = {
+            "sources": {"notion": {}},
+            "sync": {"incremental": True, "watermark_path": str(tmp_path / "wm.json")},
+        }
+
+        def page(page_id, edited):
+            title = {"title": [{"text": {"content": page_id}}]}
+            return {"id": page_id, "last_edited_time": edited, "properties": {"Name": title}}
+
+        first = [page("page-1", "2026-01-01T10:00:00.000Z"), page("page-2", "2026-01-02T10:00:00.000Z")]
+        second = [page("page-2", "2026-01-02T10:00:00.000Z"), page("page-3", "2026-01-02T10:00:00.000Z")]
+
+        with patch("leadflow.sources.notion_source.Client") as MockClient:
+            mock_notion = MagicMock()
+            mock_notion.databases.query.side_effect = [
+                {"results": first, "has_more": False},
+                {"results": second, "has_more": False},
+                {"results": second, "has_more": False},
+            ]
+            MockClient.return_value = mock_notion
+
+            source = NotionSource(config)
+            assert [lead.name for lead in source.fetch()] == ["page-1", "page-2"]
+            source.commit()
+            assert [lead.name for lead in source.fetch()] == ["page-3"]
+            source.commit()
+            assert source.fetch() == []
+
+
+def _page(page_id, created="2026-01-01T00:00:00.000Z"):
+    return {
+        "id": page_id,
+        "created_time": created,
+        "last_edited_time": created,
+        "properties": {"Name": {"title": [{"text": {"content": page_id}}]}},
+    }
+
+
+@patch.dict("os.environ", {"NOTION_TOKEN": "t", "NOTION_SOURCE_DATABASE_ID": "db"})
+class TestStreamingNotionSource:
+    def test_yields_each_page_before_pagination_finishes(self):
+        responses = [
+            {"results": [_page("a"), _page("b")], "has_more": True, "next_cursor": "c1"},
+            {"results": [_page("c")], "has_more": False, "next_cursor": None},
+        ]
+        with patch("leadflow.sources.notion_source.Client") as MockClient:
+            notion = MockClient.return_value
+            notion.databases.query.side_effect = responses
+            batches = NotionSource({"sources": {"notion": {}}}).iter_batches(100)
+
+            assert [l.name for l in next(batches)] == ["a", "b"]
+            assert notion.databases.query.call_count == 1
+            assert [l.name for l in next(batches)] == ["c"]
+
+    def test_explicit_partitions_query_created_time_ranges(self):
+        config = {"sources": {"notion": {"partitions": ["2025-01-01", "2024-01-01"]}}}
+
+        def query(**kwargs):
+            return {"results": [_page(str(kwargs.get("filter")))], "has_more": False}
+
+        with patch("leadflow.sources.notion_source.Client") as MockClient:
+            notion = MockClient.return_value
+            notion.databases.query.side_effect = query
+            leads = NotionSource(config).fetch()
+
+        filters = [c.kwargs["filter"] for c in notion.databases.query.call_args_list]
+        assert len(leads) == 3
+        assert {"timestamp": "created_time", "created_time": {"before": "2024-01-01"}} in filters
+        assert {"timestamp": "created_time", "created_time": {"on_or_after": "2025-01-01"}} in filters
+        assert {
+            "and": [
+                {"timestamp": "created_time", "created_time": {"on_or_after": "2024-01-01"}},
+                {"timestamp": "created_time", "created_time": {"before": "2025-01-01"}},
+            ]
+        } in filters
+
+    def test_partition_count_splits_from_oldest_page(self):
+        config = {"sources": {"notion": {"partitions": 4}}}
+        source = NotionSource(config)
+        notion = MagicMock()
+        notion.databases.query.return_value = {"results": [_page("old", "2020-01-01T00:00:00+00:00")]}
+        bounds = source._split_created_time(notion, 4)
+        assert len(bounds) == 3
+        assert bounds == sorted(bounds)
+        assert bounds[0] > "2020-01-01"
+
+    def test_failed_partition_holds_back_watermark(self, tmp_path):
+        config = {
+            "sources": {"notion": {"partitions": ["2025-01-01"]}},
+            "sync": {"incremental": True, "watermark_path": str(tmp_path / "wm.json")},
+        }
+
+        def query(**kwargs):
+            if "before" in kwargs["filter"]["created_time"]:
+                raise RuntimeError("rate limited")
+            return {"results": [_page("new", "2025-06-01T00:00:00.000Z")], "has_more": False}
+
+        with patch("leadflow.sources.notion_source.Client") as MockClient:
+            MockClient.return_value.databases.query.side_effect = query
+            source = NotionSource(config)
+            assert [l.name for b in source.iter_batches(10) for l in b] == ["new"]
+            assert source._pending_watermark is None
+            assert source.fetch() == []
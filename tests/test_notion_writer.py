@@ -1,5 +1,7 @@
 """Tests for the Notion destination writer."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch, call
 
 from leadflow.destinations.notion_writer import NotionWriter
@@ -22,16 +24,15 @@ class TestNotionWriter:
             leads = [Lead(name="Test", email="test@example.com")]
             assert writer.write(leads) == 0
 
-    @patch("leadflow.destinations.notion_writer.time.sleep")
     @patch("leadflow.destinations.notion_writer.os.getenv")
-    def test_write_single_lead(self, mock_getenv, mock_sleep):
+    def test_write_single_lead(self, mock_getenv):
         """Test writing a single lead to Notion."""
         mock_getenv.side_effect = lambda key, default="": {
             "NOTION_TOKEN": "test-token",
             "NOTION_DEST_DATABASE_ID": "test-db-id",
         }.get(key, default)
 
-        writer = NotionWriter({"destinations": {"notion": {"rate_limit_delay": 0}}})
+        writer = NotionWriter({"destinations": {"notion": {}}})
 
         lead = Lead(
             name="Sarah Chen",
@@ -96,3 +97,72 @@ class TestNotionWriter:
         assert props["Status"]["select"]["name"] == "enriched"
         assert props["Source"]["select"]["name"] == "notion"
         assert props["Ingested At"]["date"]["start"] == "2026-01-01T00:00:00+00:00"
+
+
+class RateLimited(Exception):
+    """Shaped like ``notion_client.APIResponseError`` for a 429."""
+
+    status = 429
+
+    def __init__(self, retry_after="0.05"):
+        super().__init__("rate limited")
+        self.headers = {"retry-after": retry_after}
+
+
+@patch.dict("os.environ", {"NOTION_TOKEN": "t", "NOTION_DEST_DATABASE_ID": "db"})
+class TestConcurrentWrites:
+    def _writer(self, rate=0, burst=1, **dest):
+        return NotionWriter({
+            "clients": {"notion": {"requests_per_second": rate, "burst": burst}},
+            "destinations": {"notion": {"retry_backoff": 0.01, **dest}},
+        })
+
+    def test_workers_write_concurrently(self):
+        active = peak = 0
+        lock = threading.Lock()
+
+        def create(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        with patch("leadflow.destinations.notion_writer.Client") as MockClient:
+            MockClient.return_value.pages.create.side_effect = create
+            assert self._writer(concurrency=3).write([Lead(name=str(i)) for i in range(9)]) == 9
+        assert peak == 3
+
+    def test_throughput_sits_at_rate_limit(self):
+        def create(**kwargs):
+            time.sleep(0.1)  # slower than the rate allows if done serially
+
+        with patch("leadflow.destinations.notion_writer.Client") as MockClient:
+            MockClient.return_value.pages.create.side_effect = create
+            start = time.monotonic()
+            written = self._writer(rate=20, concurrency=4).write([Lead(name=str(i)) for i in range(21)])
+            elapsed = time.monotonic() - start
+        assert written == 21
+        # 20 requests at 20/s after the first; serial writes would need 2.1s
+        assert 0.9 <= elapsed < 1.6
+
+    def test_429_backs_off_and_retries(self):
+        with patch("leadflow.destinations.notion_writer.Client") as MockClient:
+            MockClient.return_value.pages.create.side_effect = [RateLimited(), None]
+            writer = self._writer(rate=100, concurrency=1)
+            assert writer.write([Lead(name="A")]) == 1
+        assert MockClient.return_value.pages.create.call_count == 2
+
+    def test_gives_up_after_max_retries(self):
+        with patch("leadflow.destinations.notion_writer.Client") as MockClient:
+            MockClient.return_value.pages.create.side_effect = RateLimited("0")
+            assert self._writer(max_retries=2, concurrency=1).write([Lead(name="A")]) == 0
+        assert MockClient.return_value.pages.create.call_count == 3
+
+    def test_other_errors_are_not_retried(self):
+        with patch("leadflow.destinations.notion_writer.Client") as MockClient:
+            MockClient.return_value.pages.create.side_effect = [ValueError("bad property"), None]
+            assert self._writer(concurrency=1).write([Lead(name="A"), Lead(name="B")]) == 1
+        assert MockClient.return_value.pages.create.call_count == 2
@@ -1,6 +1,7 @@
 """Integration tests for the full pipeline (all mock mode)."""
 
 import json
+import time
 from pathlib import Path
 
 import pytest
@@ -116,3 +117,166 @@ class TestFullPipeline:
         assert stats.duplicates == 2
         assert stats.unique == 0
         assert stats.written == 0
+
+
+class TestStreamingPipeline:
+    @pytest.mark.parametrize("chunk_size", [1, 5, 100])
+    def test_same_stats_as_batch(self, mock_config, tmp_path, monkeypatch, chunk_size):
+        monkeypatch.chdir(tmp_path)
+
+        def build(config):
+            return Pipeline(
+                source=MockSource(),
+                deduplicator=Deduplicator(config),
+                enricher=Enricher(config),
+                writer=MockWriter(config),
+                notifier=SlackNotifier(config),
+                config=config,
+            )
+
+        batch = build(mock_config).run().to_dict()
+        streaming_config = {**mock_config, "pipeline": {"chunk_size": chunk_size}}
+        streamed = build(streaming_config).run().to_dict()
+
+        for key in ("fetched", "normalized", "unique", "duplicates", "enriched", "written", "notified"):
+            assert streamed[key] == batch[key], key
+
+        data = json.loads((tmp_path / "output" / "leads.json").read_text())
+        assert len(data) == batch["written"] + streamed["written"]
+
+    def test_source_chunks_consumed_lazily(self, mock_config, tmp_path, monkeypatch):
+        """Each chunk is written before the next one is fetched."""
+        monkeypatch.chdir(tmp_path)
+        events = []
+
+        class ChunkedSource(MockSource):
+            def iter_batches(self, batch_size):
+                for i, lead in enumerate(self.fetch()):
+                    events.append(("fetch", i))
+                    yield [lead]
+
+        class RecordingWriter(MockWriter):
+            def write(self, leads):
+                events.append(("write", len(leads)))
+                return len(leads)
+
+        mock_config["pipeline"] = {"chunk_size": 1}
+        pipeline = Pipeline(
+            source=ChunkedSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=RecordingWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+        stats = pipeline.run()
+        assert stats.fetched == 12
+        assert events[:2] == [("fetch", 0), ("write", 1)]
+
+    def test_dry_run(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["dry_run"] = True
+        mock_config["pipeline"] = {"chunk_size": 4}
+        pipeline = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+        stats = pipeline.run()
+        assert stats.fetched == 12
+        assert stats.written == 0
+        assert stats.notified is False
+        assert not (tmp_path / "output" / "leads.json").exists()
+
+
+class TestPipelinedExecution:
+    def _build(self, config, writer):
+        return Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(config),
+            enricher=Enricher(config),
+            writer=writer,
+            notifier=SlackNotifier(config),
+            config=config,
+        )
+
+    def test_same_stats_as_batch(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        batch = self._build(mock_config, MockWriter(mock_config)).run().to_dict()
+        config = {**mock_config, "pipeline": {"chunk_size": 3, "pipelined": True}}
+        pipelined = self._build(config, MockWriter(config)).run().to_dict()
+        for key in ("fetched", "normalized", "unique", "duplicates", "enriched", "written", "notified"):
+            assert pipelined[key] == batch[key], key
+
+    def test_enrich_overlaps_write(self, mock_config, tmp_path, monkeypatch):
+        """The next chunk is enriched while the writer is busy with the previous one."""
+        monkeypatch.chdir(tmp_path)
+        mock_config["pipeline"] = {"chunk_size": 2, "pipelined": True, "max_in_flight": 1}
+        events = []
+
+        class SlowWriter(MockWriter):
+            def write(self, leads):
+                events.append("write-start")
+                time.sleep(0.05)
+                events.append("write-end")
+                return len(leads)
+
+        enricher = Enricher(mock_config)
+        original = enricher.enrich
+
+        def recording_enrich(leads):
+            events.append("enrich")
+            return original(leads)
+
+        enricher.enrich = recording_enrich
+        pipeline = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=enricher,
+            writer=SlowWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+        pipeline.run()
+        first_write = events.index("write-start")
+        assert "enrich" in events[first_write:events.index("write-end")]
+
+    def test_dry_run(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["dry_run"] = True
+        mock_config["pipeline"] = {"pipelined": True}
+        stats = self._build(mock_config, MockWriter(mock_config)).run()
+        assert stats.fetched == 12
+        assert stats.written == 0
+        assert stats.notified is False
+        assert not (tmp_path / "output" / "leads.json").exists()
+
+
+class TestPipelineMetrics:
+    def test_stage_timings_recorded(self, mock_pipeline):
+        stats = mock_pipeline.run()
+        for stage in ("fetch", "normalize", "dedup", "enrich", "write", "notify"):
+            assert stats.metrics.stages[stage].calls == 1
+        assert stats.metrics.counters["dedup.exact_duplicates"] >= 1
+        assert stats.metrics.histograms["destination.mock.write"].count == 1
+
+    def test_metrics_exported(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["metrics"] = {"export_dir": str(tmp_path / "metrics")}
+        mock_config["pipeline"] = {"chunk_size": 4}
+        pipeline = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+        stats = pipeline.run()
+        data = json.loads((tmp_path / "metrics" / "metrics.json").read_text())
+        assert data["stages"]["normalize"]["calls"] == 3
+        assert "leadflow_stage_wall_seconds" in (tmp_path / "metrics" / "metrics.prom").read_text()
+        assert stats.metrics.stages["write"].calls >= 1
@@ -0,0 +1,132 @@
+"""Tests for per-stage profiling."""
+
+import json
+import threading
+import tracemalloc
+from unittest.mock import patch
+
+from leadflow import profiling
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.metrics import Metrics
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.profiling import Profiler
+from leadflow.sources.mock_source import MockSource
+
+
+def _busy():
+    return sum(len(str(i)) for i in range(20000))
+
+
+def _allocate():
+    return [bytes(1000) for _ in range(500)]
+
+
+class TestProfiler:
+    def test_profiles_stage_blocks(self, tmp_path):
+        profiler = Profiler(top_n=5)
+        m = Metrics()
+        m.profiler = profiler
+        profiler.start()
+        try:
+            with m.stage("dedup"):
+                _busy()
+            with m.stage("normalize"):
+                kept = _allocate()
+        finally:
+            profiler.stop()
+        assert not tracemalloc.is_tracing()
+
+        assert profiler.stages["dedup"].calls == 1
+        assert profiler.stages["normalize"].peak_bytes >= 500_000
+        assert any("test_profiling.py" in line for line in profiler.stages["normalize"].top_allocations)
+        spots = profiler.hot_spots(limit=3)
+        assert len(spots["dedup"]) == 3
+        assert all(spot.own_seconds >= 0 for spot in spots["dedup"])
+        # Stage timings are still recorded
+        assert m.stages["dedup"].calls == 1
+        del kept
+
+    def test_allocations_sampled_once_per_stage(self):
+        profiler = Profiler()
+        m = Metrics()
+        m.profiler = profiler
+        profiler.start()
+        try:
+            with patch("leadflow.profiling._snapshot", wraps=profiling._snapshot) as snapshot:
+                for size in (1, 2, 3):
+                    with m.stage("enrich"):
+                        kept = [bytes(1000) for _ in range(200 * size)]
+        finally:
+            profiler.stop()
+
+        assert snapshot.call_count == 2
+        assert profiler.stages["enrich"].calls == 3
+        assert profiler.stages["enrich"].peak_bytes >= 600_000
+        assert profiler.stages["enrich"].top_allocations
+        del kept
+
+    def test_overlapping_blocks_are_skipped(self):
+        profiler = Profiler()
+        entered, release = threading.Event(), threading.Event()
+
+        def hold():
+            with profiler.stage("enrich"):
+                entered.set()
+                release.wait(timeout=2)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        entered.wait(timeout=2)
+        with profiler.stage("write"):
+            pass
+        release.set()
+        thread.join()
+        assert profiler.stages["enrich"].calls == 1
+        assert profiler.stages["write"].skipped == 1
+        assert "write" not in profiler.hot_spots()
+
+    def test_write_artifacts(self, tmp_path):
+        profiler = Profiler()
+        with profiler.stage("dedup"):
+            _busy()
+        run_dir = profiler.write(tmp_path / "run")
+        assert (run_dir / "dedup.prof").exists()
+        summary = json.loads((run_dir / "profile.json").read_text())
+        assert summary["dedup"]["calls"] == 1
+        assert summary["dedup"]["hot_spots"]
+
+
+class TestPipelineProfiling:
+    def test_run_writes_profile(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["profiling"] = {"enabled": True, "dir": str(tmp_path / "profiles")}
+        stats = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        ).run()
+        assert stats.profile is not None
+        assert stats.profile_dir.startswith(str(tmp_path / "profiles"))
+        for stage in ("fetch", "normalize", "dedup", "enrich", "write"):
+            assert stats.profile.stages[stage].calls == 1
+        summary = json.loads((tmp_path / "profiles" / stats.profile_dir.rsplit("/", 1)[-1] / "profile.json").read_text())
+        assert set(summary) >= {"fetch", "normalize", "dedup", "enrich", "write"}
+
+    def test_disabled_by_default(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        stats = Pipeline(
+            source=MockSource(),
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        ).run()
+        assert stats.profile is None
+        assert stats.metrics.profiler is None
@@ -0,0 +1,63 @@
+"""Tests for the token-bucket rate limiter."""
+
+import threading
+import time
+
+from leadflow.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_is_immediate(self):
+        bucket = TokenBucket(rate=1, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_paces_to_rate(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.19
+
+    def test_rate_is_shared_between_threads(self):
+        bucket = TokenBucket(rate=50, burst=1)
+
+        def take():
+            for _ in range(5):
+                bucket.acquire()
+
+        threads = [threading.Thread(target=take) for _ in range(4)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - start >= 0.37  # 20 tokens, 1 up front, at 50/s
+
+    def test_backoff_pauses_and_slows_down(self):
+        bucket = TokenBucket(rate=100, burst=10)
+        bucket.backoff(0.1)
+        assert bucket.rate == 50
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_recover_returns_to_target(self):
+        bucket = TokenBucket(rate=10)
+        bucket.backoff(0)
+        bucket.backoff(0)
+        assert bucket.rate == 2.5
+        for _ in range(20):
+            bucket.recover()
+        assert bucket.rate == 10
+
+    def test_unlimited(self):
+        bucket = TokenBucket(rate=0)
+        start = time.monotonic()
+        for _ in range(1000):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.1
+        bucket.backoff(0.05)
+        assert bucket.acquire() >= 0.04
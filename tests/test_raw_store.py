@@ -0,0 +1,81 @@
+"""Tests for the raw row side store."""
+
+import pytest
+
+from leadflow.dead_letter import DeadLetterStore
+from leadflow.models import Lead
+from leadflow.processing.normalizer import normalize_lead
+from leadflow.raw_store import RawStore, raw_store_from_config
+from leadflow.sources.mock_source import MockSource
+
+
+class TestRawStore:
+    def test_put_get_roundtrip(self, tmp_path):
+        store = RawStore(tmp_path / "raw.bin")
+        refs = [store.put({"row": i, "wide": "x" * i}) for i in range(5)]
+        assert len(store) == 5
+        assert refs[3].load() == {"row": 3, "wide": "xxx"}
+        assert store.get(0) == {"row": 0, "wide": ""}
+        store.close()
+
+    def test_temp_file_store(self):
+        store = RawStore()
+        ref = store.put({"a": 1})
+        assert ref.load() == {"a": 1}
+        store.close()
+
+
+    def test_rows_readable_for_one_rotation(self, tmp_path):
+        path = tmp_path / "raw.bin"
+        store = RawStore(path)
+        old = store.put({"cycle": 1})
+        store.rotate()
+        new = store.put({"cycle": 2})
+        assert (old.load(), new.load()) == ({"cycle": 1}, {"cycle": 2})
+        assert new.key == old.key + 1
+        assert (tmp_path / "raw.bin.prev").exists()
+
+        store.rotate()
+        assert new.load() == {"cycle": 2}
+        with pytest.raises(KeyError, match="discarded"):
+            old.load()
+        assert path.stat().st_size == 0
+        store.close()
+
+    def test_dead_lettered_lead_survives_rotation(self, tmp_path):
+        store = RawStore()
+        lead = Lead(name="Alice", email="a@example.com", raw_data={"extra": "col"})
+        lead.spill_raw(store)
+        dead_letters = DeadLetterStore(tmp_path / "dlq.db", backoff_seconds=0)
+        dead_letters.add("write", lead, "boom", target="mock")
+        store.rotate()
+        store.rotate()
+
+        (entry,) = dead_letters.due()
+        assert entry.lead.get_raw_data() == {"extra": "col"}
+        store.close()
+
+
+class TestLeadSpill:
+    def test_spill_keeps_handle(self):
+        store = RawStore()
+        lead = Lead(name="Alice", raw_data={"name": "Alice", "extra": "col"})
+        lead.spill_raw(store)
+        assert lead.raw_data == {}
+        assert lead.get_raw_data() == {"name": "Alice", "extra": "col"}
+        assert lead.to_dict()["raw_data"] == {"name": "Alice", "extra": "col"}
+
+    def test_handle_survives_normalization(self):
+        store = RawStore()
+        lead = Lead(name="  alice  ", raw_data={"name": "  alice  "})
+        lead.spill_raw(store)
+        assert normalize_lead(lead).get_raw_data() == {"name": "  alice  "}
+
+    def test_disabled_by_default(self):
+        assert raw_store_from_config({}) is None
+
+    def test_source_spills_when_enabled(self, tmp_path):
+        config = {"raw_store": {"enabled": True, "path": str(tmp_path / "raw.bin")}}
+        leads = MockSource(config).fetch()
+        assert all(lead.raw_data == {} for lead in leads)
+        assert leads[0].get_raw_data()["name"] == "Sarah Chen"
@@ -24,6 +24,8 @@ import leadflow.sources.notion_source  # noqa: F401
 import leadflow.destinations.mock_writer  # noqa: F401
 import leadflow.destinations.master_sheet  # noqa: F401
 import leadflow.destinations.notion_writer  # noqa: F401
+import leadflow.destinations.sqlite_writer  # noqa: F401
+import leadflow.destinations.columnar_writer  # noqa: F401
 
 
 class TestRegistration:
@@ -45,6 +47,12 @@ class TestRegistration:
     def test_notion_destination_registered(self):
         assert "notion" in _destinations
 
+    def test_sqlite_destination_registered(self):
+        assert "sqlite" in _destinations
+
+    def test_parquet_destination_registered(self):
+        assert "parquet" in _destinations
+
     def test_available_sources(self):
         sources = available_sources()
         assert "mock" in sources
@@ -0,0 +1,63 @@
+"""Tests for lead serialization codecs."""
+
+import io
+
+import pytest
+
+from leadflow.models import Lead
+from leadflow.serialization import dump_leads, get_codec, load_leads
+
+
+def _leads():
+    return [
+        Lead(
+            name="Sarah Chen", email="sarah@example.com", phone="5551234567",
+            company="Acme", source="test", notes="needs seo", summary="Prospect",
+            tags=["seo", "web-design"], status="enriched",
+            ingested_at="2026-01-01T00:00:00+00:00", raw_data={"col": "x"},
+        ),
+        Lead(name="Bob"),
+    ]
+
+
+class TestLeadDict:
+    def test_roundtrip(self):
+        for lead in _leads():
+            assert Lead.from_dict(lead.to_dict()) == lead
+
+    def test_missing_keys_use_defaults(self):
+        lead = Lead.from_dict({"name": "Alice"})
+        assert lead.status == "new"
+        assert lead.tags == []
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", ["jsonl", "msgpack"])
+    def test_stream_roundtrip(self, codec):
+        if codec == "msgpack":
+            pytest.importorskip("msgpack")
+        buf = io.BytesIO()
+        assert get_codec(codec).dump(iter(_leads()), buf) == 2
+        buf.seek(0)
+        assert list(get_codec(codec).load(buf)) == _leads()
+
+    def test_jsonl_is_one_line_per_lead(self):
+        buf = io.BytesIO()
+        get_codec("jsonl").dump(_leads(), buf)
+        assert buf.getvalue().count(b"\n") == 2
+
+    def test_unknown_codec_raises(self):
+        with pytest.raises(ValueError, match="Unknown codec"):
+            get_codec("nonexistent")
+
+    def test_gzip_path(self, tmp_path):
+        path = tmp_path / "leads.jsonl.gz"
+        dump_leads(_leads(), path)
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert list(load_leads(path)) == _leads()
+
+    def test_append(self, tmp_path):
+        path = tmp_path / "leads.jsonl"
+        dump_leads(_leads(), path)
+        dump_leads(_leads()[:1], path, append=True)
+        assert len(list(load_leads(path))) == 3
@@ -0,0 +1,142 @@
+"""Tests for the SQLite destination."""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+from leadflow.dead_letter import DeadLetterStore
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.destinations.sqlite_writer import (
+    SqliteWriter,
+    connect,
+    existing_leads,
+    existing_leads_from_config,
+)
+from leadflow.models import Lead
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.mock_source import MockSource
+
+
+def _writer(path, **cfg):
+    return SqliteWriter({"destinations": {"sqlite": {"path": str(path), **cfg}}})
+
+
+def _leads(n, notes=""):
+    return [
+        Lead(name=f"Lead {i}", email=f"l{i}@example.com", company=f"Co {i % 3}", tags=["seo"], notes=notes)
+        for i in range(n)
+    ]
+
+
+def _spy_connection(path, fail_on_call=None):
+    """A real connection whose ``executemany`` calls are recorded (and optionally fail)."""
+    conn = connect(path)
+    spy = MagicMock(wraps=conn)
+
+    def executemany(sql, rows):
+        if spy.executemany.call_count == fail_on_call:
+            raise sqlite3.OperationalError("database or disk is full")
+        return conn.executemany(sql, rows)
+
+    spy.executemany.side_effect = executemany
+    return spy
+
+
+def _query(path, sql, *params):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+class TestSqliteWriter:
+    def test_writes_in_batches_in_one_transaction(self, tmp_path):
+        path = tmp_path / "leads.db"
+        conn = _spy_connection(path)
+        with patch("leadflow.destinations.sqlite_writer.connect", return_value=conn):
+            assert _writer(path, batch_rows=4).write(_leads(10)) == 10
+        assert [len(c.args[1]) for c in conn.executemany.call_args_list] == [4, 4, 2]
+        assert _query(path, "SELECT count(*) FROM leads") == [(10,)]
+        assert _query(path, "SELECT tags FROM leads WHERE email = ?", "l3@example.com") == [('["seo"]',)]
+
+    def test_wal_mode_and_indexes(self, tmp_path):
+        path = tmp_path / "leads.db"
+        _writer(path).write(_leads(1))
+        assert _query(path, "PRAGMA journal_mode") == [("wal",)]
+        plan = _query(path, "EXPLAIN QUERY PLAN SELECT * FROM leads WHERE company = ?", "Co 1")
+        assert "leads_by_company" in plan[0][-1]
+        indexes = {row[1] for row in _query(path, "PRAGMA index_list(leads)")}
+        assert {"leads_by_dedup_key", "leads_by_email", "leads_by_company"} <= indexes
+
+    def test_rerun_upserts_by_dedup_key(self, tmp_path):
+        path = tmp_path / "leads.db"
+        writer = _writer(path)
+        writer.write(_leads(3, notes="old"))
+        writer.write(_leads(2, notes="new") + [Lead(name="No contact"), Lead(name="No contact")])
+
+        assert _query(path, "SELECT email, notes FROM leads WHERE email != '' ORDER BY email") == [
+            ("l0@example.com", "new"), ("l1@example.com", "new"), ("l2@example.com", "old"),
+        ]
+        # Leads without a dedup key are always inserted
+        assert _query(path, "SELECT count(*) FROM leads WHERE email = ''") == [(2,)]
+
+    def test_failed_write_rolls_back_and_dead_letters(self, tmp_path):
+        path = tmp_path / "leads.db"
+        config = {
+            "destinations": {"sqlite": {"path": str(path), "batch_rows": 2}},
+            "dead_letter": {"enabled": True, "path": str(tmp_path / "dlq.db")},
+        }
+        conn = _spy_connection(path, fail_on_call=3)
+        with patch("leadflow.destinations.sqlite_writer.connect", return_value=conn):
+            writer = SqliteWriter(config)
+            writer.write(_leads(1))
+            assert writer.write(_leads(5)) == 0  # fails on its second batch
+        assert _query(path, "SELECT count(*) FROM leads") == [(1,)]
+        assert DeadLetterStore(tmp_path / "dlq.db").count("write") == 5
+
+
+class TestExistingLeads:
+    def test_streams_dedup_features_only(self, tmp_path):
+        path = tmp_path / "leads.db"
+        _writer(path).write(_leads(12, notes="long notes"))
+        leads = list(existing_leads(path, fetch_rows=5))
+        assert len(leads) == 12
+        first = leads[0]
+        assert (first.email, first.company, first.notes, first.tags) == ("l0@example.com", "Co 0", "", [])
+
+    def test_unreadable_store_is_logged(self, tmp_path, caplog):
+        path = tmp_path / "old.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE leads (name TEXT, email TEXT)")  # older schema
+        assert list(existing_leads(path)) == []
+        assert list(existing_leads(tmp_path / "missing.db")) == []
+        assert caplog.text.count("Failed to read stored leads") == 2
+
+    def test_from_config(self, tmp_path):
+        path = tmp_path / "leads.db"
+        config = {"destinations": {"sqlite": {"path": str(path), "dedup_existing": True}}}
+        assert existing_leads_from_config(config) is None  # nothing stored yet
+        _writer(path).write(_leads(2))
+        assert len(list(existing_leads_from_config(config))) == 2
+        config["destinations"]["sqlite"]["dedup_existing"] = False
+        assert existing_leads_from_config(config) is None
+
+    def test_seeds_pipeline_dedup(self, mock_config, tmp_path):
+        path = tmp_path / "leads.db"
+        config = {**mock_config, "destinations": {"sqlite": {"path": str(path), "dedup_existing": True}}}
+
+        def run():
+            pipeline = Pipeline(
+                source=MockSource(),
+                deduplicator=Deduplicator(config),
+                enricher=Enricher(config),
+                writer=SqliteWriter(config),
+                notifier=SlackNotifier(config),
+                config=config,
+            )
+            return pipeline.run(existing_leads=existing_leads_from_config(config))
+
+        first = run()
+        assert first.written > 0
+        second = run()
+        assert second.unique == 0
+        assert _query(path, "SELECT count(*) FROM leads") == [(first.written,)]
@@ -0,0 +1,70 @@
+"""Tests for incremental sync watermarks."""
+
+from unittest.mock import MagicMock, patch
+
+from leadflow.sources.google_sheets import GoogleSheetsSource
+from leadflow.watermarks import WatermarkStore, watermark_store_from_config
+
+
+class TestWatermarkStore:
+    def test_get_missing(self, tmp_path):
+        assert WatermarkStore(tmp_path / "wm.json").get("notion:db") == {}
+
+    def test_set_and_reload(self, tmp_path):
+        path = tmp_path / "state" / "wm.json"
+        WatermarkStore(path).set("notion:db", {"last_edited_time": "2026-01-01"})
+        WatermarkStore(path).set("google_sheets:x:0", {"last_row": 10})
+        store = WatermarkStore(path)
+        assert store.get("notion:db") == {"last_edited_time": "2026-01-01"}
+        assert store.get("google_sheets:x:0") == {"last_row": 10}
+
+    def test_disabled_by_default(self):
+        assert watermark_store_from_config({}) is None
+
+
+class TestIncrementalSheets:
+    def _worksheet(self, rows):
+        header, body = rows[0], rows[1:]
+        ws = MagicMock()
+        ws.row_values.return_value = header
+        ws.row_count = 1000
+
+        def get_values(range_name):
+            first, last = range_name.split(":")
+            start, end = int(first[1:]), int(last.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            return [list(r) for r in body[start - 2 : end - 1]]
+
+        ws.get_values.side_effect = get_values
+        return ws
+
+    def test_only_new_rows_after_commit(self, tmp_path):
+        config = {"sync": {"incremental": True, "watermark_path": str(tmp_path / "wm.json")}}
+        rows = [
+            ["name", "email"],
+            ["Alice", "alice@example.com"],
+            ["Bob", "bob@example.com"],
+        ]
+        ws = self._worksheet(rows)
+        gc = MagicMock()
+        gc.open.return_value.get_worksheet.return_value = ws
+
+        with patch("gspread.service_account", return_value=gc):
+            source = GoogleSheetsSource(config)
+            assert [l.name for l in source.fetch()] == ["Alice", "Bob"]
+            source.commit()
+
+            rows.append(["Carol", "carol@example.com"])
+            ws.get_values.side_effect = self._worksheet(rows).get_values.side_effect
+            source = GoogleSheetsSource(config)
+            assert [l.name for l in source.fetch()] == ["Carol"]
+            ws.get_values.assert_called_with("A4:B5003")
+
+    def test_uncommitted_fetch_is_repeated(self, tmp_path):
+        config = {"sync": {"incremental": True, "watermark_path": str(tmp_path / "wm.json")}}
+        ws = self._worksheet([["name"], ["Alice"]])
+        gc = MagicMock()
+        gc.open.return_value.get_worksheet.return_value = ws
+
+        with patch("gspread.service_account", return_value=gc):
+            GoogleSheetsSource(config).fetch()
+            assert [l.name for l in GoogleSheetsSource(config).fetch()] == ["Alice"]
@@ -0,0 +1,168 @@
+"""Tests for the webhook source."""
+
+import http.client
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.webhook_source import WebhookSource
+
+
+def _source(monkeypatch, token="", **overrides):
+    monkeypatch.setenv("WEBHOOK_TOKEN", token)
+    cfg = {"port": 0, "batch_size": 3, "batch_window_seconds": 0.2, "handle_signals": False}
+    cfg.update(overrides)
+    return WebhookSource({"sources": {"webhook": cfg}})
+
+
+def _post(source, body, path="/leads", headers=None):
+    host, port = source.address
+    request = urllib.request.Request(
+        f"http://{host}:{port}{path}",
+        data=body if isinstance(body, bytes) else json.dumps(body).encode(),
+        headers={"Content-Type": "application/json", **(headers or {})},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _post_raw(source, body, content_length=None):
+    """POST *body* with the Content-Length header as given (omitted if None)."""
+    host, port = source.address
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        conn.putrequest("POST", "/leads")
+        if content_length is not None:
+            conn.putheader("Content-Length", content_length)
+        conn.endheaders(body)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def source(monkeypatch):
+    src = _source(monkeypatch)
+    yield src
+    src.stop()
+    src.close()
+
+
+class TestWebhookSource:
+    def test_post_is_accepted_and_fetched(self, source):
+        status, body = _post(source, [{"name": "Jane", "email": "jane@acme.com"}, {"name": "Bob"}])
+        assert (status, body) == (202, {"accepted": 2})
+
+        leads = source.fetch()
+        assert [l.name for l in leads] == ["Jane", "Bob"]
+        assert leads[0].source == "webhook"
+        assert leads[0].raw_data == {"name": "Jane", "email": "jane@acme.com"}
+        assert leads[0].received_at > 0
+
+    def test_batches_by_size(self, source):
+        _post(source, [{"name": str(i)} for i in range(7)])
+        source.stop()
+        sizes = [len(b) for b in source.iter_batches(100)]
+        assert sizes == [3, 3, 1]
+
+    def test_batches_by_window(self, source):
+        _post(source, {"name": "A"})
+        start = time.monotonic()
+        assert len(source.fetch()) == 1
+        assert time.monotonic() - start < 2
+
+    def test_stop_flushes_and_ends_stream(self, source):
+        batches = []
+
+        def consume():
+            batches.extend(source.iter_batches(100))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        _post(source, {"name": "A"})
+        source.stop()
+        consumer.join(timeout=5)
+        assert not consumer.is_alive()
+        assert [l.name for b in batches for l in b] == ["A"]
+
+    def test_rejects_bad_requests(self, source):
+        assert _post(source, b"{not json")[0] == 400
+        assert _post(source, ["just a string"])[0] == 400
+        assert _post(source, {"name": "A"}, path="/other")[0] == 404
+        source.stop()
+        assert _post(source, {"name": "A"})[0] == 503
+
+    def test_rejects_bad_content_length(self, source):
+        body = b'{"name": "A"}'
+        assert _post_raw(source, body)[0] == 411
+        assert _post_raw(source, body, "-1")[0] == 400
+        assert _post_raw(source, body, "abc")[0] == 400
+        assert _post_raw(source, body, str(len(body)))[0] == 202
+
+    def test_null_fields_are_empty(self, source):
+        _post(source, {"name": "Jane", "email": None, "phone": None})
+        [lead] = source.fetch()
+        assert (lead.name, lead.email, lead.phone) == ("Jane", "", "")
+
+    def test_full_inbox_returns_503(self, monkeypatch):
+        src = _source(monkeypatch, max_pending=2)
+        try:
+            status, body = _post(src, [{"name": "A"}, {"name": "B"}, {"name": "C"}])
+            assert (status, body["accepted"]) == (503, 2)
+        finally:
+            src.close()
+
+    def test_token_required_when_set(self, monkeypatch):
+        src = _source(monkeypatch, token="s3cret")
+        try:
+            assert _post(src, {"name": "A"})[0] == 401
+            assert _post(src, {"name": "A"}, headers={"Authorization": "Bearer s3cret"})[0] == 202
+        finally:
+            src.close()
+
+
+class TestWebhookPipeline:
+    def test_streams_posted_leads_and_reports_latency(self, mock_config, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        source = _source(monkeypatch)
+        mock_config["pipeline"] = {"chunk_size": 3}
+        pipeline = Pipeline(
+            source=source,
+            deduplicator=Deduplicator(mock_config),
+            enricher=Enricher(mock_config),
+            writer=MockWriter(mock_config),
+            notifier=SlackNotifier(mock_config),
+            config=mock_config,
+        )
+
+        def submit():
+            _post(source, [
+                {"name": "Jane Doe", "email": "jane@acme.com", "company": "Acme"},
+                {"name": "Bob Ray", "email": "bob@globex.com", "company": "Globex"},
+            ])
+            source.stop()
+
+        timer = threading.Timer(0.1, submit)
+        timer.start()
+        stats = pipeline.run()
+        timer.join()
+
+        assert stats.fetched == 2
+        assert stats.written == 2
+        latency = stats.metrics.histograms["ingest_to_write"]
+        assert latency.count == 2
+        assert latency.percentile(50) >= 0
@@ -0,0 +1,95 @@
+"""Tests for the SQLite work queue."""
+
+import time
+
+import pytest
+
+from leadflow.models import Lead
+from leadflow.work_queue import WorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return WorkQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=2)
+
+
+class TestWorkQueue:
+    def test_lease_complete(self, queue):
+        queue.start_run("r1")
+        queue.enqueue("r1", [Lead(name="A"), Lead(name="B")])
+        lease = queue.lease("w1")
+        assert [l.name for l in lease.leads] == ["A", "B"]
+        assert lease.attempt == 1
+        assert queue.lease("w2") is None
+
+        lease.leads[0].status = "enriched"
+        assert queue.complete(lease, lease.leads, {"written": 2})
+        assert queue.is_finished("r1")
+        assert queue.progress("r1")["done"] == 1
+        assert [l.status for l in queue.preview("r1", 10)] == ["enriched", "new"]
+
+    def test_chunks_are_leased_in_order(self, queue):
+        queue.start_run("r1")
+        for name in "ABC":
+            queue.enqueue("r1", [Lead(name=name)])
+        names = [queue.lease("w").leads[0].name for _ in range(3)]
+        assert names == ["A", "B", "C"]
+
+    def test_expired_lease_is_reissued_and_fenced(self, tmp_path):
+        queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.05, max_attempts=3)
+        queue.start_run("r1")
+        queue.enqueue("r1", [Lead(name="A")])
+        stale = queue.lease("w1")
+        time.sleep(0.1)
+        fresh = queue.lease("w2")
+        assert fresh.chunk_id == stale.chunk_id
+        assert fresh.attempt == 2
+        # The worker that lost its lease can neither extend nor complete it
+        assert not queue.heartbeat(stale)
+        assert not queue.complete(stale, stale.leads, {})
+        assert queue.complete(fresh, fresh.leads, {})
+
+    def test_heartbeat_keeps_lease(self, tmp_path):
+        queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.2)
+        queue.start_run("r1")
+        queue.enqueue("r1", [Lead(name="A")])
+        lease = queue.lease("w1")
+        for _ in range(3):
+            time.sleep(0.1)
+            assert queue.heartbeat(lease)
+        assert queue.lease("w2") is None
+
+    def test_fail_retries_then_gives_up(self, queue):
+        queue.start_run("r1")
+        queue.enqueue("r1", [Lead(name="A")])
+        queue.fail(queue.lease("w1"), RuntimeError("boom"))
+        assert queue.progress("r1")["pending"] == 1
+        queue.fail(queue.lease("w1"), RuntimeError("boom"))
+        assert queue.progress("r1") == {"pending": 0, "leased": 0, "done": 0, "failed": 1}
+        assert queue.is_finished("r1")
+
+    def test_abandoned_chunk_without_attempts_left_fails(self, tmp_path):
+        queue = WorkQueue(tmp_path / "queue.db", lease_seconds=0.01, max_attempts=1)
+        queue.start_run("r1")
+        queue.enqueue("r1", [Lead(name="A")])
+        queue.lease("w1")
+        time.sleep(0.05)
+        assert queue.lease("w2") is None
+        assert queue.progress("r1")["failed"] == 1
+
+    def test_run_stats(self, queue):
+        queue.start_run("r1")
+        queue.set_run_stats("r1", fetched=5, unique=2)
+        queue.enqueue("r1", [Lead(name="A")])
+        lease = queue.lease("w1")
+        queue.complete(lease, lease.leads, {"written": 1})
+        coordinator, reports = queue.run_stats("r1")
+        assert coordinator["fetched"] == 5
+        assert coordinator["created_at"] > 0
+        assert reports == [{"written": 1}]
+
+    def test_shared_between_connections(self, tmp_path):
+        path = tmp_path / "queue.db"
+        WorkQueue(path).start_run("r1")
+        WorkQueue(path).enqueue("r1", [Lead(name="A")])
+        assert WorkQueue(path).lease("w1").leads[0].name == "A"
@@ -0,0 +1,95 @@
+"""Tests for coordinator/worker distributed runs."""
+
+import threading
+
+from leadflow.destinations.mock_writer import MockWriter
+from leadflow.destinations.slack_notifier import SlackNotifier
+from leadflow.pipeline import Pipeline
+from leadflow.processing.deduplicator import Deduplicator
+from leadflow.processing.enricher import Enricher
+from leadflow.sources.mock_source import MockSource
+from leadflow.work_queue import WorkQueue
+from leadflow.worker import Worker
+
+
+def _pipeline(config, enricher=None):
+    return Pipeline(
+        source=MockSource(),
+        deduplicator=Deduplicator(config),
+        enricher=enricher or Enricher(config),
+        writer=MockWriter(config),
+        notifier=SlackNotifier(config),
+        config=config,
+    )
+
+
+class FlakyEnricher(Enricher):
+    """Raises on the first call only."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    def enrich(self, leads):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("worker crashed")
+        return super().enrich(leads)
+
+
+class TestDistributedRun:
+    def test_matches_single_process_run(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        batch = _pipeline(mock_config).run().to_dict()
+
+        mock_config["distributed"] = {"chunk_size": 3}
+        queue = WorkQueue(tmp_path / "queue.db")
+        coordinator = _pipeline(mock_config)
+        queued = coordinator.enqueue(queue)
+        assert queue.progress(queued.run_id)["pending"] == 4  # 10 unique leads in chunks of 3
+
+        workers = [Worker(_pipeline(mock_config), queue, poll_seconds=0.01, drain=True) for _ in range(2)]
+        threads = [threading.Thread(target=w.run) for w in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        assert sum(w.chunks for w in workers) == 4
+        assert queue.is_finished(queued.run_id)
+
+        stats = coordinator.finish_distributed(queue, queued.run_id)
+        for key in ("fetched", "normalized", "unique", "duplicates", "enriched", "written", "notified"):
+            assert stats.to_dict()[key] == batch[key], key
+        assert stats.written_by_destination == {"mock": 10}
+        assert stats.metrics.stages["enrich"].calls == 4
+        assert stats.metrics.stages["dedup"].calls >= 1
+
+    def test_failed_chunk_is_retried(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["distributed"] = {"chunk_size": 100}
+        queue = WorkQueue(tmp_path / "queue.db", max_attempts=3)
+        queued = _pipeline(mock_config).enqueue(queue)
+
+        worker = Worker(_pipeline(mock_config, FlakyEnricher(mock_config)), queue, poll_seconds=0.01, drain=True)
+        worker.run()
+        assert worker.failures == 1
+        assert worker.chunks == 1
+        assert queue.progress(queued.run_id)["done"] == 1
+
+    def test_dry_run_coordinator_does_not_commit(self, mock_config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_config["dry_run"] = True
+        queue = WorkQueue(tmp_path / "queue.db")
+        pipeline = _pipeline(mock_config)
+        committed = []
+        pipeline._source.commit = lambda: committed.append(True)
+        queued = pipeline.enqueue(queue)
+        assert queued.unique == 10
+        assert committed == []
+
+    def test_worker_stops_when_asked(self, mock_config, tmp_path):
+        worker = Worker(_pipeline(mock_config), WorkQueue(tmp_path / "queue.db"), poll_seconds=0.01)
+        timer = threading.Timer(0.05, worker.stop)
+        timer.start()
+        worker.run()
+        assert worker.chunks == 0